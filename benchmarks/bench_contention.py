@@ -0,0 +1,85 @@
+"""
+Contention benchmark for ConcurrentRegistry.
+
+Runs the same number of eat and play updates with 1, 4 and 16 threads, either
+on separate cats (each thread owns its cats, so the threads never share a lock)
+or all on the same cat (every update waits for the same lock), and reports
+updates per second for each.
+
+Usage:
+    python -m benchmarks.bench_contention [--updates N] [--threads 1,4,16]
+        [--stripes N]
+"""
+
+import argparse
+import threading
+import time
+
+from cat_manager import events
+from cat_manager.cat import Cat
+from cat_manager.threadsafe import DEFAULT_STRIPES, ConcurrentRegistry
+
+
+def run(registry, names_per_thread, updates):
+    """
+    Runs ``updates`` eat/play updates split across one thread per list of names.
+    Returns:
+        float: The elapsed time in seconds.
+    """
+    per_thread = updates // len(names_per_thread)
+    start_line = threading.Barrier(len(names_per_thread) + 1)
+
+    def worker(names):
+        start_line.wait()
+        for step in range(per_thread):
+            name = names[step % len(names)]
+            if step & 1:
+                registry.play(name, 1)
+            else:
+                registry.eat(name, 1)
+
+    threads = [
+        threading.Thread(target=worker, args=(names,)) for names in names_per_thread
+    ]
+    for thread in threads:
+        thread.start()
+    start_line.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--updates", type=int, default=400_000)
+    parser.add_argument("--threads", default="1,4,16")
+    parser.add_argument("--stripes", type=int, default=DEFAULT_STRIPES)
+    args = parser.parse_args()
+
+    with events.use_sink(events.NullSink()):
+        for count in [int(threads) for threads in args.threads.split(",")]:
+            for scenario in ("separate cats", "same cat"):
+                names = [
+                    [f"cat-{thread}-{cat}" for cat in range(8)]
+                    for thread in range(count)
+                ]
+                if scenario == "same cat":
+                    names = [["shared"]] * count
+                registry = ConcurrentRegistry(
+                    (
+                        Cat(name, 3, "Gray", energy=50, hunger=50)
+                        for name in {name for group in names for name in group}
+                    ),
+                    stripes=args.stripes,
+                )
+                elapsed = run(registry, names, args.updates)
+                updates = sum(registry.snapshot()[name][2] for name in registry)
+                print(
+                    f"{count:>3} threads {scenario:<14} "
+                    f"{updates / elapsed:>12,.0f} updates/sec"
+                )
+
+
+if __name__ == "__main__":
+    main()
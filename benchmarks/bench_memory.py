@@ -0,0 +1,74 @@
+"""
+Memory benchmark: bytes per cat for a large shelter held in memory.
+
+Builds ``--count`` cats of each class (1,000,000 by default) and reports the
+memory traced by ``tracemalloc`` divided by the number of cats. The columnar
+``CatPopulation`` is measured too, for comparison.
+
+Usage:
+    python -m benchmarks.bench_memory [--count N]
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from cat_manager.cat import Cat, DomesticCat, WildCat
+
+
+def bytes_per_cat(build, count):
+    """
+    Returns the memory allocated by ``build(count)`` divided by ``count``.
+    """
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    shelter = build(count)
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del shelter
+    return used / count
+
+
+def build_cats(cat_class):
+    def build(count):
+        # Names and colors are shared strings, so only the cats themselves are measured.
+        return [
+            cat_class("Tom", 3, "Gray", energy=index % 101, hunger=index % 97)
+            for index in range(count)
+        ]
+
+    return build
+
+
+def build_population(count):
+    from cat_manager.population import CatPopulation
+
+    return CatPopulation(
+        ["Tom"] * count,
+        [3] * count,
+        ["Gray"] * count,
+        species=2,
+        energy=[index % 101 for index in range(count)],
+        hunger=[index % 97 for index in range(count)],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    for cat_class in (Cat, DomesticCat, WildCat):
+        size = bytes_per_cat(build_cats(cat_class), args.count)
+        print(f"{cat_class.__name__:<14} {size:8.1f} bytes/cat")
+    try:
+        size = bytes_per_cat(build_population, args.count)
+    except ImportError:
+        print("CatPopulation  skipped (NumPy is not installed)")
+    else:
+        print(f"{'CatPopulation':<14} {size:8.1f} bytes/cat")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Scaling benchmark for ShardedSimulation.
+
+Runs the same sharded simulation with 1, 2, 4, ... worker processes, up to the
+number of CPUs, and reports cat-rounds per second for each worker count.
+
+Usage:
+    python -m benchmarks.bench_parallel [--cats N] [--rounds N] [--shards N]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from cat_manager.cat import WildCat
+from cat_manager.parallel import ShardedSimulation
+from cat_manager.population import SPECIES, CatPopulation
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cats", type=int, default=4_000_000)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--shards", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    energy = rng.integers(0, 101, args.cats)
+    hunger = rng.integers(0, 101, args.cats)
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        # Every worker count starts from the same state: a run changes the cats.
+        population = CatPopulation(
+            [""] * args.cats,
+            np.zeros(args.cats),
+            [""] * args.cats,
+            species=SPECIES.index(WildCat),
+            energy=energy,
+            hunger=hunger,
+        )
+        with ShardedSimulation(
+            population, shards=args.shards, seed=1, workers=workers
+        ) as simulation:
+            start = time.perf_counter()
+            simulation.run(args.rounds)
+            elapsed = time.perf_counter() - start
+        rate = args.cats * args.rounds / elapsed
+        print(f"{workers:>3} workers {rate / 1e6:8.2f}M cat-rounds/sec")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
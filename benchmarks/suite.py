@@ -0,0 +1,253 @@
+"""
+Benchmark suite for every cat behavior, with JSON baselines.
+
+Each scenario is scripted and seeded, so runs are reproducible. For every
+scenario the suite reports operations per second (best of ``--repeat`` runs)
+and the memory allocated by one run, as traced by ``tracemalloc``.
+
+Results can be saved as a JSON baseline and later compared against it. A
+scenario that got slower, or allocates more, than the baseline by more than
+``--tolerance`` is reported as a regression and the suite exits with status 1.
+
+Usage:
+    python -m benchmarks.suite [--scales 1000,100000,10000000] [--only PATTERN]
+        [--save baseline.json] [--compare baseline.json] [--tolerance 0.25]
+"""
+
+import argparse
+import fnmatch
+import json
+import sys
+import time
+import tracemalloc
+
+from cat_manager import events, rng
+from cat_manager.cat import Cat, WildCat
+
+# Number of calls made by each scalar scenario.
+SCALAR_CALLS = 100_000
+
+# Population sizes of the population scenarios: 1K, 100K and 10M cats.
+DEFAULT_SCALES = (1_000, 100_000, 10_000_000)
+
+
+def scalar_scenarios():
+    """
+    Returns the scenarios that call one ``Cat`` or ``WildCat`` method repeatedly.
+    Each scenario is a ``(name, operations, setup)`` tuple, where ``setup()``
+    returns the function to time.
+    """
+
+    def method_loop(cat_class, method, args, energy=50, hunger=50):
+        def setup():
+            rng.seed(1)
+            cats = [
+                cat_class("Tom", 3, "Gray", energy=energy, hunger=hunger)
+                for _ in range(1000)
+            ]
+            calls = [getattr(cat, method) for cat in cats] * (SCALAR_CALLS // 1000)
+
+            def run():
+                for call in calls:
+                    call(*args)
+
+            return run
+
+        return setup
+
+    def reset_loop(cat_class, method, args, states=((50, 60),)):
+        # Eating, playing, hunting and resting change the state a lot, so each call
+        # starts from one of the given (energy, hunger) states in turn. They are
+        # chosen to run the clamping and the tired or hungry branches.
+        def setup():
+            rng.seed(1)
+            cat = cat_class("Shadow", 5, "Black")
+            call = getattr(cat, method)
+            starts = list(states) * (SCALAR_CALLS // len(states))
+
+            def run():
+                for energy, hunger in starts:
+                    cat.energy = energy
+                    cat.hunger = hunger
+                    call(*args)
+
+            return run
+
+        return setup
+
+    return [
+        ("Cat.eat", SCALAR_CALLS, reset_loop(Cat, "eat", (30,), ((50, 60), (90, 20)))),
+        (
+            "Cat.play",
+            SCALAR_CALLS,
+            reset_loop(Cat, "play", (20,), ((50, 50), (20, 50), (50, 80), (20, 90))),
+        ),
+        (
+            "Cat.sleep",
+            SCALAR_CALLS,
+            reset_loop(Cat, "sleep", (30,), ((40, 50), (90, 50))),
+        ),
+        ("Cat.meow", SCALAR_CALLS, method_loop(Cat, "meow", ())),
+        ("WildCat.hunt", SCALAR_CALLS, reset_loop(WildCat, "hunt", ())),
+        ("WildCat.rest", SCALAR_CALLS, reset_loop(WildCat, "rest", ())),
+        (
+            "WildCat.calculate_success",
+            SCALAR_CALLS,
+            method_loop(WildCat, "calculate_success", ("medium",)),
+        ),
+        (
+            "WildCat.determine_prey_size",
+            SCALAR_CALLS,
+            method_loop(WildCat, "determine_prey_size", ()),
+        ),
+    ]
+
+
+def population_scenarios(scales):
+    """
+    Returns the scenarios that apply one ``CatPopulation`` method to every cat,
+    for each population size in ``scales``.
+    """
+    try:
+        import numpy as np
+
+        from cat_manager.population import SPECIES, CatPopulation
+    except ImportError:
+        print("Skipping population scenarios: NumPy is not installed.", file=sys.stderr)
+        return []
+
+    def population_call(size, method, *args):
+        def setup():
+            generator = np.random.default_rng(1)
+            population = CatPopulation(
+                [""] * size,
+                np.zeros(size),
+                [""] * size,
+                species=SPECIES.index(WildCat),
+                energy=generator.integers(0, 100, size),
+                hunger=generator.integers(0, 101, size),
+            )
+            call = getattr(population, method)
+            if method == "hunt":
+                return lambda: call(generator)
+            return lambda: call(*args)
+
+        return setup
+
+    scenarios = []
+    for size in scales:
+        scenarios += [
+            (f"CatPopulation.eat[{size}]", size, population_call(size, "eat", 0)),
+            (f"CatPopulation.play[{size}]", size, population_call(size, "play", 0)),
+            (f"CatPopulation.sleep[{size}]", size, population_call(size, "sleep", 0)),
+            (f"CatPopulation.meow[{size}]", size, population_call(size, "meow")),
+            (f"CatPopulation.hunt[{size}]", size, population_call(size, "hunt")),
+        ]
+    return scenarios
+
+
+def measure(operations, setup, repeat):
+    """
+    Times a scenario and traces the memory allocated by one run of it.
+    Returns:
+        dict: ``ops_per_sec``, ``alloc_bytes`` (peak traced memory during one run)
+        and ``alloc_blocks`` (memory blocks still allocated after it).
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        run = setup()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    run = setup()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    run()
+    after = tracemalloc.take_snapshot()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    return {
+        "ops_per_sec": operations / best,
+        "alloc_bytes": peak,
+        "alloc_blocks": max(blocks, 0),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    Compares results against a baseline.
+    Returns:
+        list[str]: One message per regression.
+    """
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        if result["ops_per_sec"] < expected["ops_per_sec"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {result['ops_per_sec']:,.0f} ops/sec, "
+                f"baseline {expected['ops_per_sec']:,.0f} ops/sec"
+            )
+        # Small allocations are noise; only flag growth beyond one page.
+        allowed = expected["alloc_bytes"] * (1 + tolerance) + 4096
+        if result["alloc_bytes"] > allowed:
+            regressions.append(
+                f"{name}: allocates {result['alloc_bytes']:,} bytes, "
+                f"baseline {expected['alloc_bytes']:,} bytes"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scales",
+        default=",".join(map(str, DEFAULT_SCALES)),
+        help="comma-separated population sizes",
+    )
+    parser.add_argument("--only", help="run only scenarios matching this glob")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="compare against this JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    scales = [int(scale) for scale in args.scales.split(",") if scale]
+    scenarios = scalar_scenarios() + population_scenarios(scales)
+    if args.only:
+        scenarios = [
+            scenario
+            for scenario in scenarios
+            if fnmatch.fnmatch(scenario[0], args.only)
+        ]
+
+    results = {}
+    with events.use_sink(events.NullSink()):
+        for name, operations, setup in scenarios:
+            results[name] = measure(operations, setup, args.repeat)
+            result = results[name]
+            print(
+                f"{name:<36} {result['ops_per_sec']:>16,.0f} ops/sec "
+                f"{result['alloc_bytes']:>14,} bytes"
+            )
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as file:
+            json.dump({"scenarios": results}, file, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            baseline = json.load(file)["scenarios"]
+        regressions = compare(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,3 @@
+from cat_manager.cli import main
+
+main()
@@ -1,4 +1,96 @@
-from random import randint
+from math import floor
+
+from cat_manager import events
+from cat_manager.rng import CatStream, next_stream_id
+
+
+def _level(value):
+    """
+    Rounds a state value half up to an integer and clamps it between 0 and 100.
+    """
+    return max(0, min(floor(value + 0.5), 100))
+
+
+def _scaled(time, numerator, denominator):
+    """
+    Returns time * numerator / denominator rounded half up to an integer.
+    """
+    return (2 * time * numerator + denominator) // (2 * denominator)
+
+
+class HuntTable:
+    """
+    Precomputed hunt decisions of a wild cat class for every (energy, hunger) state.
+
+    ``determine_prey_size`` and ``calculate_success`` only depend on the integer
+    energy and hunger of the cat, so both are evaluated once for each of the
+    101 x 101 states and looked up by ``index(energy, hunger)`` afterwards.
+
+    Attributes:
+        prey_rule (Callable): The ``determine_prey_size`` the table was built from.
+        success_rule (Callable): The ``calculate_success`` the table was built from.
+        prey (list[str]): The prey size of every state.
+        success (list[int]): The success chance of every state, for its prey size.
+    """
+
+    __slots__ = ("prey_rule", "success_rule", "prey", "success", "arrays")
+
+    # Number of energy or hunger levels, 0 to 100.
+    LEVELS = 101
+
+    def __init__(self, cat_class):
+        """
+        Builds the table by calling the rules of the class on every state.
+        Args:
+            cat_class (type): The WildCat class (or subclass) whose rules are used.
+        """
+        self.prey_rule = cat_class.determine_prey_size
+        self.success_rule = cat_class.calculate_success
+
+        probe = cat_class.__new__(cat_class)
+        self.prey = []
+        self.success = []
+        for energy in range(self.LEVELS):
+            probe._energy = energy
+            for hunger in range(self.LEVELS):
+                probe._hunger = hunger
+                prey_size = self.prey_rule(probe)
+                self.prey.append(prey_size)
+                self.success.append(self.success_rule(probe, prey_size))
+        # Free slot for other engines to cache their own form of the table.
+        self.arrays = None
+
+    @classmethod
+    def index(cls, energy, hunger):
+        """
+        Returns the position of an (energy, hunger) state in the table.
+        """
+        return energy * cls.LEVELS + hunger
+
+    def is_current(self, cat_class):
+        """
+        Returns True if the class still uses the rules the table was built from.
+        """
+        return (
+            cat_class.determine_prey_size is self.prey_rule
+            and cat_class.calculate_success is self.success_rule
+        )
+
+
+# Hunt tables by wild cat class, built on first use.
+_hunt_tables = {}
+
+
+class _Observers(list):
+    """
+    Calls several observers of one cat, in the order they were registered.
+    """
+
+    __slots__ = ()
+
+    def __call__(self, *args):
+        for observer in self:
+            observer(*args)
 
 
 class Cat:
@@ -16,17 +108,41 @@ class Cat:
         hunger (int): The cat's hunger level (0 to 100, default is 0).
 
     Methods:
-        meow(): Prints a meowing sound based on the cat's hunger level.
+        meow(): Emits a meowing sound based on the cat's hunger level.
         eat(food: int): Feeds the cat and adjusts hunger and energy levels.
         play(time: int): Allows the cat to play, reducing energy and increasing hunger.
         sleep(time: int): Makes the cat sleep, increasing energy.
+        fast_forward(schedule, repetitions): Applies a schedule of calls many times.
+        watch(observer): Registers a callable notified after every state change.
+        unwatch(observer): Removes an observer registered with watch.
 
     Behavior Rules:
         - The cat's energy and hunger levels are always kept within 0 to 100.
+        - Energy and hunger are always integers, so each one fits in a byte. Any
+          fractional value is rounded half up (e.g. playing 7 minutes while tired
+          costs round(10.5) = 11 energy).
         - Eating decreases hunger and increases energy.
         - Playing decreases energy and increases hunger, with penalties if the cat is too tired or hungry.
         - Sleeping increases energy but only if the cat isn't already at full energy.
-        - The cat's meow changes based on its hunger level."""
+        - The cat's meow changes based on its hunger level.
+        - Messages are emitted as events into ``cat_manager.events.sink``, which
+          prints them to the console by default.
+        - Every state change made by eat, play, sleep, rest and process_hunt_result
+          calls the cat's observers with ``(cat, action, old_energy, old_hunger,
+          detail)``, where detail is the food or time, or ``(prey_size, success)``
+          for hunts. Direct assignments to energy or hunger are not observed."""
+
+    # Meowing sounds by hunger band: not hungry, satisfied, hungry, very hungry.
+    MEOW_SOUNDS = (
+        "Purr... Meow! \U0001f63b",
+        "Meow! \U0001f63a",
+        "Meow... \U0001f63f",
+        "MEOOOOOW!! \U0001f63e",
+    )
+
+    # Slots keep cats free of a per-instance ``__dict__``, which is most of the
+    # memory of a large shelter.
+    __slots__ = ("name", "age", "color", "_energy", "_hunger", "_observer")
 
     def __init__(self, name: str, age: int, color: str, energy=100, hunger=0):
         """
@@ -47,14 +163,72 @@ class Cat:
         self.name = name
         self.age = age
         self.color = color
-        self.energy = max(0, min(energy, 100))
-        self.hunger = max(0, min(hunger, 100))
+        self.energy = energy
+        self.hunger = hunger
+        self._observer = None
+
+    @property
+    def energy(self):
+        """
+        The cat's energy level, an integer between 0 and 100.
+        Assigned values are rounded half up and clamped to that range.
+        """
+        return self._energy
+
+    @energy.setter
+    def energy(self, value):
+        self._energy = _level(value)
+
+    @property
+    def hunger(self):
+        """
+        The cat's hunger level, an integer between 0 and 100.
+        Assigned values are rounded half up and clamped to that range.
+        """
+        return self._hunger
+
+    @hunger.setter
+    def hunger(self, value):
+        self._hunger = _level(value)
+
+    def watch(self, observer):
+        """
+        Registers an observer notified after every state change of the cat.
+        Args:
+            observer (Callable): Called as ``observer(cat, action, old_energy,
+                old_hunger, detail)`` after eat, play, sleep, rest and
+                process_hunt_result change the cat. ``action`` is "eat", "play",
+                "sleep", "rest", "hunt" or "fast_forward".
+        """
+        current = self._observer
+        if current is None:
+            self._observer = observer
+        elif isinstance(current, _Observers):
+            current.append(observer)
+        else:
+            self._observer = _Observers([current, observer])
+
+    def unwatch(self, observer):
+        """
+        Removes an observer registered with ``watch``.
+        Raises:
+            ValueError: If the observer is not registered.
+        """
+        current = self._observer
+        if isinstance(current, _Observers):
+            current.remove(observer)
+            if len(current) == 1:
+                self._observer = current[0]
+        elif current is not None and current == observer:
+            self._observer = None
+        else:
+            raise ValueError("The observer is not watching this cat.")
 
     def meow(self):
         """
         Simulates the cat's meowing behavior based on its hunger level.
-        The method prints different meowing sounds and corresponding emoji
-        depending on the cat's hunger level:
+        The method emits a "meow" event with the hunger band, which the console
+        sink prints as the matching sound from ``MEOW_SOUNDS``:
         - Hunger < 20: Not hungry, purring and happy.
         - Hunger < 50: Satisfied, normal meow.
         - Hunger < 80: Hungry, slightly sad meow.
@@ -63,13 +237,13 @@ class Cat:
             hunger (int): The current hunger level of the cat.
         """
         if self.hunger < 20:  # Not hungry
-            print("Purr... Meow! \U0001f63b")
+            events.sink.emit("meow", self, 0)
         elif self.hunger < 50:  # Satisfied
-            print("Meow! \U0001f63a")
+            events.sink.emit("meow", self, 1)
         elif self.hunger < 80:  # Hungry
-            print("Meow... \U0001f63f")
+            events.sink.emit("meow", self, 2)
         else:
-            print("MEOOOOOW!! \U0001f63e")  # Very hungry and irritated
+            events.sink.emit("meow", self, 3)  # Very hungry and irritated
 
     def eat(self, food: int):
         """
@@ -83,8 +257,16 @@ class Cat:
             - Increases the cat's energy level by the food amount, but not above 100.
         """
         if 0 <= food <= 100:
-            self.hunger = max(self.hunger - food, 0)
-            self.energy = min(self.energy + food, 100)
+            energy, hunger = self._energy, self._hunger
+            new_hunger = hunger - food
+            new_energy = energy + food
+            if new_hunger.__class__ is not int:
+                new_hunger = floor(new_hunger + 0.5)
+                new_energy = floor(new_energy + 0.5)
+            self._hunger = new_hunger if new_hunger > 0 else 0
+            self._energy = new_energy if new_energy < 100 else 100
+            if self._observer is not None:
+                self._observer(self, "eat", energy, hunger, food)
         else:
             raise ValueError(
                 f"Invalid food level: {food}. The level should be between 0 and 100."
@@ -99,29 +281,39 @@ class Cat:
         Raises:
             ValueError: If the provided time is not within the range of 0 to 100.
         Behavior:
-            - If the cat's energy is 30 or below, energy depletes faster (1.5x the time).
-              A message is printed indicating the cat is too tired to play much.
+            - If the cat's energy is 30 or below, energy depletes faster (1.5x the time,
+              rounded half up).
+              A "tired_play" event is emitted.
             - Otherwise, energy decreases by the amount of time spent playing.
-            - If the cat's hunger is 70 or above, hunger increases faster (1.2x the time).
-              A message is printed indicating the cat is very hungry while playing.
+            - If the cat's hunger is 70 or above, hunger increases faster (1.2x the time,
+              rounded half up).
+              A "hungry_play" event is emitted.
             - Otherwise, hunger increases by the amount of time spent playing.
             - Energy and hunger levels are clamped between 0 and 100.
+            - Energy and hunger stay integers (see the class rounding rule).
         """
         if 0 <= time <= 100:
-            if self.energy <= 30:
-                print(
-                    f"{self.name.title()} is too tired to play much, energy depletes faster."
-                )
-                self.energy = max(self.energy - (time * 1.5), 0)
+            energy, hunger = self._energy, self._hunger
+            if energy <= 30:
+                events.sink.emit("tired_play", self)
+                new_energy = energy - _scaled(time, 3, 2)
             else:
-                self.energy = max(self.energy - time, 0)
+                new_energy = energy - time
 
-            if self.hunger >= 70:
-                print(f"{self.name.title()} is playing but is very hungry!")
-                self.hunger = min(self.hunger + (time * 1.2), 100)
+            if hunger >= 70:
+                events.sink.emit("hungry_play", self)
+                new_hunger = hunger + _scaled(time, 6, 5)
             else:
-                self.hunger = min(self.hunger + time, 100)
+                new_hunger = hunger + time
+
+            if new_energy.__class__ is not int or new_hunger.__class__ is not int:
+                new_energy = floor(new_energy + 0.5)
+                new_hunger = floor(new_hunger + 0.5)
+            self._energy = new_energy if new_energy > 0 else 0
+            self._hunger = new_hunger if new_hunger < 100 else 100
 
+            if self._observer is not None:
+                self._observer(self, "play", energy, hunger, time)
         else:
             raise ValueError(
                 "Invalid time level. The time should be between 0 and 100 minutes."
@@ -138,9 +330,15 @@ class Cat:
         Notes:
             The cat's energy level will not exceed 100, even if the time provided would result in a higher value.
         """
-        if self.energy < 100:
+        energy = self._energy
+        if energy < 100:
             if 0 <= time <= 100:
-                self.energy = min(self.energy + time, 100)
+                new_energy = energy + time
+                if new_energy.__class__ is not int:
+                    new_energy = floor(new_energy + 0.5)
+                self._energy = new_energy if new_energy < 100 else 100
+                if self._observer is not None:
+                    self._observer(self, "sleep", energy, self._hunger, time)
             else:
                 raise ValueError(
                     f"Invalid time level: {time}. The time should be between 0 and 100 minutes."
@@ -148,6 +346,61 @@ class Cat:
         else:
             raise ValueError("The cat is too energetic to sleep now.")
 
+    def fast_forward(self, schedule, repetitions):
+        """
+        Applies a schedule of eat, play and sleep calls many times over.
+        The result is exactly the state reached by calling the methods in a loop,
+        but it is found in time proportional to the number of distinct states the
+        cat goes through, not to ``repetitions``. The schedule only depends on the
+        integer energy and hunger of the cat, so as soon as a state repeats the
+        rest of the run follows the same cycle and is skipped arithmetically.
+        Args:
+            schedule (Iterable[tuple[str, int]]): The ``(action, amount)`` calls of
+                one repetition, such as ``[("play", 20), ("eat", 10)]``.
+            repetitions (int): The number of times to apply the schedule.
+        Raises:
+            ValueError: If an action is not "eat", "play" or "sleep".
+            ValueError: Whatever a call of the loop would raise, such as sleeping at
+                full energy. The cat is left in the state reached just before that
+                call, as it would be after the loop.
+        Notes:
+            No events are emitted for the skipped calls. Observers are notified once,
+            with the action "fast_forward" and ``(schedule, repetitions)`` as detail.
+        """
+        schedule = tuple(schedule)
+        for action, _ in schedule:
+            if action not in ("eat", "play", "sleep"):
+                raise ValueError(
+                    f"Cannot fast-forward {action}, only eat, play and sleep."
+                )
+
+        probe = type(self).__new__(type(self))
+        probe._observer = None
+        probe._energy, probe._hunger = energy, hunger = self._energy, self._hunger
+        states = [(energy, hunger)]
+        first_seen = {states[0]: 0}
+        try:
+            with events.use_sink(events.NullSink()):
+                while len(states) <= repetitions:
+                    for action, amount in schedule:
+                        getattr(probe, action)(amount)
+                    state = (probe._energy, probe._hunger)
+                    start = first_seen.setdefault(state, len(states))
+                    states.append(state)
+                    if start < len(states) - 1:
+                        # The states from ``start`` on repeat forever.
+                        cycle = len(states) - 1 - start
+                        probe._energy, probe._hunger = states[
+                            start + (repetitions - start) % cycle
+                        ]
+                        break
+        finally:
+            self._energy, self._hunger = probe._energy, probe._hunger
+            if self._observer is not None and repetitions > 0:
+                self._observer(
+                    self, "fast_forward", energy, hunger, (schedule, repetitions)
+                )
+
 
 class DomesticCat(Cat):
     """
@@ -163,6 +416,8 @@ class DomesticCat(Cat):
             against the user's leg and purring.
     """
 
+    __slots__ = ()
+
     def __init__(self, name: str, age: int, color: str, energy=100, hunger=0):
         """
         Initialize the Cat parent class with the given attributes.
@@ -178,15 +433,35 @@ class DomesticCat(Cat):
     def ask_for_affection(self):
         """
         Displays a message indicating that the cat is seeking affection.
-        This method prints a message describing the cat's behavior of rubbing
-        against the user's leg and purring to request attention and affection.
+        This method emits an "affection" event describing the cat's behavior of
+        rubbing against the user's leg and purring to request attention and affection.
         """
-        print(f"{self.name} rubs against your leg and purrs, asking for affection.")
+        events.sink.emit("affection", self)
 
 
 class WildCat(Cat):
 
-    def __init__(self, name: str, age: int, color: str, energy=100, hunger=0):
+    # Random ranges applied by ``process_hunt_result`` after a successful hunt.
+    ENERGY_GAIN = {"large": (20, 40), "medium": (10, 30), "small": (5, 20)}
+    HUNGER_REDUCTION = {"large": (30, 50), "medium": (20, 40), "small": (10, 30)}
+    # Random range of energy regained by ``rest``.
+    REST_GAIN = (30, 50)
+    # Energy lost by ``process_hunt_result`` after a failed hunt.
+    FAILED_HUNT_COST = 10
+
+    # Meowing sounds by hunger band: playful, content, irritated, aggressive.
+    MEOW_SOUNDS = (
+        "Grrrrrrrrrrhhhhh! \U0001f63a",
+        "MRAAAAHHHRR! \U0001f63c",
+        "HSSSSSSS!!! \U0001f63f",
+        "RRAAAUUUGGHHH!! \U0001f63e",
+    )
+
+    __slots__ = ("_rng", "_stream_id")
+
+    def __init__(
+        self, name: str, age: int, color: str, energy=100, hunger=0, stream_id=None
+    ):
         """
         Initialize a Cat instance with the given attributes.
         Args:
@@ -195,66 +470,107 @@ class WildCat(Cat):
             color (str): The color of the cat's fur.
             energy (int, optional): The energy level of the cat. Defaults to 100.
             hunger (int, optional): The hunger level of the cat. Defaults to 0.
+            stream_id (int | str, optional): The id of the cat's random stream.
+                Defaults to a new id from ``rng.next_stream_id``.
         """
         super().__init__(name, age, color, energy, hunger)
+        self._rng = None
+        self._stream_id = next_stream_id() if stream_id is None else stream_id
+
+    @property
+    def rng(self):
+        """
+        The random stream of the cat's rests and hunts.
+        Defaults to a ``CatStream`` keyed by the cat's stream id under the global
+        seed (see ``rng.seed``), created on first use, so cats with the same name
+        draw different numbers. Any object with a ``randint(low, high)`` method can
+        be assigned, for example a ``CatStream`` with an explicit seed and counter
+        to replay the cat.
+        """
+        if self._rng is None:
+            self._rng = CatStream(self._stream_id)
+        return self._rng
+
+    @rng.setter
+    def rng(self, stream):
+        self._rng = stream
 
     def meow(self):
         """
         Simulates the cat's meowing behavior based on its hunger level.
-        The method prints different meowing sounds and corresponding emojis
-        depending on the cat's hunger level:
+        The method emits a "meow" event with the hunger band, which the console
+        sink prints as the matching sound from ``MEOW_SOUNDS``:
         - Hunger < 20: Not hungry, emits a playful meow.
         - Hunger < 50: Satisfied, emits a content meow.
         - Hunger < 80: Hungry, emits an irritated hiss.
         - Hunger >= 80: Very hungry and irritated, emits an aggressive growl.
         """
         if self.hunger < 20:  # Not hungry
-            print("Grrrrrrrrrrhhhhh! \U0001f63a")
+            events.sink.emit("meow", self, 0)
         elif self.hunger < 50:  # Satisfied
-            print("MRAAAAHHHRR! \U0001f63c")
+            events.sink.emit("meow", self, 1)
         elif self.hunger < 80:  # Hungry
-            print("HSSSSSSS!!! \U0001f63f")
+            events.sink.emit("meow", self, 2)
         else:
-            print("RRAAAUUUGGHHH!! \U0001f63e")  # Very hungry and irritated
+            events.sink.emit("meow", self, 3)  # Very hungry and irritated
 
     def rest(self):
         """
         Allows the cat to rest and regain energy.
         This method simulates the cat taking a rest to recover energy.
-        It increases the cat's energy level by a random amount between 30 and 50.
+        It increases the cat's energy level by a random amount between 30 and 50,
+        but not above 100.
         Returns:
             None
         """
-        print(f"{self.name.title()} is resting to regain energy.")
-        self.energy += randint(30, 50)
+        events.sink.emit("rest", self)
+        energy = self._energy
+        self.energy += self.rng.randint(*self.REST_GAIN)
+        if self._observer is not None:
+            self._observer(self, "rest", energy, self._hunger, None)
+
+    @classmethod
+    def hunt_table(cls):
+        """
+        Returns the precomputed hunt decisions of the class.
+        The table is built on first use, and rebuilt whenever ``determine_prey_size``
+        or ``calculate_success`` is overridden or replaced, so every subclass keeps
+        its own rules.
+        Returns:
+            HuntTable: The table of the class.
+        """
+        table = _hunt_tables.get(cls)
+        if table is None or not table.is_current(cls):
+            table = _hunt_tables[cls] = HuntTable(cls)
+        return table
 
     def hunt(self):
 
         if not self.can_hunt():
             return
 
-        prey_size = self.determine_prey_size()
-        print(f"{self.name.title()} is hunting a {prey_size} prey.")
+        table = self.hunt_table()
+        index = self._energy * HuntTable.LEVELS + self._hunger
+        prey_size = table.prey[index]
+        events.sink.emit("hunt", self, prey_size)
 
-        success = self.calculate_success(prey_size)
-        if randint(1, 100) <= success:
-            print(f"{self.name.title()} successfully caught the {prey_size} prey!")
+        success = table.success[index]
+        if self.rng.randint(1, 100) <= success:
+            events.sink.emit("hunt_caught", self, prey_size)
             self.process_hunt_result(prey_size, success=True)
         else:
-            print(f"{self.name.title()} failed to catch the {prey_size} prey.")
+            events.sink.emit("hunt_failed", self, prey_size)
             self.process_hunt_result(prey_size, success=False)
 
     def can_hunt(self):
 
         if self.hunger == 100 and self.energy == 0:
-            print(
-                f"{self.name.title()} is exhausted and hungry, so it won't be able to hunt."
-            )
+            events.sink.emit("exhausted", self)
             self.rest()
             return False
 
         if self.hunger == 0:
-            print(f"{self.name.title()} is not hungry, so it won't hunt.")
+            events.sink.emit("not_hungry", self)
             return False
         return True
 
@@ -286,14 +602,12 @@ class WildCat(Cat):
 
     def process_hunt_result(self, prey_size, success):
 
+        energy, hunger = self._energy, self._hunger
         if success:
-            energy_gain = {"large": (20, 40), "medium": (10, 30), "small": (5, 20)}
-            hunger_reduction = {
-                "large": (30, 50),
-                "medium": (20, 40),
-                "small": (10, 30),
-            }
-            self.energy += randint(*energy_gain[prey_size])
-            self.hunger -= randint(*hunger_reduction[prey_size])
+            rng = self.rng
+            self.energy += rng.randint(*self.ENERGY_GAIN[prey_size])
+            self.hunger -= rng.randint(*self.HUNGER_REDUCTION[prey_size])
         else:
-            self.energy -= 10
+            self.energy -= self.FAILED_HUNT_COST
+        if self._observer is not None:
+            self._observer(self, "hunt", energy, hunger, (prey_size, success))
@@ -0,0 +1,294 @@
+"""
+Runs cat simulations from the command line and streams summaries as JSON Lines.
+
+A run creates a population (or loads it from a ``CatStore`` database), applies
+a policy of actions to every cat for a number of rounds and writes one JSON
+summary line every ``--every`` rounds:
+
+    {"round": 10, "cats": 1000,
+     "energy": {"mean": 61.2, "p10": 20, "p50": 64, "p90": 100},
+     "hunger": {...}, "hunts": {"caught": 120, "failed": 98}, "rests": 3}
+
+Hunt and rest counts are totals since the start of the run. Memory does not grow
+with the number of rounds: summaries are built from 101-bin histograms.
+
+Usage:
+    python -m cat_manager [--cats N] [--species cat,domestic,wild]
+        [--energy E] [--hunger H] [--store PATH] [--rounds N]
+        [--policy play:10,hunt,eat:10,sleep:10] [--every K]
+        [--engine scalar|numpy|parallel] [--workers N] [--seed S] [--output PATH]
+
+The scalar engine runs ``Cat`` objects and does not import NumPy. NumPy and the
+process pool are imported only when the numpy or parallel engine is selected, so
+short runs start fast.
+"""
+
+import argparse
+import json
+import sys
+from contextlib import nullcontext
+
+from cat_manager import events, rng
+from cat_manager.cat import Cat, DomesticCat, WildCat
+from cat_manager.stats import PopulationStats, histogram_percentile
+
+# Species names accepted by ``--species``.
+SPECIES_NAMES = ("cat", "domestic", "wild")
+
+# Actions accepted by ``--policy``; the others take an amount, as in "eat:10".
+POLICY_ACTIONS = ("eat", "play", "sleep", "hunt", "rest")
+
+# Simulation engines accepted by ``--engine``.
+ENGINES = ("scalar", "numpy", "parallel")
+
+# Percentiles reported for energy and hunger.
+SUMMARY_PERCENTILES = (10, 50, 90)
+
+
+def parse_policy(text):
+    """
+    Parses a policy such as "play:10,hunt,eat:10,sleep:10".
+    Returns:
+        list[tuple[str, int | None]]: The actions and their amounts, in order.
+    Raises:
+        ValueError: If an action is unknown, or its amount is missing or not
+            between 0 and 100.
+    """
+    policy = []
+    for step in text.split(","):
+        action, _, amount = step.strip().partition(":")
+        if action not in POLICY_ACTIONS:
+            raise ValueError(f"Unknown action: {action}.")
+        if action in ("hunt", "rest"):
+            if amount:
+                raise ValueError(f"{action} does not take an amount.")
+            policy.append((action, None))
+            continue
+        if not amount.isdigit() or not 0 <= int(amount) <= 100:
+            raise ValueError(
+                f"Invalid amount for {action}: {amount!r}. "
+                "It should be between 0 and 100."
+            )
+        policy.append((action, int(amount)))
+    return policy
+
+
+def summary(round_number, energy_histogram, hunger_histogram, caught, failed, rests):
+    """
+    Builds one summary line from the energy and hunger histograms of the cats.
+    Returns:
+        dict: The JSON-ready summary.
+    """
+    cats = sum(energy_histogram)
+    line = {"round": round_number, "cats": cats}
+    for metric, histogram in (
+        ("energy", energy_histogram),
+        ("hunger", hunger_histogram),
+    ):
+        total = sum(level * count for level, count in enumerate(histogram))
+        line[metric] = {"mean": round(total / cats, 3) if cats else None}
+        for percent in SUMMARY_PERCENTILES:
+            line[metric][f"p{percent}"] = (
+                histogram_percentile(histogram, percent) if cats else None
+            )
+    line["hunts"] = {"caught": caught, "failed": failed}
+    line["rests"] = rests
+    return line
+
+
+def _make_cats(args):
+    classes = dict(zip(SPECIES_NAMES, (Cat, DomesticCat, WildCat)))
+    species = [classes[name] for name in args.species.split(",")]
+    return [
+        species[index % len(species)](
+            f"cat-{index}", 1, "Gray", energy=args.energy, hunger=args.hunger
+        )
+        for index in range(args.cats)
+    ]
+
+
+def _run_scalar(cats, args, emit):
+    if args.seed is not None:
+        rng.seed(args.seed)
+    stats = PopulationStats(cats)
+    hunts = {"caught": 0, "failed": 0}
+
+    def count_hunt(cat, action, old_energy, old_hunger, detail):
+        if action == "hunt":
+            hunts["caught" if detail[1] else "failed"] += 1
+
+    for cat in cats:
+        cat.watch(count_hunt)
+    with events.use_sink(events.NullSink()):
+        for round_number in range(1, args.rounds + 1):
+            for cat in cats:
+                for action, amount in args.policy:
+                    if amount is not None:
+                        try:
+                            getattr(cat, action)(amount)
+                        except ValueError:
+                            pass
+                    elif isinstance(cat, WildCat):
+                        getattr(cat, action)()
+            if round_number % args.every == 0 or round_number == args.rounds:
+                emit(
+                    summary(
+                        round_number,
+                        stats.histogram("energy"),
+                        stats.histogram("hunger"),
+                        hunts["caught"],
+                        hunts["failed"],
+                        stats.rests,
+                    )
+                )
+    for cat in cats:
+        cat.unwatch(count_hunt)
+        stats.remove(cat)
+    return [(cat.energy, cat.hunger) for cat in cats]
+
+
+def _run_vectorized(cats, args, emit):
+    import numpy as np
+
+    from cat_manager import population as engine
+
+    population = engine.CatPopulation.from_cats(cats)
+    energy, hunger = population.energy, population.hunger
+    counts = np.zeros(4, dtype=np.int64)
+
+    def emit_summary(round_number):
+        emit(
+            summary(
+                round_number,
+                np.bincount(energy, minlength=101).tolist(),
+                np.bincount(hunger, minlength=101).tolist(),
+                int(counts[engine.HUNT_CAUGHT]),
+                int(counts[engine.HUNT_FAILED]),
+                int(counts[engine.HUNT_RESTED]),
+            )
+        )
+
+    if args.engine == "parallel":
+        from cat_manager.parallel import ShardedSimulation
+
+        amounts = dict(args.policy)
+        with ShardedSimulation(population, seed=args.seed, workers=args.workers) as sim:
+            done = 0
+            while done < args.rounds:
+                rounds = min(args.every, args.rounds - done)
+                counts += sim.run(
+                    rounds,
+                    food=amounts["eat"],
+                    play=amounts["play"],
+                    sleep=amounts["sleep"],
+                )
+                done += rounds
+                emit_summary(done)
+    else:
+        streams = engine.StreamBank(range(len(population)), args.seed)
+        for round_number in range(1, args.rounds + 1):
+            for action, amount in args.policy:
+                if action == "eat":
+                    engine.eat_round(energy, hunger, amount)
+                elif action == "play":
+                    engine.play_round(energy, hunger, amount)
+                elif action == "sleep":
+                    engine.sleep_round(energy, amount)
+                else:
+                    outcome, _ = population.hunt(streams)
+                    counts += np.bincount(outcome, minlength=4)
+            if round_number % args.every == 0 or round_number == args.rounds:
+                emit_summary(round_number)
+    return list(zip(energy.tolist(), hunger.tolist()))
+
+
+def build_parser():
+    """
+    Returns the argument parser of the command line.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m cat_manager", description=__doc__.splitlines()[1]
+    )
+    parser.add_argument("--cats", type=int, default=1000, help="cats to create")
+    parser.add_argument(
+        "--species", default="wild", help="comma-separated species, assigned in turn"
+    )
+    parser.add_argument("--energy", type=int, default=100)
+    parser.add_argument("--hunger", type=int, default=0)
+    parser.add_argument(
+        "--store", help="CatStore database to load the cats from and save them to"
+    )
+    parser.add_argument("--rounds", type=int, default=100)
+    parser.add_argument("--policy", default="play:10,hunt,eat:10,sleep:10")
+    parser.add_argument("--every", type=int, default=10, help="rounds per summary")
+    parser.add_argument("--engine", choices=ENGINES, default="scalar")
+    parser.add_argument("--workers", type=int, help="worker processes (parallel)")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output", help="file to write the summaries to")
+    return parser
+
+
+def main(argv=None):
+    """
+    Runs the command line with the given arguments (defaults to ``sys.argv``).
+    """
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        args.policy = parse_policy(args.policy)
+    except ValueError as error:
+        parser.error(str(error))
+    if any(name not in SPECIES_NAMES for name in args.species.split(",")):
+        parser.error(f"--species must list names from {', '.join(SPECIES_NAMES)}.")
+    if args.every < 1 or args.rounds < 0 or args.cats < 0:
+        parser.error("--every must be positive, --rounds and --cats not negative.")
+    if args.engine != "scalar" and "rest" in dict(args.policy):
+        parser.error(f"The {args.engine} engine cannot rest; use hunt instead.")
+    if args.engine == "parallel" and [action for action, _ in args.policy] != [
+        "play",
+        "hunt",
+        "eat",
+        "sleep",
+    ]:
+        parser.error("The parallel engine runs play:P,hunt,eat:F,sleep:S rounds only.")
+
+    store = None
+    if args.store:
+        from cat_manager.store import CatStore
+
+        store = CatStore(args.store)
+        names = list(store)
+        # Keep every cat of the run cached, so none is evicted and unwatched.
+        store.capacity = max(store.capacity, len(names), args.cats)
+        if names:
+            cats = [store.get(name) for name in names]
+        else:
+            cats = _make_cats(args)
+            for cat in cats:
+                store.add(cat)
+            store.flush()
+    else:
+        cats = _make_cats(args)
+
+    output = (
+        open(args.output, "w", encoding="utf-8")
+        if args.output
+        else nullcontext(sys.stdout)
+    )
+    with output as stream:
+
+        def emit(line):
+            stream.write(json.dumps(line) + "\n")
+            stream.flush()
+
+        if args.engine == "scalar":
+            levels = _run_scalar(cats, args, emit)
+        else:
+            levels = _run_vectorized(cats, args, emit)
+
+    if store is not None:
+        for cat, (energy, hunger) in zip(cats, levels):
+            if (cat.energy, cat.hunger) != (energy, hunger):
+                cat.energy, cat.hunger = energy, hunger
+                store.mark_dirty(cat)
+        store.close()
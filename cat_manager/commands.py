@@ -0,0 +1,216 @@
+from collections import namedtuple
+from numbers import Real
+
+import numpy as np
+
+from cat_manager import events
+from cat_manager.population import CatPopulation, eat_round, play_round, sleep_round
+
+# Actions a command can apply, indexed by action code.
+COMMAND_ACTIONS = ("eat", "play", "sleep")
+
+# Status codes returned by ``apply_commands``.
+COMMAND_APPLIED = 0
+COMMAND_REJECTED = 1  # Invalid, or raised ValueError when applied.
+COMMAND_ABORTED = 2  # Valid, but rolled back because another command was rejected.
+
+CommandBatch = namedtuple("CommandBatch", ["cats", "actions", "amounts"])
+CommandBatch.__doc__ = """
+Commands for a ``CatPopulation``, one array entry per command.
+Attributes:
+    cats (numpy.ndarray): The position of the cat in the population.
+    actions (numpy.ndarray): The action code, an index into ``COMMAND_ACTIONS``.
+    amounts (numpy.ndarray): The food or minutes.
+"""
+
+
+def command_batch(commands):
+    """
+    Builds a ``CommandBatch`` from ``(cat_position, action, amount)`` tuples.
+    Unknown actions get the code -1 and non-numeric amounts become NaN, which
+    ``apply_commands`` both reject.
+    """
+    codes = {action: code for code, action in enumerate(COMMAND_ACTIONS)}
+    cats, actions, amounts = [], [], []
+    for cat, action, amount in commands:
+        cats.append(cat)
+        actions.append(codes.get(action, -1))
+        amounts.append(amount if isinstance(amount, Real) else np.nan)
+    return CommandBatch(
+        np.array(cats, dtype=np.int64),
+        np.array(actions, dtype=np.int8),
+        np.array(amounts, dtype=np.float64),
+    )
+
+
+def apply_commands(target, commands, per_cat=False):
+    """
+    Applies a batch of eat, play and sleep commands atomically.
+
+    The whole batch is validated before anything changes, then applied in one
+    pass. If any command is rejected, every change of the batch is rolled back
+    (or, with ``per_cat``, every change of the cats it targets), and nothing
+    raises: the outcome of each command is reported by its status.
+
+    Args:
+        target (Cat | CatPopulation): The cat or population to update.
+        commands (Iterable): For a cat, ``(action, amount)`` pairs. For a population,
+            a ``CommandBatch`` or ``(cat_position, action, amount)`` tuples.
+            Each cat's commands are applied in batch order.
+        per_cat (bool, optional): For a population, roll back only the cats with
+            a rejected command instead of the whole batch. Defaults to False.
+    Returns:
+        list[int] | numpy.ndarray: The status of every command: ``COMMAND_APPLIED``,
+        ``COMMAND_REJECTED`` or ``COMMAND_ABORTED``.
+    Behavior Rules:
+        - Unknown actions, unknown cats and amounts outside 0 to 100 are rejected
+          before anything runs.
+        - Sleeping at full energy is rejected when the cat's commands reach it.
+          Every cat's commands are still checked, so a rolled-back batch reports
+          the first rejected command of every cat.
+        - Commands of a cat after its rejected command are aborted.
+        - For a cat, events and observer notifications are only emitted once the
+          whole batch succeeded, exactly as if the methods had been called in turn.
+    """
+    if isinstance(target, CatPopulation):
+        if not isinstance(commands, CommandBatch):
+            commands = command_batch(commands)
+        return _apply_to_population(target, commands, per_cat)
+    return _apply_to_cat(target, list(commands))
+
+
+def _apply_to_cat(cat, commands):
+    statuses = [
+        (
+            COMMAND_APPLIED
+            if action in COMMAND_ACTIONS
+            and isinstance(amount, Real)
+            and 0 <= amount <= 100
+            else COMMAND_REJECTED
+        )
+        for action, amount in commands
+    ]
+    if COMMAND_REJECTED in statuses:
+        return [status or COMMAND_ABORTED for status in statuses]
+
+    observer = cat._observer
+    energy, hunger = cat._energy, cat._hunger
+    changes = []
+    collector = events.CollectorSink()
+    cat._observer = lambda *change: changes.append(change)
+    try:
+        with events.use_sink(collector):
+            for position, (action, amount) in enumerate(commands):
+                try:
+                    getattr(cat, action)(amount)
+                except ValueError:
+                    cat._energy, cat._hunger = energy, hunger
+                    statuses[position] = COMMAND_REJECTED
+                    return [status or COMMAND_ABORTED for status in statuses]
+    finally:
+        cat._observer = observer
+
+    for event in collector.events:
+        events.sink.emit(*event)
+    if observer is not None:
+        for change in changes:
+            observer(*change)
+    return statuses
+
+
+def _apply_to_population(population, batch, per_cat):
+    cats, actions, amounts = (np.asarray(column) for column in batch)
+    size = len(cats)
+    statuses = np.zeros(size, dtype=np.uint8)
+    # NaN amounts (non-numeric in ``command_batch``) fail both comparisons.
+    rejected = ~((amounts >= 0) & (amounts <= 100))
+    rejected |= (actions < 0) | (actions >= len(COMMAND_ACTIONS))
+    rejected |= (cats < 0) | (cats >= len(population))
+    statuses[rejected] = COMMAND_REJECTED
+    if rejected.any() and not per_cat:
+        statuses[~rejected] = COMMAND_ABORTED
+        return statuses
+
+    # Cats that had a command rejected, whose commands are rolled back.
+    known = (cats >= 0) & (cats < len(population))
+    failed = np.zeros(len(population), dtype=bool)
+    failed[cats[rejected & known]] = True
+
+    energy = population.energy.copy()
+    hunger = population.hunger.copy()
+    for commands in command_rounds(cats, np.flatnonzero(~rejected)):
+        commands = commands[~failed[cats[commands]]]
+        round_cats = cats[commands]
+        round_actions = actions[commands]
+        round_energy = energy[round_cats]
+        round_hunger = hunger[round_cats]
+
+        too_energetic = round_actions == COMMAND_ACTIONS.index("sleep")
+        too_energetic &= round_energy >= 100
+        if too_energetic.any():
+            statuses[commands[too_energetic]] = COMMAND_REJECTED
+            failed[round_cats[too_energetic]] = True
+
+        for code, kernel in enumerate(_KERNELS):
+            chosen = (round_actions == code) & ~too_energetic
+            if chosen.any():
+                chosen_energy = round_energy[chosen]
+                chosen_hunger = round_hunger[chosen]
+                kernel(chosen_energy, chosen_hunger, amounts[commands[chosen]])
+                round_energy[chosen] = chosen_energy
+                round_hunger[chosen] = chosen_hunger
+        energy[round_cats] = round_energy
+        hunger[round_cats] = round_hunger
+
+    if (statuses == COMMAND_REJECTED).any() and not per_cat:
+        statuses[statuses != COMMAND_REJECTED] = COMMAND_ABORTED
+        return statuses
+
+    aborted = known & (statuses != COMMAND_REJECTED)
+    aborted[known] &= failed[cats[known]]
+    statuses[aborted] = COMMAND_ABORTED
+    keep = ~failed
+    population.energy[keep] = energy[keep]
+    population.hunger[keep] = hunger[keep]
+    return statuses
+
+
+def command_rounds(cats, selected=None):
+    """
+    Splits commands into rounds that each touch every cat at most once.
+
+    Every command is ranked among the commands of its cat: round 0 holds the first
+    command of every cat, round 1 the second, and so on. Applying the rounds in
+    turn applies each cat's commands in order, while every round can be applied
+    to all of its cats at once.
+
+    Args:
+        cats (numpy.ndarray): The cat position of every command.
+        selected (numpy.ndarray, optional): The commands to split, in order.
+            Defaults to every command.
+    Returns:
+        list[numpy.ndarray]: The command positions of every round.
+    """
+    if selected is None:
+        selected = np.arange(len(cats))
+    if not len(selected):
+        return []
+    # Sorting on (cat, position) keys is unique, so it needs no stable sort.
+    order = selected[np.argsort(cats[selected] * len(cats) + selected)]
+    sorted_cats = cats[order]
+    starts = np.ones(len(order), dtype=bool)
+    starts[1:] = sorted_cats[1:] != sorted_cats[:-1]
+    positions = np.arange(len(order))
+    rank = positions - np.maximum.accumulate(np.where(starts, positions, 0))
+    # Small ranks sort much faster (by radix sort) as 16-bit integers.
+    rank_keys = rank.astype(np.uint16) if rank.max() < 2**16 else rank
+    by_rank = order[np.argsort(rank_keys, kind="stable")]
+    return np.split(by_rank, np.cumsum(np.bincount(rank))[:-1])
+
+
+def _sleep_kernel(energy, hunger, time):
+    sleep_round(energy, time)
+
+
+# Population kernels by action code.
+_KERNELS = (eat_round, play_round, _sleep_kernel)
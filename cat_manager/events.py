@@ -0,0 +1,161 @@
+import sys
+from collections import namedtuple
+from contextlib import contextmanager
+
+# Console messages for each event kind. ``{name}`` is the cat's name as given,
+# ``{title}`` is the name in title case and ``{detail}`` is the event detail.
+MESSAGES = {
+    "tired_play": "{title} is too tired to play much, energy depletes faster.",
+    "hungry_play": "{title} is playing but is very hungry!",
+    "affection": "{name} rubs against your leg and purrs, asking for affection.",
+    "rest": "{title} is resting to regain energy.",
+    "hunt": "{title} is hunting a {detail} prey.",
+    "hunt_caught": "{title} successfully caught the {detail} prey!",
+    "hunt_failed": "{title} failed to catch the {detail} prey.",
+    "exhausted": "{title} is exhausted and hungry, so it won't be able to hunt.",
+    "not_hungry": "{title} is not hungry, so it won't hunt.",
+}
+
+Event = namedtuple("Event", ["kind", "cat", "detail"])
+Event.__doc__ = """
+A structured event emitted by a cat.
+Attributes:
+    kind (str): The event kind, "meow" or one of the keys of ``MESSAGES``.
+    cat (Cat): The cat that emitted the event.
+    detail: Extra data: the hunger band (0 to 3) for "meow", the prey size for
+        hunting events, and None otherwise.
+"""
+
+
+def format_event(kind, cat, detail=None):
+    """
+    Formats an event as the message the cat used to print.
+    Args:
+        kind (str): The event kind.
+        cat (Cat): The cat that emitted the event.
+        detail (optional): The event detail.
+    Returns:
+        str: The console message.
+    """
+    if kind == "meow":
+        return cat.MEOW_SOUNDS[detail]
+    return MESSAGES[kind].format(name=cat.name, title=cat.name.title(), detail=detail)
+
+
+class NullSink:
+    """
+    An event sink that drops every event without formatting it.
+    """
+
+    def emit(self, kind, cat, detail=None):
+        pass
+
+    def flush(self):
+        pass
+
+
+class ConsoleSink(NullSink):
+    """
+    An event sink that prints every event to standard output right away.
+    This is the default sink and matches the original console output.
+    """
+
+    def emit(self, kind, cat, detail=None):
+        print(format_event(kind, cat, detail))
+
+
+class BufferedSink(NullSink):
+    """
+    An event sink that keeps events in memory and writes them in blocks.
+
+    Events are only formatted when a block is flushed, and each block is written to
+    the stream with a single ``write`` call.
+
+    Attributes:
+        stream (TextIO | None): The stream to write to. None writes to the current
+            standard output.
+        block_size (int): The number of events that triggers a flush.
+    """
+
+    def __init__(self, stream=None, block_size=1024):
+        """
+        Initialize a BufferedSink.
+        Args:
+            stream (TextIO, optional): The stream to write to. Defaults to standard output.
+            block_size (int, optional): The number of events per block. Defaults to 1024.
+        """
+        self.stream = stream
+        self.block_size = block_size
+        self._pending = []
+
+    def emit(self, kind, cat, detail=None):
+        self._pending.append((kind, cat, detail))
+        if len(self._pending) >= self.block_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Formats and writes every pending event.
+        """
+        if not self._pending:
+            return
+        lines = [format_event(*event) for event in self._pending]
+        self._pending = []
+        stream = self.stream or sys.stdout
+        stream.write("\n".join(lines) + "\n")
+        stream.flush()
+
+
+class CollectorSink(NullSink):
+    """
+    An event sink that collects events in memory, mainly for tests.
+    Attributes:
+        events (list[Event]): The events emitted so far.
+    """
+
+    def __init__(self):
+        self.events = []
+
+    def emit(self, kind, cat, detail=None):
+        self.events.append(Event(kind, cat, detail))
+
+    def kinds(self):
+        """
+        Returns the kinds of the events emitted so far, in order.
+        """
+        return [event.kind for event in self.events]
+
+
+# The sink every cat emits into. Replace it with ``set_sink`` or ``use_sink``.
+sink = ConsoleSink()
+
+
+def set_sink(new_sink):
+    """
+    Replaces the sink every cat emits into.
+    Args:
+        new_sink: The new event sink.
+    Returns:
+        The previous sink.
+    """
+    global sink
+    previous, sink = sink, new_sink
+    return previous
+
+
+@contextmanager
+def use_sink(new_sink):
+    """
+    Temporarily replaces the event sink, flushing it and restoring the previous
+    sink on exit.
+    Args:
+        new_sink: The event sink to use inside the ``with`` block.
+    Yields:
+        The new sink.
+    """
+    previous = set_sink(new_sink)
+    try:
+        yield new_sink
+    finally:
+        new_sink.flush()
+        set_sink(previous)
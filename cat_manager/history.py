@@ -0,0 +1,304 @@
+import json
+from collections import namedtuple
+from contextlib import contextmanager
+
+# Actions recorded in a history, by delta code.
+HISTORY_ACTIONS = (
+    "eat",
+    "play",
+    "sleep",
+    "rest",
+    "hunt_caught",
+    "hunt_failed",
+    "fast_forward",
+)
+_CODES = {action: code for code, action in enumerate(HISTORY_ACTIONS)}
+
+Change = namedtuple("Change", ["step", "action", "energy", "hunger"])
+Change.__doc__ = """
+One recorded state change of a cat.
+Attributes:
+    step (int): The number of the change, counted from 1 when the cat was added.
+    action (str): One of ``HISTORY_ACTIONS``.
+    energy (int): The change of energy.
+    hunger (int): The change of hunger.
+"""
+
+
+class _Track:
+    """
+    The ring buffer of one cat: 3 signed bytes per change (action code, energy
+    change, hunger change), the state before the oldest change kept, and the
+    state after every ``keyframe_every``-th change.
+    """
+
+    __slots__ = ("ring", "keyframes", "base", "start", "count", "saved")
+
+    def __init__(self, capacity, keyframes, energy, hunger):
+        self.ring = bytearray(3 * capacity)
+        self.keyframes = bytearray(2 * keyframes)
+        self.base = energy, hunger
+        self.start = self.count = self.saved = 0
+
+
+class CatHistory:
+    """
+    Event-sourced histories of cats, kept as compact deltas in fixed-size rings.
+
+    The history watches every cat it holds. Each change made by eat, play, sleep,
+    rest, a hunt or a fast-forward is recorded as 3 bytes in the cat's ring; once
+    the ring is full, the oldest change is folded into the base state. The state
+    after every ``keyframe_every``-th change is kept too, so the state at any step
+    still in the ring is rebuilt by replaying at most ``keyframe_every - 1``
+    changes from the nearest keyframe.
+
+    ``checkpoint`` appends the changes made since the last checkpoint to a JSON
+    Lines file, and ``state_from_checkpoints`` rebuilds a state from such a file
+    after the changes have left the ring.
+
+    Attributes:
+        capacity (int): The number of changes kept per cat.
+        keyframe_every (int): The number of changes between keyframes.
+
+    Methods:
+        add(cat), remove(cat): Start and stop recording a cat.
+        steps(cat): The first and last steps that can be rebuilt.
+        state_at(cat, step): The energy and hunger after a step.
+        changes(cat, since): The recorded changes after a step.
+        checkpoint(target): Appends the changes since the last checkpoint.
+
+    Behavior Rules:
+        - Step 0 is the state when the cat was added, and step n the state after
+          its n-th recorded change.
+        - Direct assignments to energy or hunger are not recorded, so they make
+          earlier states wrong; record cats that are only changed by their methods.
+    """
+
+    def __init__(self, cats=(), capacity=1024, keyframe_every=32):
+        """
+        Initialize a CatHistory.
+        Args:
+            cats (Iterable[Cat], optional): The cats to record.
+            capacity (int, optional): The number of changes kept per cat.
+                Defaults to 1024.
+            keyframe_every (int, optional): The number of changes between keyframes.
+                Defaults to 32.
+        """
+        self.capacity = capacity
+        self.keyframe_every = keyframe_every
+        self._keyframes = capacity // keyframe_every + 1
+        self._tracks = {}
+        for cat in cats:
+            self.add(cat)
+
+    def __len__(self):
+        return len(self._tracks)
+
+    def __contains__(self, cat):
+        return cat.name in self._tracks
+
+    def add(self, cat):
+        """
+        Starts recording a cat, from its current state.
+        Raises:
+            ValueError: If a cat with the same name is already recorded.
+        """
+        if cat.name in self._tracks:
+            raise ValueError(f"{cat.name} is already recorded.")
+        self._tracks[cat.name] = _Track(
+            self.capacity, self._keyframes, cat.energy, cat.hunger
+        )
+        cat.watch(self._on_change)
+
+    def remove(self, cat):
+        """
+        Stops recording a cat and forgets its history.
+        Raises:
+            KeyError: If the cat is not recorded.
+        """
+        del self._tracks[cat.name]
+        cat.unwatch(self._on_change)
+
+    def _on_change(self, cat, action, old_energy, old_hunger, detail):
+        if action == "hunt":
+            action = "hunt_caught" if detail[1] else "hunt_failed"
+        track = self._tracks[cat.name]
+        ring = track.ring
+        slot = 3 * (track.count % self.capacity)
+        if track.count - track.start == self.capacity:
+            # Fold the oldest change into the base before overwriting it.
+            energy, hunger = track.base
+            track.base = (
+                energy + _signed(ring[slot + 1]),
+                hunger + _signed(ring[slot + 2]),
+            )
+            track.start += 1
+        energy, hunger = cat.energy, cat.hunger
+        ring[slot] = _CODES[action]
+        ring[slot + 1] = (energy - old_energy) & 0xFF
+        ring[slot + 2] = (hunger - old_hunger) & 0xFF
+        track.count += 1
+        if track.count % self.keyframe_every == 0:
+            frame = 2 * (track.count // self.keyframe_every % self._keyframes)
+            track.keyframes[frame] = energy
+            track.keyframes[frame + 1] = hunger
+
+    def steps(self, cat):
+        """
+        Returns the first and last steps whose state can be rebuilt from memory.
+        Raises:
+            KeyError: If the cat is not recorded.
+        """
+        track = self._tracks[cat.name]
+        return track.start, track.count
+
+    def state_at(self, cat, step):
+        """
+        Rebuilds the energy and hunger of a cat right after a step.
+        Args:
+            cat (Cat): The recorded cat.
+            step (int): The step, between the bounds returned by ``steps``.
+        Returns:
+            tuple[int, int]: The energy and hunger after the step.
+        Raises:
+            KeyError: If the cat is not recorded.
+            ValueError: If the step is not in the ring (see ``steps``).
+        """
+        track = self._tracks[cat.name]
+        return self._state_at(track, step)
+
+    def _state_at(self, track, step):
+        if not track.start <= step <= track.count:
+            raise ValueError(
+                f"Step {step} is not in the history, which holds steps "
+                f"{track.start} to {track.count}."
+            )
+        keyframe = step - step % self.keyframe_every
+        if keyframe > track.start:
+            frame = 2 * (keyframe // self.keyframe_every % self._keyframes)
+            energy, hunger = track.keyframes[frame], track.keyframes[frame + 1]
+        else:
+            keyframe = track.start
+            energy, hunger = track.base
+        ring = track.ring
+        for replayed in range(keyframe, step):
+            slot = 3 * (replayed % self.capacity)
+            energy += _signed(ring[slot + 1])
+            hunger += _signed(ring[slot + 2])
+        return energy, hunger
+
+    def changes(self, cat, since=None):
+        """
+        Returns the recorded changes of a cat after a step, oldest first.
+        Args:
+            cat (Cat): The recorded cat.
+            since (int, optional): The step to start after. Defaults to the
+                oldest change still in the ring.
+        Returns:
+            list[Change]: The changes.
+        Raises:
+            KeyError: If the cat is not recorded.
+        """
+        track = self._tracks[cat.name]
+        return self._changes(track, since)
+
+    def _changes(self, track, since=None):
+        first = track.start if since is None else max(since, track.start)
+        ring = track.ring
+        changes = []
+        for index in range(first, track.count):
+            slot = 3 * (index % self.capacity)
+            changes.append(
+                Change(
+                    index + 1,
+                    HISTORY_ACTIONS[ring[slot]],
+                    _signed(ring[slot + 1]),
+                    _signed(ring[slot + 2]),
+                )
+            )
+        return changes
+
+    def checkpoint(self, target):
+        """
+        Appends the changes made since the last checkpoint to a JSON Lines file.
+        Each cat with new changes gets one line
+        ``{"cat": name, "step": s, "energy": e, "hunger": h, "deltas": [...]}``:
+        the state after step ``s`` and the changes after it, as flat
+        ``[code, energy change, hunger change, ...]`` triples with the codes of
+        ``HISTORY_ACTIONS``.
+        Args:
+            target (str | os.PathLike | TextIO): The checkpoint file, opened for
+                appending, or an open text stream.
+        Returns:
+            int: The number of changes written.
+        Behavior Rules:
+            - Changes that left the ring since the last checkpoint are lost, and the
+              line starts at the oldest change still in the ring.
+        """
+        written = 0
+        with _open(target, "a") as file:
+            for name, track in self._tracks.items():
+                if track.count == track.saved:
+                    continue
+                step = max(track.saved, track.start)
+                energy, hunger = self._state_at(track, step)
+                deltas = []
+                for change in self._changes(track, step):
+                    code = _CODES[change.action]
+                    deltas += (code, change.energy, change.hunger)
+                record = {
+                    "cat": name,
+                    "step": step,
+                    "energy": energy,
+                    "hunger": hunger,
+                    "deltas": deltas,
+                }
+                file.write(json.dumps(record, separators=(",", ":")) + "\n")
+                written += track.count - step
+                track.saved = track.count
+        return written
+
+
+def _signed(byte):
+    return byte - 256 if byte > 127 else byte
+
+
+@contextmanager
+def _open(source, mode="r"):
+    if hasattr(source, "read" if mode == "r" else "write"):
+        yield source
+    else:
+        with open(source, mode, encoding="utf-8") as file:
+            yield file
+
+
+def state_from_checkpoints(source, name, step):
+    """
+    Rebuilds the state of a cat after a step from a checkpoint file, by replaying
+    the changes of the nearest checkpoint line that covers the step.
+    Args:
+        source (str | os.PathLike | TextIO): The file written by
+            ``CatHistory.checkpoint``.
+        name (str): The name of the cat.
+        step (int): The step.
+    Returns:
+        tuple[int, int]: The energy and hunger after the step.
+    Raises:
+        ValueError: If no checkpoint line of the cat covers the step.
+    """
+    with _open(source) as file:
+        for line in file:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record["cat"] != name:
+                continue
+            deltas = record["deltas"]
+            if not record["step"] <= step <= record["step"] + len(deltas) // 3:
+                continue
+            energy, hunger = record["energy"], record["hunger"]
+            for index in range(step - record["step"]):
+                energy += deltas[3 * index + 1]
+                hunger += deltas[3 * index + 2]
+            return energy, hunger
+    raise ValueError(f"No checkpoint of {name} covers step {step}.")
@@ -0,0 +1,197 @@
+import functools
+from collections import Counter
+from time import perf_counter_ns
+
+from cat_manager.cat import Cat, DomesticCat, WildCat
+
+# Methods wrapped while instrumentation is enabled, by class. The hunt rules
+# (``determine_prey_size`` and ``calculate_success``) are not wrapped: hunts read
+# them from the class's ``HuntTable``, which replacing them would rebuild.
+INSTRUMENTED_METHODS = {
+    Cat: ("meow", "eat", "play", "sleep"),
+    DomesticCat: ("ask_for_affection",),
+    WildCat: ("meow", "rest", "hunt", "can_hunt", "process_hunt_result"),
+}
+
+# Latency histogram buckets: bucket ``b`` counts calls that took less than
+# ``2 ** b`` nanoseconds (and at least ``2 ** (b - 1)``).
+LATENCY_BUCKETS = 40
+
+_originals = {}
+_calls = Counter()
+_rejections = Counter()
+_hunts = Counter()
+_forced_rests = Counter()
+_latency = {}
+_in_can_hunt = []
+
+
+def is_enabled():
+    """
+    Returns True while the cat methods are instrumented.
+    """
+    return bool(_originals)
+
+
+def enable():
+    """
+    Starts recording calls to the ``Cat``, ``DomesticCat`` and ``WildCat`` methods.
+
+    The methods are replaced by recording wrappers on their classes, so nothing is
+    recorded (and nothing is slowed down) until this is called, and ``disable``
+    puts the original methods back. Calls are recorded under the class that
+    defines the method, so ``WildCat`` cats eating are counted as "Cat.eat".
+    """
+    if _originals:
+        return
+    for cat_class, methods in INSTRUMENTED_METHODS.items():
+        for method in methods:
+            original = cat_class.__dict__[method]
+            _originals[cat_class, method] = original
+            setattr(
+                cat_class, method, _wrap(f"{cat_class.__name__}.{method}", original)
+            )
+
+
+def disable():
+    """
+    Stops recording and restores the original methods. Recorded data is kept.
+    """
+    for (cat_class, method), original in _originals.items():
+        setattr(cat_class, method, original)
+    _originals.clear()
+
+
+def reset():
+    """
+    Clears every recorded counter and histogram.
+    """
+    for counter in (_calls, _rejections, _hunts, _forced_rests):
+        counter.clear()
+    _latency.clear()
+
+
+def _wrap(name, method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        _calls[name] += 1
+        if name == "WildCat.rest" and _in_can_hunt:
+            _forced_rests[name] += 1
+        elif name == "WildCat.process_hunt_result":
+            prey_size, success = _hunt_arguments(*args, **kwargs)
+            _hunts[prey_size, bool(success)] += 1
+        elif name == "WildCat.can_hunt":
+            _in_can_hunt.append(self)
+
+        start = perf_counter_ns()
+        try:
+            return method(self, *args, **kwargs)
+        except ValueError:
+            _rejections[name] += 1
+            raise
+        finally:
+            elapsed = perf_counter_ns() - start
+            histogram = _latency.setdefault(name, [0] * LATENCY_BUCKETS)
+            histogram[min(elapsed.bit_length(), LATENCY_BUCKETS - 1)] += 1
+            if name == "WildCat.can_hunt":
+                _in_can_hunt.pop()
+
+    return wrapper
+
+
+def _hunt_arguments(prey_size, success):
+    return prey_size, success
+
+
+def snapshot():
+    """
+    Returns a copy of everything recorded so far.
+    Returns:
+        dict: With the keys:
+        - "calls": calls per method, such as ``{"WildCat.hunt": 120}``.
+        - "rejections": ValueError raised per method.
+        - "hunts": ``{prey_size: {"success": n, "failure": n}}``.
+        - "forced_rests": rests forced by ``can_hunt`` on exhausted cats.
+        - "can_hunt_forced_rest_rate": forced rests per ``can_hunt`` call.
+        - "latency_ns": per method, a list of ``(upper_bound_ns, count)`` for the
+          non-empty histogram buckets.
+    """
+    hunts = {}
+    for (prey_size, success), count in _hunts.items():
+        outcomes = hunts.setdefault(prey_size, {"success": 0, "failure": 0})
+        outcomes["success" if success else "failure"] += count
+    can_hunt_calls = _calls["WildCat.can_hunt"]
+    forced = _forced_rests["WildCat.rest"]
+    return {
+        "calls": dict(_calls),
+        "rejections": dict(_rejections),
+        "hunts": hunts,
+        "forced_rests": forced,
+        "can_hunt_forced_rest_rate": forced / can_hunt_calls if can_hunt_calls else 0.0,
+        "latency_ns": {
+            name: [
+                (2**bucket, count) for bucket, count in enumerate(histogram) if count
+            ]
+            for name, histogram in _latency.items()
+            if any(histogram)
+        },
+    }
+
+
+def percentile_ns(name, percent):
+    """
+    Returns an upper bound, in nanoseconds, for the given latency percentile of a method.
+    Args:
+        name (str): The method, such as "WildCat.hunt".
+        percent (float): The percentile, between 0 and 100.
+    Returns:
+        int | None: The upper bound of the histogram bucket holding the percentile,
+        or None if the method was never called.
+    """
+    histogram = _latency.get(name)
+    total = sum(histogram) if histogram else 0
+    if not total:
+        return None
+    threshold = total * percent / 100
+    seen = 0
+    for bucket, count in enumerate(histogram):
+        seen += count
+        if seen >= threshold:
+            return 2**bucket
+    return 2 ** (LATENCY_BUCKETS - 1)
+
+
+def report():
+    """
+    Returns a human-readable summary of everything recorded so far.
+    """
+    data = snapshot()
+    lines = [f"{'method':<30} {'calls':>10} {'errors':>8} {'p50':>10} {'p99':>10}"]
+    for name, calls in sorted(data["calls"].items()):
+        lines.append(
+            f"{name:<30} {calls:>10} {data['rejections'].get(name, 0):>8} "
+            f"{_format_ns(percentile_ns(name, 50)):>10} "
+            f"{_format_ns(percentile_ns(name, 99)):>10}"
+        )
+    for prey_size, outcomes in sorted(data["hunts"].items()):
+        total = outcomes["success"] + outcomes["failure"]
+        lines.append(
+            f"hunts on {prey_size} prey: {total}, "
+            f"{outcomes['success'] / total:.0%} successful"
+        )
+    if data["calls"].get("WildCat.can_hunt"):
+        lines.append(
+            f"can_hunt forced rest() on {data['can_hunt_forced_rest_rate']:.0%} "
+            "of its calls"
+        )
+    return "\n".join(lines)
+
+
+def _format_ns(value):
+    if value is None:
+        return "-"
+    if value < 1000:
+        return f"<{value}ns"
+    if value < 1_000_000:
+        return f"<{value / 1000:.0f}us"
+    return f"<{value / 1_000_000:.0f}ms"
@@ -0,0 +1,441 @@
+import numpy as np
+
+from cat_manager import events
+from cat_manager.cat import HuntTable, WildCat
+
+# Number of energy or hunger levels, 0 to 100.
+LEVELS = HuntTable.LEVELS
+
+# Number of (energy, hunger) states.
+STATES = LEVELS * LEVELS
+
+_level_values = np.arange(LEVELS)
+
+
+def _shift_matrix(low, high, sign):
+    """
+    Returns the 101 x 101 matrix of moving a level by a uniform ``randint(low, high)``
+    step, up (sign 1) or down (sign -1), clamped between 0 and 100.
+    Entry ``[level, new_level]`` is the probability of the move.
+    """
+    matrix = np.zeros((LEVELS, LEVELS))
+    chance = 1 / (high - low + 1)
+    for step in range(low, high + 1):
+        targets = np.clip(_level_values + sign * step, 0, LEVELS - 1)
+        np.add.at(matrix, (_level_values, targets), chance)
+    return matrix
+
+
+def exhausted_states():
+    """
+    Returns a (101, 101) mask, indexed by [energy, hunger], of the state where
+    ``WildCat.can_hunt`` makes the cat rest: energy 0 and hunger 100.
+    """
+    mask = np.zeros((LEVELS, LEVELS), dtype=bool)
+    mask[0, LEVELS - 1] = True
+    return mask
+
+
+class HuntChain:
+    """
+    The exact Markov chain of a wild cat's energy and hunger under a repeating policy.
+
+    A wild cat's state is its integer (energy, hunger) pair, so there are only
+    101 x 101 states, and every random draw in ``hunt``, ``rest`` and
+    ``process_hunt_result`` is a bounded ``randint``. The chain computes the exact
+    distribution over states instead of simulating cats.
+
+    Distributions and value functions are (101, 101) arrays indexed by
+    [energy, hunger]. Hunts are applied with small dense matrices (the energy and
+    hunger updates of a hunt are independent once the prey size is known), and
+    deterministic actions as a mapping from state to state, so one step costs
+    about as much as a few 101 x 101 matrix products.
+
+    Attributes:
+        policy (tuple): The actions of one period, applied in order. Each action is
+            "hunt", "rest", or an ``(action, amount)`` pair for eat, play and sleep.
+        cat_class (type): The wild cat class whose rules and ranges are used.
+
+    Methods:
+        forward(distribution): The distribution after one period.
+        backward(values): The expected values after one period, from each state.
+        distribution(start, steps): The distribution after ``steps`` periods.
+        steady_state(start): The long-run distribution.
+        expected_steps_until(target, start): Expected periods until reaching a target.
+        transition_matrix(): The sparse transition matrix of one period.
+
+    Behavior Rules:
+        - Hunting uses the class's ``hunt_table``, ``ENERGY_GAIN``,
+          ``HUNGER_REDUCTION``, ``FAILED_HUNT_COST`` and ``REST_GAIN``, so custom
+          subclasses are analysed with their own rules.
+        - Eat, play and sleep are evaluated with the class's own methods. An action
+          that raises ValueError (such as sleeping at full energy) leaves the
+          state unchanged.
+    """
+
+    def __init__(self, policy=("hunt",), cat_class=WildCat):
+        """
+        Initialize a HuntChain.
+        Args:
+            policy (Iterable, optional): The actions of one period. Defaults to a
+                single hunt.
+            cat_class (type, optional): The wild cat class. Defaults to ``WildCat``.
+        Raises:
+            ValueError: If an action is not supported.
+        """
+        self.policy = tuple(policy)
+        self.cat_class = cat_class
+        self._steps = []
+        for action in self.policy:
+            if action == "hunt":
+                self._steps.append(("hunt", self._hunt_model()))
+            elif action == "rest":
+                self._steps.append(("rest", _shift_matrix(*cat_class.REST_GAIN, 1)))
+            elif isinstance(action, tuple) and action[0] in ("eat", "play", "sleep"):
+                self._steps.append(("map", self._action_map(*action)))
+            else:
+                raise ValueError(f"Unsupported policy action: {action!r}.")
+
+    def _hunt_model(self):
+        cat_class = self.cat_class
+        table = cat_class.hunt_table()
+        prey = np.array(table.prey, dtype=object).reshape(LEVELS, LEVELS)
+        chance = np.clip(np.array(table.success, float), 0, 100).reshape(LEVELS, LEVELS)
+        chance /= 100
+
+        energy, hunger = np.meshgrid(_level_values, _level_values, indexing="ij")
+        exhausted = (energy == 0) & (hunger == LEVELS - 1)
+        eligible = (hunger != 0) & ~exhausted
+
+        caught = []
+        for prey_size in sorted(set(table.prey)):
+            weight = eligible & (prey == prey_size)
+            caught.append(
+                (
+                    weight * chance,
+                    _shift_matrix(*cat_class.ENERGY_GAIN[prey_size], 1),
+                    _shift_matrix(*cat_class.HUNGER_REDUCTION[prey_size], -1),
+                )
+            )
+        cost = cat_class.FAILED_HUNT_COST
+        return {
+            "stay": ~eligible & ~exhausted,
+            "caught": caught,
+            "failed": eligible * (1 - chance),
+            "failed_energy": _shift_matrix(cost, cost, -1),
+            "rest_energy": _shift_matrix(*cat_class.REST_GAIN, 1)[0],
+        }
+
+    def _action_map(self, action, amount):
+        """
+        Returns, for every flat state, the flat state after the action.
+        """
+        cat_class = self.cat_class
+        probe = cat_class.__new__(cat_class)
+        probe._observer = None
+        method = getattr(probe, action)
+        targets = np.empty(STATES, dtype=np.int64)
+        with events.use_sink(events.NullSink()):
+            for state in range(STATES):
+                probe._energy, probe._hunger = divmod(state, LEVELS)
+                try:
+                    method(amount)
+                except ValueError:
+                    probe._energy, probe._hunger = divmod(state, LEVELS)
+                targets[state] = probe._energy * LEVELS + probe._hunger
+        return targets
+
+    def forward(self, distribution):
+        """
+        Returns the distribution over states after one period.
+        Args:
+            distribution (numpy.ndarray): A (101, 101) probability array indexed
+                by [energy, hunger].
+        """
+        result = np.asarray(distribution, dtype=float)
+        for kind, model in self._steps:
+            if kind == "map":
+                result = np.bincount(
+                    model, weights=result.ravel(), minlength=STATES
+                ).reshape(LEVELS, LEVELS)
+                continue
+            if kind == "rest":
+                result = model.T @ result
+                continue
+            new = result * model["stay"]
+            for weight, energy_moves, hunger_moves in model["caught"]:
+                new += energy_moves.T @ (result * weight) @ hunger_moves
+            new += model["failed_energy"].T @ (result * model["failed"])
+            new[:, LEVELS - 1] += result[0, LEVELS - 1] * model["rest_energy"]
+            result = new
+        return result
+
+    def backward(self, values):
+        """
+        Returns, for every starting state, the expected value after one period.
+        Args:
+            values (numpy.ndarray): A (101, 101) array of values indexed by
+                [energy, hunger].
+        """
+        result = np.asarray(values, dtype=float)
+        for kind, model in reversed(self._steps):
+            if kind == "map":
+                result = result.ravel()[model].reshape(LEVELS, LEVELS)
+                continue
+            if kind == "rest":
+                result = model @ result
+                continue
+            new = result * model["stay"]
+            for weight, energy_moves, hunger_moves in model["caught"]:
+                new += weight * (energy_moves @ result @ hunger_moves.T)
+            new += model["failed"] * (model["failed_energy"] @ result)
+            new[0, LEVELS - 1] = model["rest_energy"] @ result[:, LEVELS - 1]
+            result = new
+        return result
+
+    @staticmethod
+    def start(energy, hunger):
+        """
+        Returns the distribution of a cat known to be at (energy, hunger).
+        """
+        distribution = np.zeros((LEVELS, LEVELS))
+        distribution[energy, hunger] = 1
+        return distribution
+
+    def distribution(self, start, steps):
+        """
+        Returns the distribution over states after a number of periods.
+        Args:
+            start (tuple[int, int] | numpy.ndarray): The starting (energy, hunger),
+                or a starting distribution.
+            steps (int): The number of periods.
+        """
+        distribution = self._start(start)
+        for _ in range(steps):
+            distribution = self.forward(distribution)
+        return distribution
+
+    def steady_state(self, start=None, tolerance=1e-12, max_steps=1_000_000):
+        """
+        Returns the long-run distribution over states.
+        Args:
+            start (tuple[int, int] | numpy.ndarray, optional): The starting state or
+                distribution. The chain can have several closed classes, so the
+                long run depends on where the cat starts. Defaults to a uniform
+                distribution over every state.
+            tolerance (float, optional): The largest total change between two steps
+                accepted as converged.
+            max_steps (int, optional): The most steps to try.
+        Returns:
+            numpy.ndarray: The (101, 101) steady-state distribution.
+        Raises:
+            RuntimeError: If the distribution does not converge within max_steps.
+        Notes:
+            The lazy chain (stay put with probability 1/2) has the same steady state
+            and cannot oscillate, so periodic policies converge too.
+        """
+        distribution = self._start(start)
+        for _ in range(max_steps):
+            new = 0.5 * (distribution + self.forward(distribution))
+            if np.abs(new - distribution).sum() < tolerance:
+                return new
+            distribution = new
+        raise RuntimeError("The steady state did not converge.")
+
+    def expected_steps_until(
+        self, target, start=None, tolerance=1e-9, max_steps=1_000_000
+    ):
+        """
+        Returns the expected number of periods until the cat reaches a target state.
+        Args:
+            target (numpy.ndarray): A (101, 101) boolean mask of target states.
+            start (tuple[int, int], optional): The starting (energy, hunger).
+                Defaults to returning the expectation for every starting state.
+            tolerance (float, optional): The largest change between two iterations
+                accepted as converged.
+            max_steps (int, optional): The most iterations to try.
+        Returns:
+            float | numpy.ndarray: The expected number of periods, or a (101, 101)
+            array of them. States from which the cat might never reach the target
+            get infinity.
+        Raises:
+            RuntimeError: If the expectation does not converge within max_steps.
+        """
+        target = np.asarray(target, dtype=bool)
+        reachable = self._closure(target, np.ones_like(target))
+        # A state reaches the target for sure unless it can get (without passing
+        # the target) to a state that cannot reach it at all.
+        never = self._closure(~reachable, ~target)
+
+        steps = np.zeros((LEVELS, LEVELS))
+        for _ in range(max_steps):
+            new = np.where(never | target, 0, 1 + self.backward(steps))
+            if np.abs(new - steps).max() < tolerance:
+                steps = new
+                break
+            steps = new
+        else:
+            raise RuntimeError("The expected number of steps did not converge.")
+
+        steps[never] = np.inf
+        return steps if start is None else float(steps[start])
+
+    def _closure(self, states, through):
+        """
+        Returns the states that can reach ``states`` in any number of periods,
+        moving only through the states of the mask ``through``.
+        """
+        closure = states.copy()
+        while True:
+            grown = closure | (through & (self.backward(closure) > 0))
+            if (grown == closure).all():
+                return closure
+            closure = grown
+
+    def expected_hunts_until_exhaustion(self, start=None):
+        """
+        Returns the expected number of periods until the cat is exhausted and hungry
+        (energy 0, hunger 100), the state where ``can_hunt`` makes it rest.
+        With a policy of one hunt per period this is the expected number of hunts.
+        """
+        return self.expected_steps_until(exhausted_states(), start)
+
+    def transition_matrix(self):
+        """
+        Returns the sparse transition matrix of one period in coordinate form.
+        The entries are built from the move tables of each action and multiplied
+        out across the policy, so every probability is exact and no transition is
+        dropped.
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Row (from) states,
+            column (to) states and probabilities of every non-zero transition,
+            sorted by row then column. States are flattened as
+            ``energy * 101 + hunger``.
+        """
+        matrix = None
+        for kind, model in self._steps:
+            step = self._step_entries(kind, model)
+            matrix = step if matrix is None else _compose(matrix, step)
+        if matrix is None:
+            states = np.arange(STATES)
+            return states, states, np.ones(STATES)
+        return matrix
+
+    @staticmethod
+    def _step_entries(kind, model):
+        """
+        Returns the transitions of one action as aggregated coordinate entries.
+        """
+        states = np.arange(STATES)
+        energy, hunger = np.divmod(states, LEVELS)
+        if kind == "map":
+            return _aggregate(states, model, np.ones(STATES))
+        if kind == "rest":
+            position, target, chance = _gather(_table(model), energy, LEVELS)
+            return _aggregate(
+                states[position], target * LEVELS + hunger[position], chance
+            )
+
+        stay = np.flatnonzero(model["stay"])
+        rest_energy = np.flatnonzero(model["rest_energy"])
+        parts = [
+            (stay, stay, np.ones(len(stay))),
+            (
+                np.full(len(rest_energy), LEVELS - 1),
+                rest_energy * LEVELS + LEVELS - 1,
+                model["rest_energy"][rest_energy],
+            ),
+        ]
+        failed = np.flatnonzero(model["failed"])
+        position, target, chance = _gather(
+            _table(model["failed_energy"]), energy[failed], LEVELS
+        )
+        parts.append(
+            (
+                failed[position],
+                target * LEVELS + hunger[failed][position],
+                model["failed"].ravel()[failed][position] * chance,
+            )
+        )
+        for weight, energy_moves, hunger_moves in model["caught"]:
+            caught = np.flatnonzero(weight)
+            energy_position, new_energy, energy_chance = _gather(
+                _table(energy_moves), energy[caught], LEVELS
+            )
+            from_states = caught[energy_position]
+            position, new_hunger, hunger_chance = _gather(
+                _table(hunger_moves), hunger[from_states], LEVELS
+            )
+            from_states = from_states[position]
+            parts.append(
+                (
+                    from_states,
+                    new_energy[position] * LEVELS + new_hunger,
+                    weight.ravel()[from_states]
+                    * energy_chance[position]
+                    * hunger_chance,
+                )
+            )
+        return _aggregate(*(np.concatenate(column) for column in zip(*parts)))
+
+    def _start(self, start):
+        if start is None:
+            return np.full((LEVELS, LEVELS), 1 / STATES)
+        if isinstance(start, tuple):
+            return self.start(*start)
+        return np.asarray(start, dtype=float)
+
+
+def _table(matrix):
+    """
+    Returns the non-zero entries of a move matrix as (sources, targets, chances),
+    sorted by source.
+    """
+    sources, targets = np.nonzero(matrix)
+    return sources, targets, matrix[sources, targets]
+
+
+def _gather(table, keys, size):
+    """
+    Returns the entries of a table sorted by source, for every source in ``keys``:
+    the position of the key in ``keys``, the target and the chance of each entry.
+    """
+    sources, targets, chances = table
+    counts = np.bincount(sources, minlength=size)
+    starts = np.cumsum(counts) - counts
+    counts = counts[keys]
+    position = np.repeat(np.arange(len(keys)), counts)
+    shift = np.cumsum(counts) - counts - starts[keys]
+    entries = np.arange(counts.sum()) - np.repeat(shift, counts)
+    return position, targets[entries], chances[entries]
+
+
+def _aggregate(rows, columns, chances):
+    """
+    Sums the chances of duplicate (row, column) entries and sorts them.
+    """
+    keys, inverse = np.unique(rows * STATES + columns, return_inverse=True)
+    return keys // STATES, keys % STATES, np.bincount(inverse, weights=chances)
+
+
+def _compose(first, second, budget=1 << 22):
+    """
+    Returns the entries of applying the transitions ``first`` then ``second``,
+    expanding about ``budget`` products at a time.
+    """
+    rows, columns, chances = first
+    products = np.bincount(second[0], minlength=STATES)[columns]
+    per_row = np.bincount(rows, weights=products, minlength=STATES).cumsum()
+    splits = np.searchsorted(per_row, np.arange(budget, per_row[-1], budget))
+    bounds = np.searchsorted(rows, np.concatenate(([0], splits + 1, [STATES])))
+    parts = []
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        position, target, chance = _gather(second, columns[start:stop], STATES)
+        parts.append(
+            _aggregate(
+                rows[start:stop][position],
+                target,
+                chances[start:stop][position] * chance,
+            )
+        )
+    return tuple(np.concatenate(column) for column in zip(*parts))
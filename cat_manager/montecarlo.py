@@ -0,0 +1,222 @@
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from math import sqrt
+from statistics import NormalDist
+
+import numpy as np
+
+from cat_manager import events
+from cat_manager.cat import WildCat
+from cat_manager.rng import CatStream
+
+# Quantities estimated for every trajectory.
+METRICS = ("energy", "hunger", "hunt_success")
+
+Estimate = namedtuple("Estimate", ["mean", "low", "high", "samples"])
+Estimate.__doc__ = """
+The running estimate of one metric.
+Attributes:
+    mean (float): The sample mean.
+    low (float): The lower bound of the confidence interval.
+    high (float): The upper bound of the confidence interval.
+    samples (int): The number of trajectories sampled.
+"""
+
+
+class RunningMean:
+    """
+    Welford's running mean and variance, merged a batch at a time.
+
+    Attributes:
+        count (int): The number of samples.
+        mean (float): Their mean.
+        m2 (float): The sum of squared differences from the mean.
+    """
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def merge(self, count, mean, m2):
+        """
+        Adds the summary of a batch of samples (Chan et al.'s parallel update).
+        """
+        if not count:
+            return
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+
+    def estimate(self, z):
+        """
+        Returns the estimate with a normal confidence interval of ``z`` standard errors.
+        """
+        if self.count < 2:
+            return Estimate(self.mean, -np.inf, np.inf, self.count)
+        half_width = z * sqrt(self.m2 / (self.count - 1) / self.count)
+        return Estimate(
+            self.mean, self.mean - half_width, self.mean + half_width, self.count
+        )
+
+
+def _apply(cat, action):
+    if action in ("hunt", "rest"):
+        getattr(cat, action)()
+    else:
+        getattr(cat, action[0])(action[1])
+
+
+def _run_batch(task):
+    """
+    Samples one batch of trajectories, in a worker process or in the caller.
+    Returns:
+        list[tuple[int, float, float]]: The count, mean and sum of squared
+        differences of every metric in ``METRICS``.
+    """
+    cat_class, energy, hunger, policy, size, seed, max_steps = task
+    results = np.zeros((size, len(METRICS)))
+    successes = []
+
+    def count_success(cat, action, old_energy, old_hunger, detail):
+        if action == "hunt" and detail[1]:
+            successes.append(1)
+
+    batch_seed = int(seed.generate_state(1, np.uint64)[0])
+    with events.use_sink(events.NullSink()):
+        for trajectory in range(size):
+            cat = cat_class("Sample", 1, "Gray", energy=energy, hunger=hunger)
+            if isinstance(cat, WildCat):
+                cat.rng = CatStream(trajectory, batch_seed)
+            cat.watch(count_success)
+            successes.clear()
+            steps = policy
+            if callable(policy):
+                steps = _callable_steps(policy, cat, max_steps)
+            for action in steps:
+                try:
+                    _apply(cat, action)
+                except ValueError:
+                    pass
+            results[trajectory] = cat.energy, cat.hunger, len(successes)
+    means = results.mean(axis=0)
+    m2 = ((results - means) ** 2).sum(axis=0)
+    return [(size, float(mean), float(m)) for mean, m in zip(means, m2)]
+
+
+def _callable_steps(policy, cat, max_steps):
+    step = 0
+    while (action := policy(cat, step)) is not None:
+        if step == max_steps:
+            raise RuntimeError(
+                f"The policy did not end a trajectory within {max_steps} steps."
+            )
+        yield action
+        step += 1
+
+
+def stream_estimates(
+    policy,
+    cat_class=WildCat,
+    energy=100,
+    hunger=0,
+    precision=0.5,
+    confidence=0.95,
+    batch_size=1_000,
+    max_samples=1_000_000,
+    seed=None,
+    workers=None,
+    max_steps=10_000,
+):
+    """
+    Samples trajectories of a cat under a policy and streams running estimates.
+
+    Trajectories are sampled in batches on a process pool. Every batch has its own
+    random seed spawned from ``seed``, every trajectory of a batch draws from its
+    own ``CatStream``, and batches are merged in order, so the
+    estimates only depend on the seed and the batch size, not on the number of
+    workers.
+
+    Args:
+        policy (Sequence | Callable): The actions of a trajectory, in order: "hunt",
+            "rest", or ``(action, amount)`` pairs for eat, play and sleep. A callable
+            is called as ``policy(cat, step)`` and returns the next action, or None
+            to end the trajectory. It must be picklable to run on workers.
+        cat_class (type, optional): The cat class to sample, such as ``WildCat`` or
+            ``DomesticCat``. Defaults to ``WildCat``.
+        energy (int, optional): The starting energy. Defaults to 100.
+        hunger (int, optional): The starting hunger. Defaults to 0.
+        precision (float, optional): The largest confidence interval half-width
+            accepted for every metric. Defaults to 0.5.
+        confidence (float, optional): The confidence level. Defaults to 0.95.
+        batch_size (int, optional): Trajectories per batch. Defaults to 1000.
+        max_samples (int, optional): The most trajectories to sample. Defaults to 1M.
+        seed (int, optional): The seed of the batches. Defaults to a random seed.
+        workers (int, optional): The number of worker processes. 1 samples in the
+            calling process. Defaults to the number of CPUs.
+        max_steps (int, optional): The most actions a callable policy can take in
+            one trajectory. Defaults to 10000.
+    Yields:
+        dict[str, Estimate]: The estimates of ``METRICS`` (final energy, final
+        hunger and successful hunts per trajectory) after every batch. The last one
+        is within ``precision``, unless ``max_samples`` was reached first.
+    Raises:
+        RuntimeError: If a callable policy does not end a trajectory within
+            ``max_steps`` actions.
+    Behavior Rules:
+        - Actions the cat rejects with ValueError (such as sleeping at full energy)
+          are skipped, and the trajectory goes on.
+    """
+    workers = workers or os.cpu_count() or 1
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    seeds = np.random.SeedSequence(seed)
+    running = [RunningMean() for _ in METRICS]
+    if not callable(policy):
+        policy = tuple(policy)
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        sampled = 0
+        while sampled < max_samples:
+            sizes = []
+            while len(sizes) < workers and sampled < max_samples:
+                sizes.append(min(batch_size, max_samples - sampled))
+                sampled += sizes[-1]
+            tasks = [
+                (cat_class, energy, hunger, policy, size, batch_seed, max_steps)
+                for size, batch_seed in zip(sizes, seeds.spawn(len(sizes)))
+            ]
+            batches = pool.map(_run_batch, tasks) if pool else map(_run_batch, tasks)
+            for batch in batches:
+                for metric, summary in zip(running, batch):
+                    metric.merge(*summary)
+                estimates = {
+                    name: metric.estimate(z) for name, metric in zip(METRICS, running)
+                }
+                yield estimates
+                if all(
+                    (value.high - value.low) / 2 <= precision
+                    for value in estimates.values()
+                ):
+                    return
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+
+def estimate(policy, cat_class=WildCat, **options):
+    """
+    Samples until the requested precision is reached and returns the final estimates.
+    Takes the same arguments as ``stream_estimates``.
+    Returns:
+        dict[str, Estimate]: The final estimates of ``METRICS``.
+    """
+    estimates = None
+    for estimates in stream_estimates(policy, cat_class, **options):
+        pass
+    return estimates
@@ -0,0 +1,158 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from cat_manager.population import (
+    StreamBank,
+    eat_round,
+    hunt_wild,
+    play_round,
+    sleep_round,
+)
+
+# Population columns copied into shared memory, all stored as uint8.
+SHARED_COLUMNS = ("species", "energy", "hunger")
+
+
+class ShardedSimulation:
+    """
+    Runs rounds of eat/play/sleep/hunt over a ``CatPopulation`` on a process pool.
+
+    The population is split into contiguous shards. The species, energy and hunger
+    columns live in ``multiprocessing.shared_memory`` buffers, so workers read and
+    write them in place and no ``Cat`` object is ever pickled. Every cat draws from
+    its own counter-based stream, keyed by the seed and its position in the
+    population, so a run with the same seed gives the same results no matter how
+    many shards or workers are used.
+
+    Attributes:
+        population (CatPopulation): The population being simulated. Its energy and
+            hunger columns are updated after every run.
+        shards (int): The number of shards.
+        workers (int): The number of worker processes. 1 runs every shard in the
+            calling process.
+
+    Methods:
+        run(rounds, food, play, sleep): Runs rounds on every shard.
+        close(): Releases the shared memory buffers.
+
+    Behavior Rules:
+        - A round is play, hunt (wild cats only), eat, then sleep, for every cat.
+        - Cats already at full energy skip the sleep instead of raising ValueError.
+        - Shards never share cats, so workers do not need any locking.
+    """
+
+    def __init__(self, population, shards=None, seed=None, workers=None):
+        """
+        Initialize a ShardedSimulation and copy the population into shared memory.
+        Args:
+            population (CatPopulation): The population to simulate.
+            shards (int, optional): The number of shards. Defaults to the number of workers.
+            seed (int, optional): The seed of the random streams. Defaults to a random seed.
+            workers (int, optional): The number of worker processes. Defaults to the
+                number of CPUs.
+        """
+        self.population = population
+        self.workers = workers or os.cpu_count() or 1
+        self.shards = shards or self.workers
+        bounds = np.linspace(0, len(population), self.shards + 1).astype(np.int64)
+        self._slices = list(zip(bounds[:-1].tolist(), bounds[1:].tolist()))
+        self._seed = int(np.random.SeedSequence(seed).generate_state(1, np.uint64)[0])
+        self._rounds = 0
+        self._memory = {}
+        for column in SHARED_COLUMNS:
+            values = getattr(population, column)
+            memory = shared_memory.SharedMemory(create=True, size=max(len(values), 1))
+            np.ndarray(len(values), np.uint8, memory.buf)[:] = values
+            self._memory[column] = memory
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Releases the shared memory buffers. The simulation cannot run afterwards.
+        """
+        for memory in self._memory.values():
+            memory.close()
+            memory.unlink()
+        self._memory = {}
+
+    def run(self, rounds, food=10, play=10, sleep=10):
+        """
+        Runs the given number of rounds on every shard.
+        Args:
+            rounds (int): The number of rounds to run.
+            food (int, optional): The food each cat eats per round. Defaults to 10.
+            play (int, optional): The minutes each cat plays per round. Defaults to 10.
+            sleep (int, optional): The minutes each cat sleeps per round. Defaults to 10.
+        Returns:
+            numpy.ndarray: The number of hunts per outcome code over all rounds,
+            indexed by ``HUNT_SKIPPED``, ``HUNT_RESTED``, ``HUNT_FAILED`` and ``HUNT_CAUGHT``.
+        Raises:
+            ValueError: If an amount is not between 0 and 100.
+        """
+        for label, amount in (("food", food), ("time", play), ("time", sleep)):
+            if not 0 <= amount <= 100:
+                raise ValueError(
+                    f"Invalid {label} level: {amount}. "
+                    f"The {label} should be between 0 and 100."
+                )
+
+        names = {column: memory.name for column, memory in self._memory.items()}
+        size = len(self.population)
+        streams = self._seed, self._rounds
+        tasks = [
+            (names, size, start, stop, streams, rounds, food, play, sleep)
+            for start, stop in self._slices
+        ]
+        if self.workers == 1:
+            counts = [_run_shard(task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                counts = list(pool.map(_run_shard, tasks))
+
+        self._rounds += rounds
+        for column in ("energy", "hunger"):
+            getattr(self.population, column)[:] = self._column(column)
+        return np.sum(counts, axis=0)
+
+    def _column(self, column):
+        return np.ndarray(len(self.population), np.uint8, self._memory[column].buf)
+
+
+def _run_shard(task):
+    """
+    Runs every round of one shard inside a worker process.
+    Returns:
+        numpy.ndarray: The number of hunts per outcome code.
+    """
+    names, size, start, stop, (seed, done), rounds, food, play, sleep = task
+    memory = {
+        column: shared_memory.SharedMemory(name=name) for column, name in names.items()
+    }
+    try:
+        species, energy, hunger = (
+            np.ndarray(size, np.uint8, memory[column].buf)[start:stop]
+            for column in SHARED_COLUMNS
+        )
+        # Every round draws once for every wild cat, so ``done`` rounds in, the
+        # streams of the wild cats are at counter ``done``.
+        rng = StreamBank(range(start, stop), seed, counter=done)
+        counts = np.zeros(4, dtype=np.int64)
+        for _ in range(rounds):
+            play_round(energy, hunger, play)
+            outcome, prey = hunt_wild(energy, hunger, species, rng)
+            counts += np.bincount(outcome, minlength=4)
+            eat_round(energy, hunger, food)
+            sleep_round(energy, sleep)
+        del species, energy, hunger
+        return counts
+    finally:
+        for shared in memory.values():
+            shared.close()
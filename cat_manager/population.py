@@ -0,0 +1,472 @@
+import numpy as np
+
+from cat_manager.cat import Cat, DomesticCat, HuntTable, WildCat
+from cat_manager.rng import GOLDEN_GAMMA, stream_base
+
+# Species codes stored in the ``species`` column, indexed by position.
+SPECIES = (Cat, DomesticCat, WildCat)
+
+# Hunger thresholds that separate the four meow bands used by ``Cat.meow``.
+MEOW_THRESHOLDS = (20, 50, 80)
+
+# Prey size codes returned by ``CatPopulation.hunt``, indexed by position.
+PREY_SIZES = ("small", "medium", "large")
+
+# Outcome codes returned by ``CatPopulation.hunt``.
+HUNT_SKIPPED = 0  # Not a wild cat, or not hungry enough to hunt.
+HUNT_RESTED = 1  # Exhausted and hungry, so the cat rested instead.
+HUNT_FAILED = 2
+HUNT_CAUGHT = 3
+
+
+class CatPopulation:
+    """
+    A columnar container that applies cat behaviors to a whole population at once.
+
+    Instead of keeping one ``Cat`` object per animal, the population stores each
+    attribute as a column. Energy, hunger, age and species are NumPy arrays, so
+    eating, playing, sleeping and meowing are applied to every cat in a single call.
+    The results are the same as calling the scalar ``Cat`` methods cat by cat,
+    including the half-up rounding that keeps energy and hunger in one byte each.
+
+    Attributes:
+        names (list[str]): The names of the cats.
+        colors (list[str]): The fur colors of the cats.
+        age (numpy.ndarray): The ages of the cats in years.
+        species (numpy.ndarray): Index of each cat's class in ``SPECIES``.
+        energy (numpy.ndarray): The energy levels of the cats (uint8, 0 to 100).
+        hunger (numpy.ndarray): The hunger levels of the cats (uint8, 0 to 100).
+
+    Methods:
+        from_cats(cats): Builds a population from ``Cat`` objects.
+        to_cats(): Converts the population back into ``Cat`` objects.
+        meow(): Returns the meow band of every cat.
+        eat(food): Feeds every cat.
+        play(time): Lets every cat play.
+        sleep(time): Makes every cat sleep.
+        hunt(rng): Runs one hunting round for every wild cat.
+
+    Behavior Rules:
+        - Amounts can be a single number applied to every cat or one value per cat.
+        - A call is validated before any state changes, so an invalid amount
+          raises ValueError and leaves the whole population untouched.
+    """
+
+    def __init__(self, names, ages, colors, species=None, energy=None, hunger=None):
+        """
+        Initialize a CatPopulation with one entry per cat.
+        Args:
+            names (list[str]): The names of the cats.
+            ages (array-like): The ages of the cats in years.
+            colors (list[str]): The fur colors of the cats.
+            species (array-like, optional): Index of each cat's class in ``SPECIES``.
+                Defaults to ``Cat`` for every cat.
+            energy (float | array-like, optional): The energy levels, or one level for
+                every cat. Defaults to 100.
+            hunger (float | array-like, optional): The hunger levels, or one level for
+                every cat. Defaults to 0.
+        Raises:
+            ValueError: If the columns do not all have the same length.
+        """
+        size = len(names)
+        self.names = list(names)
+        self.colors = list(colors)
+        self.age = np.asarray(ages, dtype=np.int64)
+        self.species = self._column(species, 0, np.uint8, size)
+        self.energy = _levels(self._column(energy, 100, np.float64, size))
+        self.hunger = _levels(self._column(hunger, 0, np.float64, size))
+
+        if len(self.colors) != size or len(self.age) != size:
+            raise ValueError("All population columns must have the same length.")
+
+    @staticmethod
+    def _column(values, default, dtype, size):
+        if values is None:
+            values = default
+        column = np.asarray(values, dtype=dtype)
+        if column.ndim == 0:
+            return np.full(size, column, dtype=dtype)
+        if column.shape != (size,):
+            raise ValueError("All population columns must have the same length.")
+        return column.copy()
+
+    @classmethod
+    def from_cats(cls, cats):
+        """
+        Build a population from a sequence of ``Cat`` objects.
+        Args:
+            cats (Iterable[Cat]): The cats to copy into the population. Cats of a
+                subclass are stored as the closest class of ``SPECIES``.
+        Returns:
+            CatPopulation: A population holding the same state as the cats.
+        """
+        cats = list(cats)
+        return cls(
+            names=[cat.name for cat in cats],
+            ages=[cat.age for cat in cats],
+            colors=[cat.color for cat in cats],
+            species=[_species_code(cat) for cat in cats],
+            energy=[cat.energy for cat in cats],
+            hunger=[cat.hunger for cat in cats],
+        )
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        """
+        Returns a ``Cat`` object holding the current state of one cat.
+        """
+        cat_class = SPECIES[self.species[index]]
+        cat = cat_class(self.names[index], int(self.age[index]), self.colors[index])
+        cat.energy = self.energy[index].item()
+        cat.hunger = self.hunger[index].item()
+        return cat
+
+    def to_cats(self):
+        """
+        Converts the population back into a list of ``Cat`` objects.
+        """
+        return [self[index] for index in range(len(self))]
+
+    def _amounts(self, values, label):
+        amounts = np.broadcast_to(np.asarray(values, dtype=np.float64), (len(self),))
+        if amounts.size and (amounts.min() < 0 or amounts.max() > 100):
+            raise ValueError(
+                f"Invalid {label} level. The {label} should be between 0 and 100."
+            )
+        return amounts
+
+    def meow(self):
+        """
+        Classifies every cat into the hunger band used by ``Cat.meow``.
+        Returns:
+            numpy.ndarray: One band per cat:
+            - 0: Not hungry (hunger < 20).
+            - 1: Satisfied (hunger < 50).
+            - 2: Hungry (hunger < 80).
+            - 3: Very hungry (hunger >= 80).
+        """
+        return np.searchsorted(MEOW_THRESHOLDS, self.hunger, side="right").astype(
+            np.int8
+        )
+
+    def eat(self, food):
+        """
+        Feeds every cat, adjusting hunger and energy like ``Cat.eat``.
+        Args:
+            food (float | array-like): The amount of food for all cats, or one per cat.
+                Must be between 0 and 100 inclusive.
+        Raises:
+            ValueError: If any food amount is outside the valid range.
+        """
+        eat_round(self.energy, self.hunger, self._amounts(food, "food"))
+
+    def play(self, time):
+        """
+        Lets every cat play, adjusting energy and hunger like ``Cat.play``.
+        Args:
+            time (float | array-like): The playtime in minutes for all cats, or one
+                per cat. Must be between 0 and 100.
+        Raises:
+            ValueError: If any time is outside the valid range.
+        Behavior:
+            - Cats with energy of 30 or below lose 1.5x the time in energy.
+            - Cats with hunger of 70 or above gain 1.2x the time in hunger.
+            - Scaled amounts are rounded half up, like ``Cat.play``.
+        """
+        play_round(self.energy, self.hunger, self._amounts(time, "time"))
+
+    def sleep(self, time):
+        """
+        Makes every cat below full energy sleep, increasing energy like ``Cat.sleep``.
+        Args:
+            time (float | array-like): The sleep time in minutes for all cats, or one
+                per cat. Must be between 0 and 100.
+        Returns:
+            numpy.ndarray: A boolean mask of the cats that slept. The others were
+            already at full energy, where ``Cat.sleep`` raises ValueError, and are
+            left unchanged.
+        Raises:
+            ValueError: If any time is outside the valid range.
+        """
+        time = self._amounts(time, "time")
+        slept = self.energy < 100
+        sleep_round(self.energy, time)
+        return slept
+
+    def hunt(self, rng=None, cat_class=WildCat):
+        """
+        Runs one hunting round for every wild cat in the population, like ``WildCat.hunt``.
+        Args:
+            rng (numpy.random.Generator | StreamBank | int, optional): The random
+                generator, per-cat streams for every cat of the population, or a
+                seed for a new generator. Defaults to a freshly seeded generator.
+            cat_class (type, optional): The wild cat class whose hunt rules apply,
+                for custom ``WildCat`` subclasses. Defaults to ``WildCat``.
+        Returns:
+            tuple[numpy.ndarray, numpy.ndarray]: The outcome code of every cat
+            (``HUNT_SKIPPED``, ``HUNT_RESTED``, ``HUNT_FAILED`` or ``HUNT_CAUGHT``)
+            and the prey size code of every cat that hunted (-1 for the others).
+        Behavior:
+            - Cats that are not ``WildCat`` are skipped.
+            - Exhausted and hungry cats (energy 0, hunger 100) rest instead of hunting.
+            - Cats that are not hungry (hunger 0) do not hunt.
+            - All random numbers for the round are drawn in a single call.
+        """
+        if not isinstance(rng, StreamBank):
+            rng = np.random.default_rng(rng)
+        return hunt_wild(self.energy, self.hunger, self.species, rng, cat_class)
+
+
+def _species_code(cat):
+    """
+    Returns the ``SPECIES`` code of a cat, matching subclasses to the closest
+    class they derive from.
+    """
+    for code in range(len(SPECIES) - 1, -1, -1):
+        if isinstance(cat, SPECIES[code]):
+            return code
+    raise ValueError(f"Not a cat: {cat!r}.")
+
+
+def _levels(values, out=None):
+    """
+    Rounds state values half up and clamps them between 0 and 100, like the
+    ``Cat.energy`` and ``Cat.hunger`` setters.
+    Returns:
+        numpy.ndarray: The levels as uint8, written into ``out`` when given.
+    """
+    levels = np.clip(np.floor(values + 0.5), 0, 100)
+    if out is None:
+        return levels.astype(np.uint8)
+    out[...] = levels
+    return out
+
+
+def _scaled(time, numerator, denominator):
+    """
+    Returns time * numerator / denominator rounded half up, like ``Cat.play``.
+    """
+    return (2 * time * numerator + denominator) // (2 * denominator)
+
+
+def eat_round(energy, hunger, food):
+    """
+    Applies ``Cat.eat`` to arrays of energy and hunger levels in place.
+    The food amounts are not validated.
+    """
+    # Subtract in float64, so integer amounts cannot wrap the uint8 levels around.
+    _levels(np.subtract(hunger, food, dtype=np.float64), out=hunger)
+    _levels(energy + food, out=energy)
+
+
+def play_round(energy, hunger, time):
+    """
+    Applies ``Cat.play`` to arrays of energy and hunger levels in place.
+    The play times are not validated.
+    """
+    tired = energy <= 30
+    hungry = hunger >= 70
+    _levels(energy - np.where(tired, _scaled(time, 3, 2), time), out=energy)
+    _levels(hunger + np.where(hungry, _scaled(time, 6, 5), time), out=hunger)
+
+
+def sleep_round(energy, time):
+    """
+    Applies ``Cat.sleep`` to an array of energy levels in place.
+    The sleep times are not validated, and cats already at full energy are left
+    unchanged instead of raising ValueError.
+    """
+    _levels(energy + time, out=energy)
+
+
+def hunt_wild(energy, hunger, species, rng, cat_class=WildCat):
+    """
+    Applies ``hunt_round`` in place to the wild cats among arrays of energy,
+    hunger and species codes, using the rules of ``cat_class``.
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: The outcome and prey size codes of every
+        cat, with ``HUNT_SKIPPED`` and -1 for the cats that are not wild.
+    """
+    wild = np.flatnonzero(species == SPECIES.index(WildCat))
+    if len(wild) == len(species):
+        return hunt_round(energy, hunger, rng, cat_class)
+
+    outcome = np.zeros(len(species), dtype=np.int8)
+    prey = np.full(len(species), -1, dtype=np.int8)
+    wild_energy = energy[wild]
+    wild_hunger = hunger[wild]
+    if isinstance(rng, StreamBank):
+        rng = rng.select(wild)
+    outcome[wild], prey[wild] = hunt_round(wild_energy, wild_hunger, rng, cat_class)
+    energy[wild] = wild_energy
+    hunger[wild] = wild_hunger
+    return outcome, prey
+
+
+def hunt_decisions(cat_class=WildCat):
+    """
+    Returns the hunt table of a wild cat class as a NumPy array.
+    Each (energy, hunger) state holds ``success * 4 + prey_size_code``. The array is
+    cached on the class's ``HuntTable``, so it is rebuilt together with the table
+    when the class's rules change.
+    """
+    table = cat_class.hunt_table()
+    if table.arrays is None:
+        prey = np.array([PREY_SIZES.index(size) for size in table.prey], np.int16)
+        table.arrays = np.array(table.success, np.int16) * 4 + prey
+    return table.arrays
+
+
+def _ranges(ranges):
+    """
+    Converts a ``{prey_size: (low, high)}`` mapping into low and span arrays
+    indexed by prey size code.
+    """
+    low = np.array([ranges[size][0] for size in PREY_SIZES], dtype=np.uint32)
+    high = np.array([ranges[size][1] for size in PREY_SIZES], dtype=np.uint32)
+    return low, high - low + 1
+
+
+def hunt_round(energy, hunger, rng, cat_class=WildCat):
+    """
+    Applies one hunting round to arrays of wild cat energy and hunger levels in place.
+    Args:
+        energy (numpy.ndarray): The energy levels, updated in place and kept
+            between 0 and 100.
+        hunger (numpy.ndarray): The hunger levels, updated in place and kept
+            between 0 and 100.
+        rng (numpy.random.Generator | StreamBank): The random generator, or the
+            streams of the cats, to draw from.
+        cat_class (type, optional): The wild cat class whose hunt table and ranges
+            are used. Defaults to ``WildCat``.
+    Returns:
+        tuple[numpy.ndarray, numpy.ndarray]: The outcome and prey size codes of every cat.
+    Notes:
+        Every cat gets one 64-bit random draw, split into four 16-bit fields for the
+        success roll, the energy gain, the hunger reduction and the rest gain. Each
+        field is mapped onto its ``randint`` range with a multiply and shift.
+    """
+    size = len(energy)
+    levels = energy, hunger
+    energy = energy.astype(np.int16)
+    hunger = hunger.astype(np.int16)
+    if isinstance(rng, StreamBank):
+        raw = rng.random_raw(size)
+    else:
+        raw = rng.bit_generator.random_raw(size)
+    fields = raw.view(np.uint16).reshape(size, 4).T.astype(np.uint32)
+
+    exhausted = (hunger == 100) & (energy == 0)
+    eligible = hunger != 0
+    eligible &= ~exhausted
+
+    decisions = hunt_decisions(cat_class)[energy * HuntTable.LEVELS + hunger]
+    prey = (decisions & 3).astype(np.int8)
+    success = decisions >> 2
+
+    roll = _scale(fields[0], 0, 100)  # randint(1, 100) <= success
+    caught = roll < success
+    caught &= eligible
+    failed = eligible ^ caught
+
+    gain_low, gain_span = _ranges(cat_class.ENERGY_GAIN)
+    reduction_low, reduction_span = _ranges(cat_class.HUNGER_REDUCTION)
+    rest_low, rest_high = cat_class.REST_GAIN
+
+    energy_change = _scale(fields[1], gain_low[prey], gain_span[prey]) * caught
+    energy_change += _scale(fields[3], rest_low, rest_high - rest_low + 1) * exhausted
+    energy_change = energy_change.astype(np.int32)
+    energy_change -= cat_class.FAILED_HUNT_COST * failed
+    energy += energy_change
+    hunger -= _scale(fields[2], reduction_low[prey], reduction_span[prey]) * caught
+    np.clip(energy, 0, 100, out=levels[0], casting="unsafe")
+    np.clip(hunger, 0, 100, out=levels[1], casting="unsafe")
+
+    outcome = exhausted.view(np.int8) * HUNT_RESTED
+    outcome += failed * np.int8(HUNT_FAILED)
+    outcome += caught * np.int8(HUNT_CAUGHT)
+    prey[~eligible] = -1
+    return outcome, prey
+
+
+def _scale(field, low, span):
+    """
+    Maps 16-bit random fields onto integers between low and low + span - 1 in place,
+    the same range ``randint(low, low + span - 1)`` draws from.
+    """
+    field *= span
+    field >>= 16
+    field += low
+    return field
+
+
+class StreamBank:
+    """
+    The counter-based random streams of many cats, drawn from together.
+
+    Draw n of cat ``i`` is the same 64-bit value as draw n of
+    ``rng.CatStream(cat_ids[i], seed)``, so a batched hunt only depends on the seed,
+    the cat ids and how many rounds each cat has drawn for, not on how the cats
+    are split into batches or shards, and any cat can be replayed on its own.
+
+    Attributes:
+        counters (numpy.ndarray): The number of draws made by every cat.
+
+    Methods:
+        random_raw(size): Returns one 64-bit draw for every selected cat.
+        select(positions): Returns a view drawing for some of the cats only.
+    """
+
+    def __init__(self, cat_ids, seed=None, counter=0):
+        """
+        Initialize a StreamBank.
+        Args:
+            cat_ids (Iterable[int | str]): The ids of the cats, such as their names
+                or their positions in a population.
+            seed (int, optional): The seed. Defaults to the global seed (see
+                ``rng.seed``).
+            counter (int, optional): The number of draws every cat skips. Defaults to 0.
+        """
+        self._bases = np.array(
+            [stream_base(cat_id, seed) for cat_id in cat_ids], dtype=np.uint64
+        )
+        self.counters = np.full(len(self._bases), counter, dtype=np.uint64)
+        self._positions = np.arange(len(self._bases))
+
+    def __len__(self):
+        return len(self._positions)
+
+    def select(self, positions):
+        """
+        Returns a view of the streams at ``positions`` (indices or a boolean mask).
+        Draws from the view advance the counters of this bank.
+        """
+        view = StreamBank(())
+        view._bases = self._bases
+        view.counters = self.counters
+        view._positions = self._positions[positions]
+        return view
+
+    def random_raw(self, size):
+        """
+        Returns the next 64-bit draw of every selected stream, in order.
+        Args:
+            size (int): The number of selected streams, as in
+                ``numpy.random.BitGenerator.random_raw``.
+        Raises:
+            ValueError: If ``size`` is not the number of selected streams.
+        """
+        if size != len(self):
+            raise ValueError(f"Cannot draw {size} values from {len(self)} streams.")
+        self.counters[self._positions] += np.uint64(1)
+        # SplitMix64 of base + counter * gamma; NumPy wraps uint64 products.
+        values = self.counters[self._positions] * np.uint64(GOLDEN_GAMMA)
+        values += self._bases[self._positions]
+        values ^= values >> np.uint64(30)
+        values *= np.uint64(0xBF58476D1CE4E5B9)
+        values ^= values >> np.uint64(27)
+        values *= np.uint64(0x94D049BB133111EB)
+        values ^= values >> np.uint64(31)
+        return values
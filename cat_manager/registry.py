@@ -0,0 +1,166 @@
+from bisect import bisect_right
+
+from cat_manager.cat import WildCat
+
+# Hunger thresholds of the meow bands: not hungry, satisfied, hungry, very hungry.
+HUNGER_BANDS = (20, 50, 80)
+
+# Energy thresholds of the energy bands. Band 0 (energy <= 30) is the band where
+# ``Cat.play`` depletes energy 1.5x faster.
+ENERGY_BANDS = (31,)
+
+
+def hunger_band(hunger):
+    """
+    Returns the meow band of a hunger level, from 0 (not hungry) to 3 (very hungry).
+    """
+    return bisect_right(HUNGER_BANDS, hunger)
+
+
+def energy_band(energy):
+    """
+    Returns the energy band of an energy level: 0 if too tired to play (<= 30), else 1.
+    """
+    return bisect_right(ENERGY_BANDS, energy)
+
+
+def is_hunt_ready(cat):
+    """
+    Returns True if ``WildCat.can_hunt`` would let the cat hunt, without its side effects.
+    """
+    return (
+        isinstance(cat, WildCat)
+        and cat.hunger != 0
+        and not (cat.hunger == 100 and cat.energy == 0)
+    )
+
+
+class CatRegistry:
+    """
+    A collection of cats with indexes on hunger and energy bands.
+
+    The registry watches every cat it holds, so the indexes are updated
+    incrementally whenever eat, play, sleep, rest or a hunt changes a cat.
+    Queries return the cats of one band in time proportional to the number of cats
+    returned, not to the size of the registry.
+
+    Methods:
+        add(cat): Adds a cat and starts watching it.
+        remove(cat): Removes a cat and stops watching it.
+        refresh(cat): Re-indexes a cat after a direct assignment to energy or hunger.
+        with_hunger_band(band): Cats in a meow band (see ``HUNGER_BANDS``).
+        with_energy_band(band): Cats in an energy band (see ``ENERGY_BANDS``).
+        very_hungry(): Cats with hunger >= 80.
+        too_tired_to_play(): Cats with energy <= 30.
+        ready_to_hunt(): Wild cats that pass ``can_hunt``.
+
+    Behavior Rules:
+        - Bands use the thresholds of ``Cat.meow``, ``Cat.play`` and ``WildCat.can_hunt``.
+        - Assigning ``cat.energy`` or ``cat.hunger`` directly is not observed;
+          call ``refresh(cat)`` afterwards.
+    """
+
+    def __init__(self, cats=()):
+        """
+        Initialize a CatRegistry.
+        Args:
+            cats (Iterable[Cat], optional): The cats to add.
+        """
+        self._keys = {}
+        self._hunger = [set() for _ in range(len(HUNGER_BANDS) + 1)]
+        self._energy = [set() for _ in range(len(ENERGY_BANDS) + 1)]
+        self._hunt_ready = set()
+        for cat in cats:
+            self.add(cat)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __contains__(self, cat):
+        return cat in self._keys
+
+    def add(self, cat):
+        """
+        Adds a cat to the registry and starts watching it.
+        Raises:
+            ValueError: If the cat is already in the registry.
+        """
+        if cat in self._keys:
+            raise ValueError(f"{cat.name} is already in the registry.")
+        self._insert(cat)
+        cat.watch(self._on_change)
+
+    def remove(self, cat):
+        """
+        Removes a cat from the registry and stops watching it.
+        Raises:
+            KeyError: If the cat is not in the registry.
+        """
+        self._discard(cat, self._keys.pop(cat))
+        cat.unwatch(self._on_change)
+
+    def refresh(self, cat):
+        """
+        Re-indexes a cat whose energy or hunger was assigned directly.
+        """
+        self._discard(cat, self._keys[cat])
+        self._insert(cat)
+
+    def _insert(self, cat):
+        keys = (hunger_band(cat.hunger), energy_band(cat.energy), is_hunt_ready(cat))
+        self._keys[cat] = keys
+        self._hunger[keys[0]].add(cat)
+        self._energy[keys[1]].add(cat)
+        if keys[2]:
+            self._hunt_ready.add(cat)
+
+    def _discard(self, cat, keys):
+        self._hunger[keys[0]].discard(cat)
+        self._energy[keys[1]].discard(cat)
+        self._hunt_ready.discard(cat)
+
+    def _on_change(self, cat, action, old_energy, old_hunger, detail):
+        keys = self._keys.get(cat)
+        if keys is None:
+            return
+        new_keys = (
+            hunger_band(cat.hunger),
+            energy_band(cat.energy),
+            is_hunt_ready(cat),
+        )
+        if new_keys != keys:
+            self._discard(cat, keys)
+            self._insert(cat)
+
+    def with_hunger_band(self, band):
+        """
+        Returns the cats in a meow band: 0 (hunger < 20), 1 (< 50), 2 (< 80) or 3.
+        """
+        return set(self._hunger[band])
+
+    def with_energy_band(self, band):
+        """
+        Returns the cats in an energy band: 0 (energy <= 30) or 1.
+        """
+        return set(self._energy[band])
+
+    def very_hungry(self):
+        """
+        Returns the cats with hunger of 80 or above.
+        """
+        return self.with_hunger_band(len(HUNGER_BANDS))
+
+    def too_tired_to_play(self):
+        """
+        Returns the cats with energy of 30 or below.
+        """
+        return self.with_energy_band(0)
+
+    def ready_to_hunt(self):
+        """
+        Returns the wild cats that would pass ``WildCat.can_hunt``.
+        """
+        return set(self._hunt_ready)
@@ -0,0 +1,153 @@
+import csv
+import json
+from collections import namedtuple
+from contextlib import contextmanager
+from itertools import islice
+
+# Actions a log record can replay, with whether they take an amount.
+ACTIONS = {"eat": True, "play": True, "sleep": True, "hunt": False, "rest": False}
+
+Record = namedtuple("Record", ["cat", "action", "amount"])
+Record.__doc__ = """
+One line of an activity log.
+Attributes:
+    cat (str): The name of the cat.
+    action (str): One of ``ACTIONS``.
+    amount (int | float | None): The food or minutes, or None for hunt and rest.
+"""
+
+ReplayError = namedtuple("ReplayError", ["record", "error"])
+ReplayError.__doc__ = """
+A record that could not be read or replayed.
+Attributes:
+    record (Record | str | list[str]): The record, or the raw JSON line or CSV row
+        that could not be parsed into one.
+    error (Exception): Why it failed, usually the ValueError raised by the cat.
+"""
+
+
+@contextmanager
+def _open(source):
+    if hasattr(source, "read"):
+        yield source
+    else:
+        with open(source, newline="", encoding="utf-8") as file:
+            yield file
+
+
+def _amount(value):
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        number = float(value)
+        return int(number) if number.is_integer() else number
+    return value
+
+
+def read_jsonl(source):
+    """
+    Streams records from a JSON Lines log, one object per line with the keys
+    "cat", "action" and, for eat/play/sleep, "amount".
+    Args:
+        source (str | os.PathLike | TextIO): The log file or an open text stream.
+    Yields:
+        Record | ReplayError: The records, in file order, and a ``ReplayError``
+        holding the raw line for every line that is not a valid record.
+    """
+    with _open(source) as file:
+        for line in file:
+            if line.strip():
+                try:
+                    item = json.loads(line)
+                    yield Record(item["cat"], item["action"], item.get("amount"))
+                except (ValueError, KeyError, TypeError, AttributeError) as error:
+                    yield ReplayError(line, ValueError(f"Invalid record: {error}"))
+
+
+def read_csv(source):
+    """
+    Streams records from a CSV log with the columns cat, action and amount.
+    A header row naming those columns is skipped.
+    Args:
+        source (str | os.PathLike | TextIO): The log file or an open text stream.
+    Yields:
+        Record | ReplayError: The records, in file order, and a ``ReplayError``
+        holding the raw row for every row that is not a valid record.
+    """
+    with _open(source) as file:
+        rows = csv.reader(file)
+        for row in rows:
+            if not row:
+                continue
+            if row[:2] == ["cat", "action"]:
+                continue
+            try:
+                amount = _amount(row[2] if len(row) > 2 else None)
+                yield Record(row[0], row[1], amount)
+            except (ValueError, IndexError) as error:
+                yield ReplayError(row, ValueError(f"Invalid record: {error}"))
+
+
+def chunked(records, size):
+    """
+    Groups a stream of records into lists of at most ``size`` records.
+    Yields:
+        list[Record]: The next chunk.
+    """
+    records = iter(records)
+    while chunk := list(islice(records, size)):
+        yield chunk
+
+
+def replay(records, cats, chunk_size=10_000):
+    """
+    Applies a stream of log records to cats, one chunk at a time.
+
+    Each chunk is grouped by cat so all of a cat's records in the chunk are applied
+    together, in log order. Only one chunk is held in memory at a time, so logs of
+    any size replay in constant memory.
+
+    Args:
+        records (Iterable[Record | ReplayError]): The records, for example from
+            ``read_jsonl``. Errors from the readers are passed through.
+        cats (Mapping[str, Cat]): The cats, by name.
+        chunk_size (int, optional): The number of records per chunk. Defaults to 10000.
+    Yields:
+        ReplayError: Every record that could not be read or applied: malformed
+        lines, unknown cats or actions, actions the cat cannot do, and amounts the
+        cat rejected with ValueError. The run continues after each error.
+    Example:
+        errors = list(replay(read_jsonl("shelter.jsonl"), cats_by_name))
+    """
+    for chunk in chunked(records, chunk_size):
+        by_cat = {}
+        for record in chunk:
+            if isinstance(record, ReplayError):
+                yield record
+                continue
+            by_cat.setdefault(record.cat, []).append(record)
+
+        for name, cat_records in by_cat.items():
+            cat = cats.get(name)
+            if cat is None:
+                error = KeyError(f"Unknown cat: {name}.")
+                for record in cat_records:
+                    yield ReplayError(record, error)
+                continue
+
+            for record in cat_records:
+                takes_amount = ACTIONS.get(record.action)
+                method = getattr(cat, record.action, None)
+                if takes_amount is None or method is None:
+                    yield ReplayError(
+                        record,
+                        ValueError(f"{name} cannot {record.action}."),
+                    )
+                    continue
+                try:
+                    if takes_amount:
+                        method(record.amount)
+                    else:
+                        method()
+                except (ValueError, TypeError) as error:
+                    yield ReplayError(record, error)
@@ -0,0 +1,129 @@
+import os
+from hashlib import blake2b
+from itertools import count
+
+# Increment of the SplitMix64 counter (the 64-bit golden ratio).
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+_MASK = (1 << 64) - 1
+
+# Seed of the streams created without an explicit seed, set by ``seed``.
+_global_seed = int.from_bytes(os.urandom(8), "little")
+
+# Source of the stream ids handed out by ``next_stream_id``, reset by ``seed``.
+_stream_ids = count()
+
+
+def seed(value=None):
+    """
+    Sets the global seed used by streams created without an explicit seed, and
+    restarts the stream ids, so cats created in the same order after the same
+    seed draw the same numbers.
+    Args:
+        value (int, optional): The seed. Defaults to a fresh random seed.
+    """
+    global _global_seed, _stream_ids
+    if value is None:
+        value = int.from_bytes(os.urandom(8), "little")
+    _global_seed = value & _MASK
+    _stream_ids = count()
+
+
+def next_stream_id():
+    """
+    Returns a stream id not handed out before in this process (since the last
+    ``seed``), so cats with the same name still get different streams.
+    """
+    return next(_stream_ids)
+
+
+def mix64(value):
+    """
+    Returns the SplitMix64 finalizer of a 64-bit integer.
+    """
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK
+    return value ^ (value >> 31)
+
+
+def cat_key(cat_id):
+    """
+    Returns the 64-bit key of a cat id: an integer (such as a position in a
+    population) or a string (such as a cat's name).
+    """
+    if isinstance(cat_id, str):
+        return int.from_bytes(
+            blake2b(cat_id.encode(), digest_size=8).digest(), "little"
+        )
+    return cat_id & _MASK
+
+
+def stream_base(cat_id, seed=None):
+    """
+    Returns the 64-bit base of the stream of a cat: draw n of the stream is
+    ``mix64(base + n * GOLDEN_GAMMA)`` modulo 2**64.
+    """
+    if seed is None:
+        seed = _global_seed
+    return mix64(mix64(seed & _MASK) ^ cat_key(cat_id))
+
+
+class CatStream:
+    """
+    A counter-based random stream owned by one cat.
+
+    The n-th draw of a stream is a hash of the seed, the cat id and n, so a stream
+    has no state besides its counter: any cat can be replayed on its own by
+    recreating its stream at the counter it had, and cats on different threads or
+    processes never share a generator. ``population.StreamBank`` draws the same
+    values for many cats at once.
+
+    Attributes:
+        counter (int): The number of draws made so far.
+
+    Methods:
+        random_raw(): Returns the next 64-bit draw.
+        randint(low, high): Returns the next integer between low and high inclusive.
+    """
+
+    __slots__ = ("_base", "counter")
+
+    def __init__(self, cat_id, seed=None, counter=0):
+        """
+        Initialize a CatStream.
+        Args:
+            cat_id (int | str): The id of the cat, such as its name.
+            seed (int, optional): The seed. Defaults to the global seed (see ``seed``).
+            counter (int, optional): The number of draws to skip. Defaults to 0.
+        """
+        self._base = stream_base(cat_id, seed)
+        self.counter = counter
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Recreates a stream from the ``(base, counter)`` pair returned by ``state``.
+        """
+        stream = cls.__new__(cls)
+        stream._base, stream.counter = state
+        return stream
+
+    def state(self):
+        """
+        Returns the stream as a ``(base, counter)`` pair of integers, the base
+        being the 64-bit hash of the seed and the cat id.
+        """
+        return self._base, self.counter
+
+    def random_raw(self):
+        """
+        Returns the next 64-bit draw of the stream.
+        """
+        self.counter += 1
+        return mix64((self._base + self.counter * GOLDEN_GAMMA) & _MASK)
+
+    def randint(self, low, high):
+        """
+        Returns the next integer between low and high inclusive, like ``random.randint``.
+        """
+        return low + ((self.random_raw() * (high - low + 1)) >> 64)
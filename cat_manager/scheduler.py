@@ -0,0 +1,159 @@
+import heapq
+from itertools import count
+from numbers import Real
+
+# Actions whose amount is a duration in minutes. Other actions happen instantly.
+TIMED_ACTIONS = ("play", "sleep")
+
+
+class Activity:
+    """
+    A cat activity queued on a ``Scheduler``.
+    Attributes:
+        start (float): The simulated minute the activity starts.
+        end (float): The simulated minute the activity finishes and takes effect.
+        cat (Cat): The cat doing the activity.
+        action (str): The name of the cat method to call, such as "play" or "hunt".
+        amount (int | None): The argument passed to the method, or None for
+            methods without one (``hunt``, ``rest``, ``meow``).
+        error (ValueError | None): The error raised by the method, if any.
+    """
+
+    __slots__ = ("start", "end", "cat", "action", "amount", "error")
+
+    def __init__(self, start, end, cat, action, amount=None):
+        self.start = start
+        self.end = end
+        self.cat = cat
+        self.action = action
+        self.amount = amount
+        self.error = None
+
+    def __repr__(self):
+        return (
+            f"Activity({self.cat.name!r}, {self.action!r}, {self.amount!r}, "
+            f"start={self.start}, end={self.end})"
+        )
+
+
+class Scheduler:
+    """
+    A discrete-event scheduler for timed cat activities.
+
+    Activities are kept in a heap ordered by the minute they finish. Advancing the
+    clock only pops the activities that are due, so idle cats cost nothing no matter
+    how far the clock jumps.
+
+    Attributes:
+        now (float): The current simulated minute.
+        errors (list[Activity]): Activities whose method raised ValueError.
+
+    Methods:
+        schedule(cat, action, amount=None, start=None): Queues an activity.
+        run_until(time): Applies every activity due up to the given minute.
+        advance(minutes): Moves the clock forward and applies due activities.
+
+    Behavior Rules:
+        - ``play`` and ``sleep`` last ``amount`` minutes and take effect when they end.
+        - ``eat``, ``hunt``, ``rest`` and ``meow`` take effect instantly.
+        - A cat does one activity at a time; new activities queue after the
+          activities the cat already has.
+        - Activities finishing at the same minute run in the order they were queued.
+        - A ValueError raised by an activity is recorded in ``errors`` instead of
+          stopping the simulation.
+    """
+
+    def __init__(self, start=0):
+        """
+        Initialize a Scheduler with an empty queue.
+        Args:
+            start (float, optional): The starting simulated minute. Defaults to 0.
+        """
+        self.now = start
+        self.errors = []
+        self._queue = []
+        self._order = count()
+        self._busy_until = {}
+
+    def __len__(self):
+        return len(self._queue)
+
+    def next_time(self):
+        """
+        Returns the minute the next activity finishes, or None if the queue is empty.
+        """
+        return self._queue[0][0] if self._queue else None
+
+    def schedule(self, cat, action, amount=None, start=None):
+        """
+        Queues an activity for a cat.
+        Args:
+            cat (Cat): The cat doing the activity.
+            action (str): The name of the cat method to call.
+            amount (int, optional): The argument of the method. For ``play`` and
+                ``sleep`` it is also the duration in minutes.
+            start (float, optional): The earliest minute the activity can start.
+                Defaults to now.
+        Returns:
+            Activity: The queued activity.
+        Raises:
+            ValueError: If the start is in the past.
+            ValueError: If a ``play`` or ``sleep`` duration is not a non-negative
+                number.
+            AttributeError: If the cat has no such action.
+        """
+        start = self.now if start is None else start
+        if start < self.now:
+            raise ValueError(f"Cannot schedule an activity in the past: {start}.")
+        getattr(cat, action)
+        if action in TIMED_ACTIONS and not (isinstance(amount, Real) and amount >= 0):
+            raise ValueError(
+                f"Invalid duration for {action}: {amount!r}. "
+                "It should be a non-negative number of minutes."
+            )
+
+        start = max(start, self._busy_until.get(cat, start))
+        end = start + amount if action in TIMED_ACTIONS else start
+        self._busy_until[cat] = end
+        activity = Activity(start, end, cat, action, amount)
+        heapq.heappush(self._queue, (end, next(self._order), activity))
+        return activity
+
+    def run_until(self, time):
+        """
+        Applies every activity that finishes at or before the given minute.
+        Args:
+            time (float): The minute to advance the clock to.
+        Returns:
+            list[Activity]: The activities applied, in the order they ran.
+        """
+        queue = self._queue
+        done = []
+        while queue and queue[0][0] <= time:
+            end, _, activity = heapq.heappop(queue)
+            self.now = end
+            cat = activity.cat
+            if self._busy_until.get(cat) == end:
+                del self._busy_until[cat]
+            method = getattr(cat, activity.action)
+            try:
+                if activity.amount is None:
+                    method()
+                else:
+                    method(activity.amount)
+            except ValueError as error:
+                activity.error = error
+                self.errors.append(activity)
+            done.append(activity)
+        self.now = max(self.now, time)
+        return done
+
+    def advance(self, minutes):
+        """
+        Moves the clock forward and applies every activity that becomes due.
+        Args:
+            minutes (float): How far to move the clock.
+        Returns:
+            list[Activity]: The activities applied, in the order they ran.
+        """
+        return self.run_until(self.now + minutes)
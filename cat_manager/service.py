@@ -0,0 +1,385 @@
+import asyncio
+import json
+
+import numpy as np
+
+from cat_manager.cat import WildCat
+from cat_manager.commands import command_rounds
+from cat_manager.population import (
+    SPECIES,
+    CatPopulation,
+    StreamBank,
+    eat_round,
+    hunt_round,
+    play_round,
+    sleep_round,
+)
+
+# Operations of the service, by request code.
+OPERATIONS = ("feed", "play", "sleep", "hunt", "status")
+
+# Hunt outcomes reported by ``CatService.hunt``, indexed by the outcome codes of
+# ``CatPopulation.hunt`` (``HUNT_SKIPPED`` to ``HUNT_CAUGHT``).
+HUNT_OUTCOMES = ("not_hungry", "rested", "failed", "caught")
+
+
+class CatService:
+    """
+    An asyncio front end that applies cat requests in micro-batches.
+
+    Requests are not applied when they arrive. They are queued, and the queue is
+    flushed once the event loop has handled every request that arrived together
+    (or after ``batch_delay``, or as soon as ``max_batch`` requests wait). A flush
+    applies the whole queue to a ``CatPopulation`` with the vectorized kernels:
+    all the requests for one cat are coalesced into one update of its state, in
+    arrival order, and the requests of every cat are applied together.
+
+    Attributes:
+        population (CatPopulation): The cats served.
+        batch_delay (float): Seconds to wait for more requests before a flush.
+        max_batch (int): The queue length that triggers a flush right away.
+
+    Methods:
+        feed(name, food), play(name, time), sleep(name, time): Update a cat.
+        hunt(name): Runs one hunt for a wild cat.
+        status(name): Reads a cat's state.
+        start_server(host, port): Serves JSON Lines requests over TCP.
+
+    Behavior Rules:
+        - Every request returns the cat's state right after that request:
+          ``{"name": ..., "energy": ..., "hunger": ...}``, plus ``"outcome"``
+          ("not_hungry", "rested", "failed" or "caught") for hunts.
+        - Invalid amounts raise ValueError before the request is queued.
+        - Sleeping at full energy raises ValueError from the request, and the other
+          requests of the batch are not affected.
+        - Every cat hunts with its own random stream, keyed by its position in the
+          population, and with the rules of its own class, so its hunts only
+          depend on the seed and its own requests, not on how they are batched.
+        - If applying a batch fails unexpectedly, the cats of the batch are left
+          as they were and every request of the batch raises the error.
+    """
+
+    def __init__(
+        self, population, batch_delay=0.0, max_batch=10_000, seed=None, classes=None
+    ):
+        """
+        Initialize a CatService.
+        Args:
+            population (CatPopulation): The cats to serve, looked up by name.
+            batch_delay (float, optional): Seconds to wait for more requests before
+                a flush. Defaults to 0, which flushes on the next loop iteration.
+            max_batch (int, optional): The queue length that triggers a flush.
+                Defaults to 10000.
+            seed (int, optional): The seed of the cats' hunt streams. Defaults to
+                the global seed (see ``rng.seed``).
+            classes (Sequence[type], optional): The class of every cat, whose hunt
+                rules apply. Defaults to the classes of the population's species.
+        Raises:
+            ValueError: If two cats have the same name.
+        """
+        self.population = population
+        self.batch_delay = batch_delay
+        self.max_batch = max_batch
+        self._positions = {name: index for index, name in enumerate(population.names)}
+        if len(self._positions) != len(population):
+            raise ValueError("Every cat served must have a unique name.")
+        if classes is None:
+            classes = [SPECIES[code] for code in population.species]
+        # Distinct classes of the cats, and the index of every cat's class.
+        self._classes = list(dict.fromkeys(classes))
+        self._class_codes = np.array(
+            [self._classes.index(cat_class) for cat_class in classes], dtype=np.int64
+        )
+        self._streams = StreamBank(range(len(population)), seed)
+        self._queue = []
+        self._flush_handle = None
+
+    @classmethod
+    def from_cats(cls, cats, **options):
+        """
+        Builds a service for ``Cat`` objects, copied into a ``CatPopulation``.
+        Wild cats hunt with the rules of their own class.
+        """
+        cats = list(cats)
+        return cls(
+            CatPopulation.from_cats(cats),
+            classes=[type(cat) for cat in cats],
+            **options,
+        )
+
+    async def feed(self, name, food):
+        """
+        Feeds a cat, like ``Cat.eat``.
+        Raises:
+            KeyError: If no cat has this name.
+            ValueError: If the food level is not between 0 and 100.
+        """
+        if not 0 <= food <= 100:
+            raise ValueError(
+                f"Invalid food level: {food}. The level should be between 0 and 100."
+            )
+        return await self._submit(name, "feed", food)
+
+    async def play(self, name, time):
+        """
+        Lets a cat play, like ``Cat.play``.
+        Raises:
+            KeyError: If no cat has this name.
+            ValueError: If the time is not between 0 and 100.
+        """
+        if not 0 <= time <= 100:
+            raise ValueError(
+                "Invalid time level. The time should be between 0 and 100 minutes."
+            )
+        return await self._submit(name, "play", time)
+
+    async def sleep(self, name, time):
+        """
+        Makes a cat sleep, like ``Cat.sleep``.
+        Raises:
+            KeyError: If no cat has this name.
+            ValueError: If the time is not between 0 and 100, or the cat is already
+                at full energy when its turn comes.
+        """
+        if not 0 <= time <= 100:
+            raise ValueError(
+                f"Invalid time level: {time}. The time should be between 0 and 100 minutes."
+            )
+        return await self._submit(name, "sleep", time)
+
+    async def hunt(self, name):
+        """
+        Runs one hunt for a wild cat, like ``WildCat.hunt``.
+        Raises:
+            KeyError: If no cat has this name.
+            ValueError: If the cat is not a wild cat.
+        """
+        cat_class = self._classes[self._class_codes[self._positions[name]]]
+        if not issubclass(cat_class, WildCat):
+            raise ValueError(f"{name} is not a wild cat and cannot hunt.")
+        return await self._submit(name, "hunt", 0)
+
+    async def status(self, name):
+        """
+        Returns a cat's state once every request queued before this one is applied.
+        Raises:
+            KeyError: If no cat has this name.
+        """
+        return await self._submit(name, "status", 0)
+
+    def _submit(self, name, operation, amount):
+        position = self._positions[name]
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((position, OPERATIONS.index(operation), amount, future))
+        if len(self._queue) >= self.max_batch:
+            self.flush()
+        elif self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            if self.batch_delay:
+                self._flush_handle = loop.call_later(self.batch_delay, self.flush)
+            else:
+                self._flush_handle = loop.call_soon(self.flush)
+        return future
+
+    def flush(self):
+        """
+        Applies every queued request now and resolves their results.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        queue, self._queue = self._queue, []
+        if not queue:
+            return
+
+        cats = np.array([request[0] for request in queue], dtype=np.int64)
+        operations = np.array([request[1] for request in queue], dtype=np.int8)
+        amounts = np.array([request[2] for request in queue], dtype=np.float64)
+        energy, hunger = self.population.energy, self.population.hunger
+        saved = energy[cats], hunger[cats], self._streams.counters[cats]
+        try:
+            energy_after, hunger_after, outcomes, rejected = self._apply(
+                cats, operations, amounts
+            )
+        except Exception as error:
+            energy[cats], hunger[cats], self._streams.counters[cats] = saved
+            for *_, future in queue:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        names = self.population.names
+        for index, (position, operation, _, future) in enumerate(queue):
+            if future.done():
+                continue
+            if rejected[index]:
+                future.set_exception(
+                    ValueError("The cat is too energetic to sleep now.")
+                )
+                continue
+            result = {
+                "name": names[position],
+                "energy": int(energy_after[index]),
+                "hunger": int(hunger_after[index]),
+            }
+            if operation == OPERATIONS.index("hunt"):
+                result["outcome"] = HUNT_OUTCOMES[outcomes[index]]
+            future.set_result(result)
+
+    def _apply(self, cats, operations, amounts):
+        """
+        Applies queued requests in place, in rounds that touch each cat once.
+        Returns:
+            tuple: The energy, hunger and hunt outcome after every request, and a
+            mask of the sleep requests rejected at full energy.
+        """
+        energy_after = np.empty(len(cats), dtype=np.uint8)
+        hunger_after = np.empty(len(cats), dtype=np.uint8)
+        outcomes = np.zeros(len(cats), dtype=np.int8)
+        rejected = np.zeros(len(cats), dtype=bool)
+        energy, hunger = self.population.energy, self.population.hunger
+
+        for requests in command_rounds(cats):
+            round_cats = cats[requests]
+            round_operations = operations[requests]
+            round_energy = energy[round_cats]
+            round_hunger = hunger[round_cats]
+
+            too_energetic = round_operations == OPERATIONS.index("sleep")
+            too_energetic &= round_energy >= 100
+            rejected[requests[too_energetic]] = True
+
+            for code, kernel in enumerate(_KERNELS):
+                chosen = (round_operations == code) & ~too_energetic
+                if not chosen.any():
+                    continue
+                chosen_energy = round_energy[chosen]
+                chosen_hunger = round_hunger[chosen]
+                result = kernel(
+                    self,
+                    chosen_energy,
+                    chosen_hunger,
+                    amounts[requests[chosen]],
+                    round_cats[chosen],
+                )
+                if result is not None:
+                    outcomes[requests[chosen]] = result
+                round_energy[chosen] = chosen_energy
+                round_hunger[chosen] = chosen_hunger
+
+            energy[round_cats] = round_energy
+            hunger[round_cats] = round_hunger
+            energy_after[requests] = round_energy
+            hunger_after[requests] = round_hunger
+        return energy_after, hunger_after, outcomes, rejected
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serves one client of ``start_server``: every line is a JSON request such as
+        ``{"id": 1, "op": "feed", "cat": "Tom", "amount": 10}``, answered by a line
+        ``{"id": 1, "ok": true, "result": {...}}`` or
+        ``{"id": 1, "ok": false, "error": "..."}``. Requests of one connection are
+        handled concurrently, so responses can come back out of order.
+        Lines that are not valid requests (not JSON, not an object, a missing
+        key or a non-numeric amount) get an error response like any other.
+        """
+        pending = set()
+        lock = asyncio.Lock()
+
+        async def respond(line):
+            request = None
+            try:
+                request = json.loads(line)
+                result = await self._dispatch(request)
+                response = {"ok": True, "result": result}
+            except ValueError as error:
+                response = {"ok": False, "error": str(error)}
+            request_id = request.get("id") if isinstance(request, dict) else None
+            response = {"id": request_id, **response}
+            async with lock:
+                writer.write((json.dumps(response) + "\n").encode())
+                await writer.drain()
+
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(respond(line))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            writer.close()
+
+    def _dispatch(self, request):
+        if not isinstance(request, dict):
+            raise ValueError("A request must be a JSON object.")
+        operation = request.get("op")
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {operation}.")
+        keys = ("cat", "amount") if operation in ("feed", "play", "sleep") else ("cat",)
+        missing = [key for key in keys if key not in request]
+        if missing:
+            raise ValueError(f"Missing key in {operation} request: {missing[0]}.")
+        name = request["cat"]
+        if not isinstance(name, str):
+            raise ValueError(f"Invalid cat name: {name!r}. It should be a string.")
+        if name not in self._positions:
+            raise ValueError(f"Unknown cat: {name}.")
+        if len(keys) == 1:
+            return getattr(self, operation)(name)
+        amount = request["amount"]
+        if isinstance(amount, bool) or not isinstance(amount, (int, float)):
+            raise ValueError(f"Invalid amount: {amount!r}. It should be a number.")
+        return getattr(self, operation)(name, amount)
+
+    async def start_server(self, host="127.0.0.1", port=0):
+        """
+        Starts serving JSON Lines requests over TCP (see ``handle_connection``).
+        Args:
+            host (str, optional): The address to listen on. Defaults to localhost.
+            port (int, optional): The port. Defaults to any free port.
+        Returns:
+            asyncio.Server: The running server.
+        """
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+
+def _feed_kernel(service, energy, hunger, food, cats):
+    eat_round(energy, hunger, food)
+
+
+def _play_kernel(service, energy, hunger, time, cats):
+    play_round(energy, hunger, time)
+
+
+def _sleep_kernel(service, energy, hunger, time, cats):
+    sleep_round(energy, time)
+
+
+def _hunt_kernel(service, energy, hunger, amount, cats):
+    # Every cat draws from its own stream, with the rules of its own class.
+    outcome = np.empty(len(cats), dtype=np.int8)
+    class_codes = service._class_codes[cats]
+    for code in np.unique(class_codes):
+        chosen = np.flatnonzero(class_codes == code)
+        chosen_energy = energy[chosen]
+        chosen_hunger = hunger[chosen]
+        outcome[chosen], _ = hunt_round(
+            chosen_energy,
+            chosen_hunger,
+            service._streams.select(cats[chosen]),
+            service._classes[code],
+        )
+        energy[chosen] = chosen_energy
+        hunger[chosen] = chosen_hunger
+    return outcome
+
+
+def _status_kernel(service, energy, hunger, amount, cats):
+    pass
+
+
+# Vectorized kernels by operation code.
+_KERNELS = (_feed_kernel, _play_kernel, _sleep_kernel, _hunt_kernel, _status_kernel)
@@ -0,0 +1,268 @@
+import struct
+from functools import cached_property
+
+import numpy as np
+
+from cat_manager.population import SPECIES, CatPopulation
+
+MAGIC = b"PCATSNAP"
+VERSION = 1
+
+# Columns in file order, with their on-disk dtypes, little-endian like the header.
+# Names and colors are stored as offsets into a UTF-8 string heap; each cat's color
+# is a code into the color table.
+COLUMNS = (
+    ("name_offsets", "<u8"),
+    ("name_heap", "u1"),
+    ("color_offsets", "<u8"),
+    ("color_heap", "u1"),
+    ("age", "<u2"),
+    ("color", "<u2"),
+    ("species", "u1"),
+    ("energy", "u1"),
+    ("hunger", "u1"),
+)
+
+# Magic, version, number of cats, number of colors, then (offset, length) per column.
+HEADER = struct.Struct("<8sIQI" + "QQ" * len(COLUMNS))
+
+# Every column starts on a multiple of this many bytes.
+ALIGNMENT = 8
+
+
+def _string_heap(strings):
+    """
+    Encodes strings as UTF-8 and returns their offsets and the concatenated heap.
+    """
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.uint64)
+    np.cumsum(np.fromiter(map(len, encoded), np.uint64, len(encoded)), out=offsets[1:])
+    return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def save_snapshot(path, population):
+    """
+    Writes a population to a binary snapshot file.
+    Args:
+        path (str | os.PathLike): The file to write.
+        population (CatPopulation | Iterable[Cat]): The cats to save.
+    Raises:
+        ValueError: If an age does not fit in the snapshot's 16-bit age column,
+            or there are more than 65536 distinct colors.
+    """
+    if not isinstance(population, CatPopulation):
+        population = CatPopulation.from_cats(population)
+
+    if (
+        len(population)
+        and not 0 <= population.age.min() <= population.age.max() <= 0xFFFF
+    ):
+        raise ValueError("Invalid age. The age should be between 0 and 65535 years.")
+    color_table, color_codes = np.unique(
+        np.array(population.colors, dtype=object), return_inverse=True
+    )
+    if len(color_table) > 0x10000:
+        raise ValueError("A snapshot can hold at most 65536 distinct colors.")
+
+    name_offsets, name_heap = _string_heap(population.names)
+    color_offsets, color_heap = _string_heap(color_table.tolist())
+    arrays = {
+        "name_offsets": name_offsets,
+        "name_heap": name_heap,
+        "color_offsets": color_offsets,
+        "color_heap": color_heap,
+        "age": population.age,
+        "color": color_codes,
+        "species": population.species,
+        "energy": population.energy,
+        "hunger": population.hunger,
+    }
+
+    directory = []
+    position = HEADER.size
+    for column, dtype in COLUMNS:
+        position += -position % ALIGNMENT
+        length = len(arrays[column]) * np.dtype(dtype).itemsize
+        directory += [position, length]
+        position += length
+
+    with open(path, "wb") as file:
+        file.write(
+            HEADER.pack(MAGIC, VERSION, len(population), len(color_table), *directory)
+        )
+        for index, (column, dtype) in enumerate(COLUMNS):
+            file.write(b"\0" * (directory[2 * index] - file.tell()))
+            file.write(np.ascontiguousarray(arrays[column], dtype=dtype).tobytes())
+
+
+def load_snapshot(path):
+    """
+    Opens a snapshot file without reading its columns.
+    Args:
+        path (str | os.PathLike): The snapshot file.
+    Returns:
+        Snapshot: The memory-mapped snapshot.
+    Raises:
+        ValueError: If the file is not a snapshot or has an unsupported version.
+    """
+    return Snapshot(path)
+
+
+class Snapshot:
+    """
+    A memory-mapped, read-only view of a snapshot file.
+
+    Opening a snapshot only reads its header. Each column is memory-mapped the first
+    time it is used and read lazily by the operating system, so even very large
+    snapshots open in milliseconds and no column is copied into memory.
+
+    Attributes:
+        path (str | os.PathLike): The snapshot file.
+        colors (list[str]): The distinct fur colors, indexed by color code.
+        age, color, species, energy, hunger (numpy.memmap): The mapped columns.
+
+    Methods:
+        name(index): Returns the name of one cat.
+        where(**ranges): Returns the indices of the cats within value ranges.
+        to_population(): Copies the snapshot into a CatPopulation.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize a Snapshot by reading the header of the file.
+        Args:
+            path (str | os.PathLike): The snapshot file.
+        Raises:
+            ValueError: If the file is not a snapshot or has an unsupported version.
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+        if len(header) < HEADER.size or header[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a cat snapshot: {path}.")
+        magic, version, self._count, self._color_count, *directory = HEADER.unpack(
+            header
+        )
+        if version != VERSION:
+            raise ValueError(f"Unsupported snapshot version: {version}.")
+        self._directory = {
+            column: (dtype, directory[2 * index], directory[2 * index + 1])
+            for index, (column, dtype) in enumerate(COLUMNS)
+        }
+
+    def __len__(self):
+        return self._count
+
+    def _map(self, column):
+        dtype, offset, length = self._directory[column]
+        if not length:
+            return np.zeros(0, dtype=dtype)
+        count = length // np.dtype(dtype).itemsize
+        return np.memmap(self.path, dtype, mode="r", offset=offset, shape=(count,))
+
+    @cached_property
+    def age(self):
+        return self._map("age")
+
+    @cached_property
+    def color(self):
+        return self._map("color")
+
+    @cached_property
+    def species(self):
+        return self._map("species")
+
+    @cached_property
+    def energy(self):
+        return self._map("energy")
+
+    @cached_property
+    def hunger(self):
+        return self._map("hunger")
+
+    @cached_property
+    def _name_offsets(self):
+        return self._map("name_offsets")
+
+    @cached_property
+    def _name_heap(self):
+        return self._map("name_heap")
+
+    @cached_property
+    def colors(self):
+        offsets = self._map("color_offsets")
+        heap = self._map("color_heap").tobytes()
+        return [
+            heap[offsets[index] : offsets[index + 1]].decode("utf-8")
+            for index in range(self._color_count)
+        ]
+
+    def name(self, index):
+        """
+        Returns the name of the cat at the given index.
+        """
+        start, stop = self._name_offsets[index : index + 2]
+        return self._name_heap[start:stop].tobytes().decode("utf-8")
+
+    def __getitem__(self, index):
+        """
+        Returns a ``Cat`` object holding the state of the cat at the given index.
+        """
+        cat_class = SPECIES[self.species[index]]
+        return cat_class(
+            self.name(index),
+            int(self.age[index]),
+            self.colors[self.color[index]],
+            int(self.energy[index]),
+            int(self.hunger[index]),
+        )
+
+    def where(self, **ranges):
+        """
+        Returns the indices of the cats whose columns fall within inclusive ranges.
+        Only the columns used by the query are read from the file.
+        Args:
+            **ranges: ``column=(low, high)`` pairs for ``age``, ``energy`` and
+                ``hunger``, ``species=cat_class`` and ``color=color_name``.
+        Returns:
+            numpy.ndarray: The matching indices, in increasing order.
+        Raises:
+            ValueError: If a column cannot be queried.
+        Example:
+            snapshot.where(species=WildCat, energy=(0, 30), hunger=(80, 100))
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for column, value in ranges.items():
+            if column == "species":
+                mask &= self.species == SPECIES.index(value)
+            elif column == "color":
+                if value not in self.colors:
+                    return np.zeros(0, dtype=np.int64)
+                mask &= self.color == self.colors.index(value)
+            elif column in ("age", "energy", "hunger"):
+                low, high = value
+                values = getattr(self, column)
+                mask &= (values >= low) & (values <= high)
+            else:
+                raise ValueError(f"Cannot query snapshot column: {column}.")
+        return np.flatnonzero(mask)
+
+    def to_population(self):
+        """
+        Copies the whole snapshot into a ``CatPopulation``.
+        """
+        heap = self._name_heap.tobytes()
+        offsets = self._name_offsets.tolist()
+        names = [
+            heap[offsets[index] : offsets[index + 1]].decode("utf-8")
+            for index in range(len(self))
+        ]
+        colors = self.colors
+        return CatPopulation(
+            names,
+            self.age,
+            [colors[code] for code in self.color.tolist()],
+            species=self.species,
+            energy=self.energy,
+            hunger=self.hunger,
+        )
@@ -0,0 +1,180 @@
+# Metrics tracked by ``PopulationStats``, with one histogram bin per level 0 to 100.
+STAT_METRICS = ("energy", "hunger")
+
+# Prey sizes counted by ``PopulationStats.hunts``.
+PREY_SIZES = ("small", "medium", "large")
+
+# Number of energy or hunger levels, 0 to 100.
+LEVELS = 101
+
+
+class PopulationStats:
+    """
+    Aggregates of a group of cats, kept up to date as the cats change.
+
+    The aggregates watch every cat they hold, so the sums, the histograms of
+    energy and hunger and the hunt counters are updated in constant time whenever
+    eat, play, sleep, rest, a hunt or a fast-forward changes a cat. Queries never
+    walk the cats: means are read from the sums, and percentiles from the fixed
+    101-bin histograms.
+
+    Attributes:
+        rests (int): The number of rests taken by the cats.
+
+    Methods:
+        add(cat): Adds a cat and starts watching it.
+        remove(cat): Removes a cat and stops watching it.
+        refresh(cat): Re-reads a cat after a direct assignment to energy or hunger.
+        mean(metric): The mean energy or hunger.
+        histogram(metric): The number of cats at every energy or hunger level.
+        percentile(metric, percent): A percentile of energy or hunger.
+        hunts(prey_size): Hunts and catches for one prey size.
+        success_rate(prey_size): The fraction of hunts that caught their prey.
+
+    Behavior Rules:
+        - ``metric`` is "energy" or "hunger".
+        - Hunts and rests are counted from the moment a cat is added; removing a
+          cat does not forget them.
+        - Assigning ``cat.energy`` or ``cat.hunger`` directly is not observed;
+          call ``refresh(cat)`` afterwards.
+    """
+
+    def __init__(self, cats=()):
+        """
+        Initialize PopulationStats.
+        Args:
+            cats (Iterable[Cat], optional): The cats to add, for example a
+                ``CatRegistry``.
+        """
+        self._levels = {}
+        self._sums = dict.fromkeys(STAT_METRICS, 0)
+        self._histograms = {metric: [0] * LEVELS for metric in STAT_METRICS}
+        self._hunts = {size: [0, 0] for size in PREY_SIZES}
+        self.rests = 0
+        for cat in cats:
+            self.add(cat)
+
+    def __len__(self):
+        return len(self._levels)
+
+    def __contains__(self, cat):
+        return cat in self._levels
+
+    def add(self, cat):
+        """
+        Adds a cat to the aggregates and starts watching it.
+        Raises:
+            ValueError: If the cat is already counted.
+        """
+        if cat in self._levels:
+            raise ValueError(f"{cat.name} is already counted.")
+        self._count(cat.energy, cat.hunger, 1)
+        self._levels[cat] = cat.energy, cat.hunger
+        cat.watch(self._on_change)
+
+    def remove(self, cat):
+        """
+        Removes a cat from the aggregates and stops watching it.
+        Raises:
+            KeyError: If the cat is not counted.
+        """
+        self._count(*self._levels.pop(cat), -1)
+        cat.unwatch(self._on_change)
+
+    def refresh(self, cat):
+        """
+        Re-reads a cat whose energy or hunger was assigned directly.
+        """
+        self._count(*self._levels[cat], -1)
+        self._count(cat.energy, cat.hunger, 1)
+        self._levels[cat] = cat.energy, cat.hunger
+
+    def _count(self, energy, hunger, sign):
+        self._sums["energy"] += sign * energy
+        self._sums["hunger"] += sign * hunger
+        self._histograms["energy"][energy] += sign
+        self._histograms["hunger"][hunger] += sign
+
+    def _on_change(self, cat, action, old_energy, old_hunger, detail):
+        if action == "hunt":
+            prey_size, success = detail
+            counters = self._hunts.setdefault(prey_size, [0, 0])
+            counters[0] += 1
+            counters[1] += bool(success)
+        elif action == "rest":
+            self.rests += 1
+        levels = self._levels[cat]
+        energy, hunger = cat.energy, cat.hunger
+        if levels != (energy, hunger):
+            self._count(*levels, -1)
+            self._count(energy, hunger, 1)
+            self._levels[cat] = energy, hunger
+
+    def mean(self, metric):
+        """
+        Returns the mean energy or hunger of the cats.
+        Raises:
+            ValueError: If there are no cats.
+        """
+        if not self._levels:
+            raise ValueError("Cannot compute the mean of no cats.")
+        return self._sums[metric] / len(self._levels)
+
+    def histogram(self, metric):
+        """
+        Returns the number of cats at every energy or hunger level, 0 to 100.
+        """
+        return list(self._histograms[metric])
+
+    def percentile(self, metric, percent):
+        """
+        Returns a percentile of energy or hunger, by the nearest-rank method.
+        Args:
+            metric (str): "energy" or "hunger".
+            percent (float): The percentile, between 0 and 100.
+        Returns:
+            int: The lowest level with at least ``percent`` percent of the cats at
+            or below it.
+        Raises:
+            ValueError: If there are no cats, or the percentile is not between 0 and 100.
+        """
+        if not self._levels:
+            raise ValueError("Cannot compute a percentile of no cats.")
+        return histogram_percentile(self._histograms[metric], percent)
+
+    def hunts(self, prey_size):
+        """
+        Returns the number of hunts and of catches for a prey size.
+        Returns:
+            tuple[int, int]: The hunts and the successful ones, zeros for a prey
+            size never hunted.
+        """
+        return tuple(self._hunts.get(prey_size, (0, 0)))
+
+    def success_rate(self, prey_size):
+        """
+        Returns the fraction of hunts for a prey size that caught it, or None if
+        there were no such hunts.
+        """
+        hunts, caught = self.hunts(prey_size)
+        return caught / hunts if hunts else None
+
+
+def histogram_percentile(histogram, percent):
+    """
+    Returns a percentile of the levels counted by a histogram, by the nearest-rank
+    method: the lowest level with at least ``percent`` percent of the counts at or
+    below it.
+    Raises:
+        ValueError: If the percentile is not between 0 and 100.
+    """
+    if not 0 <= percent <= 100:
+        raise ValueError(
+            f"Invalid percentile: {percent}. It should be between 0 and 100."
+        )
+    rank = max(1, -(-percent * sum(histogram) // 100))
+    seen = 0
+    for level, count in enumerate(histogram):
+        seen += count
+        if seen >= rank:
+            return level
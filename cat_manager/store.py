@@ -0,0 +1,258 @@
+import sqlite3
+from collections import OrderedDict
+
+from cat_manager.cat import Cat, DomesticCat, WildCat
+from cat_manager.rng import CatStream
+
+# Cat classes a store can hold, by the name saved in the database.
+CAT_CLASSES = {
+    cat_class.__name__: cat_class for cat_class in (Cat, DomesticCat, WildCat)
+}
+
+_MASK = (1 << 64) - 1
+
+# Columns added to the schema after its first version, migrated on open.
+_STREAM_COLUMNS = ("stream_base", "stream_counter")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cats (
+    name TEXT PRIMARY KEY,
+    species TEXT NOT NULL,
+    age INTEGER NOT NULL,
+    color TEXT NOT NULL,
+    energy INTEGER NOT NULL,
+    hunger INTEGER NOT NULL,
+    stream_base INTEGER,
+    stream_counter INTEGER
+)
+"""
+
+
+class CatStore:
+    """
+    A catalog of cats kept in a SQLite database, with the hot cats cached in memory.
+
+    Cats are loaded on first access and kept in a bounded least-recently-used
+    cache. The store watches every cached cat, so eat, play, sleep, rest and hunt
+    mark it dirty. Only dirty cats are written back, in one transaction per
+    ``write_batch`` dirty cats (or on ``flush``), and a dirty cat evicted from the
+    cache is written back as it leaves.
+
+    Attributes:
+        path (str): The database file, or ":memory:".
+        capacity (int): The most cats kept in memory.
+        write_batch (int): The number of dirty cats that triggers a write-back.
+
+    Methods:
+        add(cat): Adds a new cat to the catalog.
+        get(name): Returns a cat, loading it if needed.
+        remove(name): Deletes a cat from the catalog.
+        flush(): Writes every dirty cat back in one transaction.
+        close(): Flushes and closes the database.
+        stats(): Cache hits, misses, evictions and rows written.
+
+    Behavior Rules:
+        - The ``CatStream`` of a wild cat is saved with it, base and counter, so a
+          reloaded cat continues its random draws instead of repeating them. Other
+          random streams assigned to ``rng`` are not saved.
+        - Direct assignments to energy or hunger are not observed; call
+          ``mark_dirty(cat)`` afterwards.
+        - A cat object must not be used after it was evicted: ``get`` the cat
+          again instead, which may load a new object.
+    """
+
+    def __init__(self, path=":memory:", capacity=10_000, write_batch=1_000):
+        """
+        Initialize a CatStore, creating the database table if needed.
+        Args:
+            path (str | os.PathLike, optional): The database file. Defaults to an
+                in-memory database.
+            capacity (int, optional): The most cats kept in memory. Defaults to 10000.
+            write_batch (int, optional): The number of dirty cats that triggers a
+                write-back. Defaults to 1000.
+        """
+        self.path = path
+        self.capacity = capacity
+        self.write_batch = write_batch
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(_SCHEMA)
+        self._migrate()
+        self._connection.commit()
+        self._cache = OrderedDict()
+        self._dirty = {}
+        self._hits = self._misses = self._evictions = self._rows_written = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self._connection.execute("SELECT COUNT(*) FROM cats").fetchone()[0]
+
+    def __iter__(self):
+        """
+        Iterates over the names of the cats, in the order they were added.
+        """
+        self.flush()
+        rows = self._connection.execute("SELECT name FROM cats ORDER BY rowid")
+        return (name for (name,) in rows.fetchall())
+
+    def __contains__(self, name):
+        return name in self._cache or self._row(name) is not None
+
+    def add(self, cat):
+        """
+        Adds a new cat to the catalog and caches it.
+        Raises:
+            ValueError: If a cat with the same name is already in the catalog.
+            ValueError: If the cat's class is not one of ``CAT_CLASSES``.
+        """
+        species = type(cat).__name__
+        if CAT_CLASSES.get(species) is not type(cat):
+            raise ValueError(f"Cannot store cats of class {species}.")
+        try:
+            self._connection.execute(
+                "INSERT INTO cats VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (cat.name, species, cat.age, cat.color, cat.energy, cat.hunger)
+                + _stream_state(cat),
+            )
+        except sqlite3.IntegrityError:
+            raise ValueError(f"{cat.name} is already in the store.") from None
+        self._rows_written += 1
+        self._cache_cat(cat)
+
+    def get(self, name):
+        """
+        Returns the cat with this name, from the cache or from the database.
+        Raises:
+            KeyError: If no cat has this name.
+        """
+        cat = self._cache.get(name)
+        if cat is not None:
+            self._hits += 1
+            self._cache.move_to_end(name)
+            return cat
+
+        self._misses += 1
+        row = self._row(name)
+        if row is None:
+            raise KeyError(name)
+        species, age, color, energy, hunger, base, counter = row
+        cat = CAT_CLASSES[species](name, age, color, energy, hunger)
+        if base is not None:
+            cat.rng = CatStream.from_state((base & _MASK, counter))
+        self._cache_cat(cat)
+        return cat
+
+    def remove(self, name):
+        """
+        Deletes a cat from the catalog.
+        Raises:
+            KeyError: If no cat has this name.
+        """
+        if name not in self:
+            raise KeyError(name)
+        cat = self._cache.pop(name, None)
+        if cat is not None:
+            cat.unwatch(self._on_change)
+        self._dirty.pop(name, None)
+        self._connection.execute("DELETE FROM cats WHERE name = ?", (name,))
+        self._connection.commit()
+
+    def mark_dirty(self, cat):
+        """
+        Marks a cached cat for write-back after a direct assignment.
+        """
+        self._on_change(cat)
+
+    def flush(self):
+        """
+        Writes every dirty cat back to the database in one transaction.
+        """
+        self._write(list(self._dirty.values()))
+        self._dirty.clear()
+
+    def close(self):
+        """
+        Flushes the dirty cats and closes the database.
+        """
+        self.flush()
+        for cat in self._cache.values():
+            cat.unwatch(self._on_change)
+        self._cache.clear()
+        self._connection.close()
+
+    def stats(self):
+        """
+        Returns the cache and write-back counters.
+        Returns:
+            dict: ``cached``, ``dirty``, ``hits``, ``misses``, ``evictions`` and
+            ``rows_written``.
+        """
+        return {
+            "cached": len(self._cache),
+            "dirty": len(self._dirty),
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "rows_written": self._rows_written,
+        }
+
+    def _migrate(self):
+        # Databases created before random streams were saved lack their columns.
+        columns = {
+            row[1] for row in self._connection.execute("PRAGMA table_info(cats)")
+        }
+        for column in _STREAM_COLUMNS:
+            if column not in columns:
+                self._connection.execute(
+                    f"ALTER TABLE cats ADD COLUMN {column} INTEGER"
+                )
+
+    def _row(self, name):
+        return self._connection.execute(
+            "SELECT species, age, color, energy, hunger, stream_base, stream_counter"
+            " FROM cats WHERE name = ?",
+            (name,),
+        ).fetchone()
+
+    def _cache_cat(self, cat):
+        self._cache[cat.name] = cat
+        cat.watch(self._on_change)
+        evicted = []
+        while len(self._cache) > self.capacity:
+            name, old = self._cache.popitem(last=False)
+            old.unwatch(self._on_change)
+            self._evictions += 1
+            if self._dirty.pop(name, None) is not None:
+                evicted.append(old)
+        if evicted:
+            self._write(evicted)
+
+    def _on_change(self, cat, *change):
+        self._dirty[cat.name] = cat
+        if len(self._dirty) >= self.write_batch:
+            self.flush()
+
+    def _write(self, cats):
+        with self._connection:
+            self._connection.executemany(
+                "UPDATE cats SET energy = ?, hunger = ?, stream_base = ?,"
+                " stream_counter = ? WHERE name = ?",
+                [
+                    (cat.energy, cat.hunger, *_stream_state(cat), cat.name)
+                    for cat in cats
+                ],
+            )
+        self._rows_written += len(cats)
+
+
+def _stream_state(cat):
+    # SQLite integers are signed, so the 64-bit base is stored two's complement.
+    stream = cat.rng if isinstance(cat, WildCat) else None
+    if not isinstance(stream, CatStream):
+        return None, None
+    base, counter = stream.state()
+    return base - (1 << 64) if base >> 63 else base, counter
@@ -0,0 +1,193 @@
+import threading
+from contextlib import contextmanager
+
+# Default number of lock stripes of a ``ConcurrentRegistry``.
+DEFAULT_STRIPES = 1024
+
+
+class _Entry:
+    """
+    A registered cat with its lock stripe and update sequence number.
+    """
+
+    __slots__ = ("cat", "lock", "sequence")
+
+    def __init__(self, cat, lock):
+        self.cat = cat
+        self.lock = lock
+        self.sequence = 0
+
+
+class ConcurrentRegistry:
+    """
+    A registry of cats, by name, that many threads can update safely.
+
+    ``Cat.eat``, ``Cat.play``, ``Cat.sleep``, ``WildCat.rest`` and
+    ``WildCat.process_hunt_result`` read the cat's state and write it back, so two
+    threads updating the same cat at once can lose an update. The registry guards
+    every cat with a lock taken from a fixed pool of stripes. Stripes are handed
+    out in turn as cats are added, so as long as there are no more cats than
+    stripes, updates to different cats never wait for each other, while updates to
+    the same cat are serialized.
+
+    Attributes:
+        stripes (int): The number of locks shared by the cats.
+
+    Methods:
+        add(cat): Adds a cat.
+        remove(name): Removes a cat.
+        get(name): Returns a cat, for reading.
+        apply(name, action, *args): Calls a method of a cat under its lock.
+        eat(name, food), play(name, time), sleep(name, time), rest(name), hunt(name):
+            Shortcuts for ``apply``.
+        locked(name): Holds a cat's lock for several calls in a row.
+        sequence(name): The number of updates applied to a cat.
+        snapshot(): A consistent (energy, hunger, sequence) per cat.
+
+    Behavior Rules:
+        - Updates of one cat are linearizable: each one sees every earlier update,
+          in the order given by the cat's sequence number.
+        - Only updates made through the registry are guarded. Calling the cat's
+          methods directly bypasses the lock.
+    """
+
+    def __init__(self, cats=(), stripes=DEFAULT_STRIPES):
+        """
+        Initialize a ConcurrentRegistry.
+        Args:
+            cats (Iterable[Cat], optional): The cats to add.
+            stripes (int, optional): The number of locks. Defaults to ``DEFAULT_STRIPES``.
+        """
+        self.stripes = stripes
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._entries = {}
+        self._added = 0
+        self._lock = threading.Lock()
+        for cat in cats:
+            self.add(cat)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __iter__(self):
+        return iter(list(self._entries))
+
+    def add(self, cat):
+        """
+        Adds a cat to the registry.
+        Raises:
+            ValueError: If a cat with the same name is already registered.
+        """
+        with self._lock:
+            if cat.name in self._entries:
+                raise ValueError(f"{cat.name} is already in the registry.")
+            lock = self._locks[self._added % self.stripes]
+            self._added += 1
+            self._entries[cat.name] = _Entry(cat, lock)
+
+    def remove(self, name):
+        """
+        Removes a cat from the registry and returns it, once no update is running.
+        Raises:
+            KeyError: If no cat has this name.
+        """
+        with self._lock:
+            entry = self._entries.pop(name)
+        with entry.lock:
+            return entry.cat
+
+    def get(self, name):
+        """
+        Returns the cat with this name. Use ``locked`` to read several fields
+        consistently while other threads update it.
+        Raises:
+            KeyError: If no cat has this name.
+        """
+        return self._entries[name].cat
+
+    def apply(self, name, action, *args):
+        """
+        Calls a method of a cat while holding its lock.
+        Args:
+            name (str): The name of the cat.
+            action (str): The method, such as "eat", "play" or "hunt".
+            *args: The arguments of the method.
+        Returns:
+            The value returned by the method.
+        Raises:
+            KeyError: If no cat has this name.
+            ValueError: Whatever the method raises. A rejected call does not
+                count as an update.
+        """
+        entry = self._entries[name]
+        with entry.lock:
+            result = getattr(entry.cat, action)(*args)
+            entry.sequence += 1
+        return result
+
+    def eat(self, name, food):
+        """
+        Feeds a cat under its lock. See ``Cat.eat``.
+        """
+        return self.apply(name, "eat", food)
+
+    def play(self, name, time):
+        """
+        Lets a cat play under its lock. See ``Cat.play``.
+        """
+        return self.apply(name, "play", time)
+
+    def sleep(self, name, time):
+        """
+        Makes a cat sleep under its lock. See ``Cat.sleep``.
+        """
+        return self.apply(name, "sleep", time)
+
+    def rest(self, name):
+        """
+        Lets a wild cat rest under its lock. See ``WildCat.rest``.
+        """
+        return self.apply(name, "rest")
+
+    def hunt(self, name):
+        """
+        Makes a wild cat hunt under its lock. See ``WildCat.hunt``.
+        """
+        return self.apply(name, "hunt")
+
+    @contextmanager
+    def locked(self, name):
+        """
+        Holds a cat's lock for a block of calls, which then count as one update.
+        Example:
+            with registry.locked("Tom") as tom:
+                if tom.hunger > 50:
+                    tom.eat(20)
+        Yields:
+            Cat: The cat.
+        """
+        entry = self._entries[name]
+        with entry.lock:
+            yield entry.cat
+            entry.sequence += 1
+
+    def sequence(self, name):
+        """
+        Returns the number of updates applied to a cat through the registry.
+        """
+        return self._entries[name].sequence
+
+    def snapshot(self):
+        """
+        Returns every cat's state, each read under the cat's lock.
+        Returns:
+            dict[str, tuple[int, int, int]]: ``(energy, hunger, sequence)`` by name.
+        """
+        states = {}
+        for name, entry in list(self._entries.items()):
+            with entry.lock:
+                states[name] = (entry.cat.energy, entry.cat.hunger, entry.sequence)
+        return states
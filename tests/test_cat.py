@@ -1,5 +1,8 @@
+from types import SimpleNamespace
+
 import pytest
 from cat_manager.cat import Cat
+from cat_manager.cat import DomesticCat
 from cat_manager.cat import WildCat
 
 
@@ -141,15 +144,15 @@ def test_sleep_max_energy():
         cat.sleep(20)
 
 
-def test_wildcat_rest_increases_energy(monkeypatch):
+def test_wildcat_rest_increases_energy():
     """
     Test that the WildCat's rest method increases energy by a random amount.
     """
     cat = WildCat(name="WildTestCat", age=4, color="Brown")
     cat.energy = 0
 
-    # Mock randint to control the random energy increase
-    monkeypatch.setattr("cat_manager.cat.randint", lambda a, b: 30)
+    # Fix the random energy increase
+    cat.rng = SimpleNamespace(randint=lambda a, b: 30)
     cat.rest()
     assert cat.energy == 30
 
@@ -163,13 +166,11 @@ def test_wildcat_hunt_success(monkeypatch):
     cat.hunger = 50
 
     # Mock methods to control behavior
-    monkeypatch.setattr(cat, "determine_prey_size", lambda: "medium")
+    monkeypatch.setattr(WildCat, "determine_prey_size", lambda self: "medium")
     monkeypatch.setattr(
-        cat, "calculate_success", lambda prey_size: 100
+        WildCat, "calculate_success", lambda self, prey_size: 100
     )  # Always succeed
-    monkeypatch.setattr(
-        "cat_manager.cat.randint", lambda a, b: 30
-    )  # Fixed random values
+    cat.rng = SimpleNamespace(randint=lambda a, b: 30)  # Fixed random values
 
     cat.hunt()
     assert cat.energy == 80  # +30 energy
@@ -185,8 +186,10 @@ def test_wildcat_hunt_failure(monkeypatch):
     cat.hunger = 50
 
     # Mock methods to control behavior
-    monkeypatch.setattr(cat, "determine_prey_size", lambda: "medium")
-    monkeypatch.setattr(cat, "calculate_success", lambda prey_size: 0)  # Always fail
+    monkeypatch.setattr(WildCat, "determine_prey_size", lambda self: "medium")
+    monkeypatch.setattr(
+        WildCat, "calculate_success", lambda self, prey_size: 0
+    )  # Always fail
 
     cat.hunt()
     assert cat.energy == 40  # -10 energy
@@ -263,7 +266,7 @@ def test_wildcat_calculate_success():
     assert cat.calculate_success("large") == 40  # -10 for large prey
 
 
-def test_wildcat_process_hunt_result_success(monkeypatch):
+def test_wildcat_process_hunt_result_success():
     """
     Test the process_hunt_result method when the hunt is successful.
     """
@@ -271,8 +274,8 @@ def test_wildcat_process_hunt_result_success(monkeypatch):
     cat.energy = 50
     cat.hunger = 50
 
-    # Mock random values
-    monkeypatch.setattr("cat_manager.cat.randint", lambda a, b: 20)
+    # Fix the random values
+    cat.rng = SimpleNamespace(randint=lambda a, b: 20)
 
     cat.process_hunt_result("medium", success=True)
     assert cat.energy == 70  # +20 energy
@@ -290,3 +293,163 @@ def test_wildcat_process_hunt_result_failure():
     cat.process_hunt_result("medium", success=False)
     assert cat.energy == 40  # -10 energy
     assert cat.hunger == 50  # Hunger remains unchanged
+
+
+def test_cat_has_no_instance_dict():
+    """
+    Test that cats use slots instead of a per-instance __dict__.
+    """
+    for cat in (
+        Cat("TestCat", 3, "Gray"),
+        DomesticCat("TestCat", 3, "Gray"),
+        WildCat("WildTestCat", 4, "Brown"),
+    ):
+        assert not hasattr(cat, "__dict__")
+
+
+def test_play_rounds_half_up():
+    """
+    Test that the 1.5x and 1.2x play multipliers are rounded half up to integers.
+    """
+    cat = Cat(name="TestCat", age=3, color="Gray")
+    cat.energy = 30
+    cat.hunger = 70
+    cat.play(7)
+    assert cat.energy == 19  # 30 - round(10.5)
+    assert cat.hunger == 78  # 70 + round(8.4)
+    assert isinstance(cat.energy, int) and isinstance(cat.hunger, int)
+
+
+def test_state_is_clamped_and_rounded():
+    """
+    Test that assigned energy and hunger values are rounded and kept within 0 to 100.
+    """
+    cat = Cat(name="TestCat", age=3, color="Gray", energy=150, hunger=-5)
+    assert cat.energy == 100
+    assert cat.hunger == 0
+    cat.energy = 40.5
+    assert cat.energy == 41
+
+
+def test_wildcat_rest_does_not_exceed_max_energy():
+    """
+    Test that resting never raises the WildCat's energy above 100.
+    """
+    cat = WildCat(name="WildTestCat", age=4, color="Brown")
+    cat.energy = 90
+    cat.rng = SimpleNamespace(randint=lambda a, b: 50)
+    cat.rest()
+    assert cat.energy == 100
+
+
+def test_observers_are_notified_of_state_changes():
+    """
+    Test that watchers receive the action, the previous state and the detail.
+    """
+    cat = Cat(name="TestCat", age=3, color="Gray", energy=50, hunger=50)
+    changes = []
+    observer = lambda *change: changes.append(change)  # noqa: E731
+    cat.watch(observer)
+    cat.eat(10)
+    cat.sleep(5)
+    cat.unwatch(observer)
+    cat.play(10)
+    assert changes == [(cat, "eat", 50, 50, 10), (cat, "sleep", 60, 40, 5)]
+
+
+def test_hunt_table_matches_rules():
+    """
+    Test that the precomputed hunt table matches determine_prey_size and calculate_success.
+    """
+    table = WildCat.hunt_table()
+    cat = WildCat(name="WildTestCat", age=4, color="Brown")
+    for energy in range(0, 101, 7):
+        for hunger in range(0, 101, 3):
+            cat.energy = energy
+            cat.hunger = hunger
+            prey_size = cat.determine_prey_size()
+            index = table.index(energy, hunger)
+            assert table.prey[index] == prey_size
+            assert table.success[index] == cat.calculate_success(prey_size)
+    assert WildCat.hunt_table() is table
+
+
+def test_hunt_table_follows_subclass_rules(monkeypatch):
+    """
+    Test that subclasses and replaced rules get their own hunt table.
+    """
+
+    class Lion(WildCat):
+        __slots__ = ()
+
+        def determine_prey_size(self):
+            return "large"
+
+    assert Lion.hunt_table() is not WildCat.hunt_table()
+    assert set(Lion.hunt_table().prey) == {"large"}
+
+    table = WildCat.hunt_table()
+    monkeypatch.setattr(WildCat, "calculate_success", lambda self, prey_size: 100)
+    assert WildCat.hunt_table() is not table
+    assert set(WildCat.hunt_table().success) == {100}
+
+
+@pytest.mark.parametrize(
+    "schedule",
+    [
+        [("play", 20), ("eat", 15), ("play", 3)],
+        [("play", 7), ("sleep", 4)],
+        [("eat", 1), ("play", 13), ("play", 2)],
+    ],
+)
+def test_fast_forward_matches_loop(capfd, schedule):
+    """
+    Test that fast_forward reaches the same state as calling the methods in a loop.
+    """
+    for energy, hunger in [(50, 50), (25, 75), (100, 0), (3, 97)]:
+        for repetitions in (0, 1, 5, 37):
+            looped = Cat("Loop", 3, "Gray", energy=energy, hunger=hunger)
+            forwarded = Cat("Fast", 3, "Gray", energy=energy, hunger=hunger)
+            looped_error = forwarded_error = None
+            try:
+                for _ in range(repetitions):
+                    for action, amount in schedule:
+                        getattr(looped, action)(amount)
+            except ValueError as error:
+                looped_error = str(error)
+            try:
+                forwarded.fast_forward(schedule, repetitions)
+            except ValueError as error:
+                forwarded_error = str(error)
+            assert (forwarded.energy, forwarded.hunger, forwarded_error) == (
+                looped.energy,
+                looped.hunger,
+                looped_error,
+            )
+
+
+def test_fast_forward_raises_like_sleep():
+    """
+    Test that fast_forward raises when sleep would, leaving the state of the loop.
+    """
+    cat = Cat(name="TestCat", age=3, color="Gray", energy=90, hunger=50)
+    with pytest.raises(ValueError, match="too energetic"):
+        cat.fast_forward([("eat", 5), ("sleep", 20)], 1_000_000)
+    assert (cat.energy, cat.hunger) == (100, 40)
+
+    with pytest.raises(ValueError, match="Cannot fast-forward"):
+        cat.fast_forward([("hunt", None)], 3)
+
+
+def test_fast_forward_skips_cycles():
+    """
+    Test that a billion repetitions finish at once and notify observers once.
+    """
+    cat = Cat(name="TestCat", age=3, color="Gray", energy=50, hunger=50)
+    changes = []
+    cat.watch(lambda *change: changes.append(change))
+    schedule = [("play", 20), ("eat", 15), ("play", 3)]
+    cat.fast_forward(schedule, 1_000_000_000)
+
+    assert (cat.energy, cat.hunger) == (10, 89)
+    assert changes == [(cat, "fast_forward", 50, 50, (tuple(schedule), 1_000_000_000))]
@@ -0,0 +1,108 @@
+import json
+import subprocess
+import sys
+
+import pytest
+from cat_manager.cli import main, parse_policy
+
+
+def run(capsys, *argv):
+    main(list(argv))
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_parse_policy():
+    """
+    Test that policies parse into actions and amounts, and bad ones are rejected.
+    """
+    assert parse_policy("play:10, hunt,eat:5") == [
+        ("play", 10),
+        ("hunt", None),
+        ("eat", 5),
+    ]
+    for policy in ("bark", "eat", "eat:101", "hunt:3"):
+        with pytest.raises(ValueError):
+            parse_policy(policy)
+
+
+def test_streams_summaries(capsys):
+    """
+    Test that a summary is written every few rounds and after the last one.
+    """
+    lines = run(
+        capsys,
+        "--cats",
+        "6",
+        "--rounds",
+        "5",
+        "--every",
+        "2",
+        "--seed",
+        "1",
+        "--species",
+        "cat,wild",
+        "--energy",
+        "50",
+        "--hunger",
+        "60",
+    )
+    assert [line["round"] for line in lines] == [2, 4, 5]
+    assert all(line["cats"] == 6 for line in lines)
+    last = lines[-1]
+    assert last["hunts"]["caught"] + last["hunts"]["failed"] + last["rests"] == 15
+    assert last["energy"]["p10"] <= last["energy"]["p50"] <= last["energy"]["p90"]
+
+
+def test_engines_agree_without_hunts(capsys):
+    """
+    Test that the scalar and numpy engines give the same summaries for domestic cats.
+    """
+    pytest.importorskip("numpy")
+    options = [
+        "--cats",
+        "20",
+        "--species",
+        "domestic",
+        "--rounds",
+        "7",
+        "--energy",
+        "40",
+        "--hunger",
+        "70",
+        "--policy",
+        "play:7,eat:3,sleep:2",
+    ]
+    assert run(capsys, *options) == run(capsys, *options, "--engine", "numpy")
+
+
+def test_store_keeps_the_population(tmp_path, capsys):
+    """
+    Test that a run with a store continues from the state saved by the last run.
+    """
+    options = [
+        "--store",
+        str(tmp_path / "cats.db"),
+        "--species",
+        "domestic",
+        "--cats",
+        "4",
+        "--every",
+        "1",
+        "--policy",
+        "play:10",
+    ]
+    first = run(capsys, *options, "--rounds", "2")
+    second = run(capsys, *options, "--rounds", "1", "--engine", "numpy")
+    assert [line["energy"]["mean"] for line in first + second] == [90, 80, 70]
+
+
+def test_scalar_engine_does_not_import_numpy():
+    """
+    Test that the default engine leaves NumPy unimported, for a fast start.
+    """
+    code = (
+        "import sys; from cat_manager.cli import main; "
+        "main(['--cats', '10', '--rounds', '2']); "
+        "assert 'numpy' not in sys.modules, 'numpy was imported'"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
@@ -0,0 +1,140 @@
+import random
+
+import numpy as np
+from cat_manager import events
+from cat_manager.cat import Cat
+from cat_manager.commands import (
+    COMMAND_ABORTED,
+    COMMAND_APPLIED,
+    COMMAND_REJECTED,
+    apply_commands,
+)
+from cat_manager.population import CatPopulation
+
+
+def test_cat_batch_applies_in_order():
+    """
+    Test that a valid batch updates the cat, then emits its events and notifications.
+    """
+    cat = Cat("Tom", 3, "Gray", energy=40, hunger=50)
+    changes = []
+    cat.watch(lambda *change: changes.append(change[1]))
+    collector = events.CollectorSink()
+    with events.use_sink(collector):
+        statuses = apply_commands(cat, [("play", 20), ("play", 10), ("eat", 30)])
+
+    assert statuses == [COMMAND_APPLIED] * 3
+    assert (cat.energy, cat.hunger) == (35, 52)
+    assert collector.kinds() == ["tired_play", "hungry_play"]
+    assert changes == ["play", "play", "eat"]
+
+
+def test_cat_batch_rolls_back():
+    """
+    Test that a rejected command leaves the cat untouched and reports every status.
+    """
+    cat = Cat("Tom", 3, "Gray", energy=80, hunger=50)
+    changes = []
+    cat.watch(lambda *change: changes.append(change))
+    collector = events.CollectorSink()
+    with events.use_sink(collector):
+        statuses = apply_commands(
+            cat, [("eat", 10), ("sleep", 20), ("sleep", 5), ("play", 5)]
+        )
+        assert statuses == [
+            COMMAND_ABORTED,
+            COMMAND_ABORTED,
+            COMMAND_REJECTED,
+            COMMAND_ABORTED,
+        ]
+        assert apply_commands(cat, [("eat", 10), ("eat", 101), ("nap", 5)]) == [
+            COMMAND_ABORTED,
+            COMMAND_REJECTED,
+            COMMAND_REJECTED,
+        ]
+
+    assert (cat.energy, cat.hunger) == (80, 50)
+    assert changes == []
+    assert collector.events == []
+
+
+def test_population_batch_matches_cats():
+    """
+    Test that population commands give the same states as the cat methods.
+    """
+    rng = random.Random(5)
+    cats = [
+        Cat("Tom", 3, "Gray", energy=rng.randint(0, 99), hunger=rng.randint(0, 100))
+        for _ in range(20)
+    ]
+    commands = [
+        (rng.randrange(20), rng.choice(["eat", "play", "sleep"]), rng.randint(0, 5))
+        for _ in range(200)
+    ]
+    population = CatPopulation.from_cats(cats)
+
+    statuses = apply_commands(population, commands, per_cat=True)
+
+    failed = set()
+    with events.use_sink(events.NullSink()):
+        for position, cat in enumerate(cats):
+            start = (cat.energy, cat.hunger)
+            try:
+                for index, action, amount in commands:
+                    if index == position:
+                        getattr(cat, action)(amount)
+            except ValueError:
+                cat.energy, cat.hunger = start
+                failed.add(position)
+    assert population.energy.tolist() == [cat.energy for cat in cats]
+    assert population.hunger.tolist() == [cat.hunger for cat in cats]
+    assert (statuses == COMMAND_REJECTED).sum() == len(failed)
+
+
+def test_population_batch_is_atomic():
+    """
+    Test that a rejected command rolls back the whole batch, or only its cat.
+    """
+    population = CatPopulation(
+        ["Tom", "Mimi", "Shadow"], [3, 2, 5], ["Gray"] * 3, energy=[50, 95, 30]
+    )
+    commands = [(0, "play", 10), (1, "sleep", 10), (1, "sleep", 10), (2, "eat", 20)]
+
+    statuses = apply_commands(population, commands)
+    assert statuses.tolist() == [
+        COMMAND_ABORTED,
+        COMMAND_ABORTED,
+        COMMAND_REJECTED,
+        COMMAND_ABORTED,
+    ]
+    assert population.energy.tolist() == [50, 95, 30]
+
+    statuses = apply_commands(population, commands, per_cat=True)
+    assert statuses.tolist() == [
+        COMMAND_APPLIED,
+        COMMAND_ABORTED,
+        COMMAND_REJECTED,
+        COMMAND_APPLIED,
+    ]
+    assert population.energy.tolist() == [40, 95, 50]
+    assert population.hunger.tolist() == [10, 0, 0]
+
+    statuses = apply_commands(population, [(0, "eat", 5), (3, "eat", 5)])
+    assert statuses.tolist() == [COMMAND_ABORTED, COMMAND_REJECTED]
+    assert np.array_equal(population.energy, [40, 95, 50])
+
+
+def test_population_batch_rejects_non_numeric_amounts():
+    """
+    Test that a non-numeric amount rejects its own command instead of the call.
+    """
+    population = CatPopulation(["Tom", "Mimi"], [3, 2], ["Gray"] * 2, energy=50)
+    commands = [(0, "eat", 10), (1, "play", "ten"), (1, "eat", None)]
+
+    statuses = apply_commands(population, commands)
+    assert statuses.tolist() == [COMMAND_ABORTED, COMMAND_REJECTED, COMMAND_REJECTED]
+    assert population.energy.tolist() == [50, 50]
+
+    statuses = apply_commands(population, commands, per_cat=True)
+    assert statuses.tolist() == [COMMAND_APPLIED, COMMAND_REJECTED, COMMAND_REJECTED]
+    assert population.energy.tolist() == [60, 50]
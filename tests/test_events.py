@@ -0,0 +1,73 @@
+import io
+
+from cat_manager import events
+from cat_manager.cat import Cat
+from cat_manager.cat import DomesticCat
+from cat_manager.cat import WildCat
+
+
+def test_collector_sink_records_structured_events(monkeypatch):
+    """
+    Test that cats emit structured events into the current sink.
+    """
+    cat = WildCat(name="WildTestCat", age=4, color="Brown", energy=50, hunger=50)
+    monkeypatch.setattr(WildCat, "calculate_success", lambda self, prey_size: 100)
+    with events.use_sink(events.CollectorSink()) as sink:
+        cat.meow()
+        cat.hunt()
+
+    assert sink.kinds() == ["meow", "hunt", "hunt_caught"]
+    assert sink.events[0] == events.Event("meow", cat, 2)
+    assert sink.events[1].detail == "medium"
+
+
+def test_null_sink_prints_nothing(capfd):
+    """
+    Test that the null sink drops events without printing them.
+    """
+    cat = Cat(name="TestCat", age=3, color="Gray", energy=20, hunger=90)
+    with events.use_sink(events.NullSink()):
+        cat.meow()
+        cat.play(10)
+    out, err = capfd.readouterr()
+    assert out == ""
+
+
+def test_buffered_sink_writes_in_blocks():
+    """
+    Test that the buffered sink only writes once a block is full, or when flushed.
+    """
+    stream = io.StringIO()
+    cat = DomesticCat(name="tom", age=3, color="Gray")
+    with events.use_sink(events.BufferedSink(stream, block_size=2)):
+        cat.ask_for_affection()
+        assert stream.getvalue() == ""
+        cat.meow()
+        assert stream.getvalue().count("\n") == 2
+        cat.meow()
+    assert stream.getvalue().splitlines() == [
+        "tom rubs against your leg and purrs, asking for affection.",
+        "Purr... Meow! \U0001f63b",
+        "Purr... Meow! \U0001f63b",
+    ]
+
+
+def test_use_sink_restores_previous_sink():
+    """
+    Test that use_sink puts the previous sink back on exit.
+    """
+    previous = events.sink
+    with events.use_sink(events.NullSink()):
+        assert events.sink is not previous
+    assert events.sink is previous
+
+
+def test_format_event_matches_console_messages():
+    """
+    Test that events are formatted as the original console messages.
+    """
+    cat = WildCat(name="shadow", age=4, color="Black")
+    assert (
+        events.format_event("hunt", cat, "large") == "Shadow is hunting a large prey."
+    )
+    assert events.format_event("meow", cat, 3) == "RRAAAUUUGGHHH!! \U0001f63e"
@@ -0,0 +1,97 @@
+import io
+import random
+
+import pytest
+from cat_manager import events
+from cat_manager.cat import Cat, WildCat
+from cat_manager.history import CatHistory, state_from_checkpoints
+from cat_manager.rng import CatStream
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    with events.use_sink(events.NullSink()):
+        yield
+
+
+def simulate(cat, steps, seed, on_step=None):
+    """
+    Applies random actions to a cat and returns its state after every change.
+    """
+    chooser = random.Random(seed)
+    states = [(cat.energy, cat.hunger)]
+    cat.watch(lambda cat, *change: states.append((cat.energy, cat.hunger)))
+    actions = ["eat", "play", "sleep"]
+    if isinstance(cat, WildCat):
+        actions += ["hunt", "rest"]
+    while len(states) <= steps:
+        action = chooser.choice(actions)
+        recorded = len(states)
+        try:
+            if action in ("hunt", "rest"):
+                getattr(cat, action)()
+            else:
+                getattr(cat, action)(chooser.randint(0, 40))
+        except ValueError:
+            pass
+        if on_step is not None and len(states) > recorded:
+            on_step(len(states) - 1)
+    return states
+
+
+def test_state_at_matches_the_cat():
+    """
+    Test that every step still in the ring is rebuilt exactly, after wrapping.
+    """
+    cat = WildCat("Shadow", 5, "Black", energy=60, hunger=70)
+    cat.rng = CatStream("Shadow", seed=4)
+    history = CatHistory([cat], capacity=50, keyframe_every=8)
+    states = simulate(cat, 200, seed=2)
+
+    first, last = history.steps(cat)
+    assert last == len(states) - 1 and last - first == 50
+    for step in range(first, last + 1):
+        assert history.state_at(cat, step) == states[step]
+    with pytest.raises(ValueError):
+        history.state_at(cat, first - 1)
+
+
+def test_changes_explain_the_state():
+    """
+    Test that the recorded changes name the actions and hunt outcomes.
+    """
+    cat = WildCat("Shadow", 5, "Black", energy=50, hunger=50)
+    history = CatHistory([cat])
+    cat.eat(10)
+    cat.rng = CatStream("Shadow", seed=1)
+    cat.hunt()
+    cat.play(5)
+    changes = history.changes(cat)
+    assert [change.action for change in changes][::2] == ["eat", "play"]
+    assert changes[1].action in ("hunt_caught", "hunt_failed")
+    assert changes[0][2:] == (10, -10)
+    assert [change.step for change in history.changes(cat, since=2)] == [3]
+
+
+def test_checkpoints_are_incremental():
+    """
+    Test that checkpoints only write new changes and rebuild any saved step.
+    """
+    tom = Cat("Tom", 3, "Gray", energy=40, hunger=50)
+    history = CatHistory([tom], capacity=16, keyframe_every=4)
+    log = io.StringIO()
+    written = []
+
+    def checkpoint(step):
+        if step % 10 == 0:
+            written.append(history.checkpoint(log))
+
+    states = simulate(tom, 60, seed=3, on_step=checkpoint)
+    assert written == [10] * 6
+    assert history.checkpoint(log) == 0
+    log.seek(0)
+    for step in range(61):
+        assert state_from_checkpoints(log, "Tom", step) == states[step]
+        log.seek(0)
+    with pytest.raises(ValueError):
+        state_from_checkpoints(log, "Mimi", 1)
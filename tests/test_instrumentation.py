@@ -0,0 +1,77 @@
+from types import SimpleNamespace
+
+import pytest
+from cat_manager import events
+from cat_manager import instrumentation
+from cat_manager.cat import Cat
+from cat_manager.cat import WildCat
+
+
+@pytest.fixture
+def instrumented():
+    instrumentation.reset()
+    instrumentation.enable()
+    with events.use_sink(events.NullSink()):
+        yield instrumentation
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_leaves_methods_untouched():
+    """
+    Test that the original methods are in place while instrumentation is disabled.
+    """
+    eat = Cat.__dict__["eat"]
+    instrumentation.enable()
+    assert Cat.__dict__["eat"] is not eat
+    instrumentation.disable()
+    assert Cat.__dict__["eat"] is eat
+    assert not instrumentation.is_enabled()
+
+
+def test_enabling_keeps_the_hunt_table():
+    """
+    Test that enabling and disabling instrumentation does not rebuild hunt tables.
+    """
+    table = WildCat.hunt_table()
+    instrumentation.enable()
+    try:
+        assert WildCat.hunt_table() is table
+    finally:
+        instrumentation.disable()
+    assert WildCat.hunt_table() is table
+
+
+def test_counts_calls_and_rejections(instrumented):
+    """
+    Test that calls and ValueError rejections are counted per method.
+    """
+    cat = Cat(name="TestCat", age=3, color="Gray")
+    cat.eat(10)
+    cat.play(10)
+    with pytest.raises(ValueError):
+        cat.eat(150)
+
+    data = instrumented.snapshot()
+    assert data["calls"]["Cat.eat"] == 2
+    assert data["calls"]["Cat.play"] == 1
+    assert data["rejections"] == {"Cat.eat": 1}
+    assert sum(count for _, count in data["latency_ns"]["Cat.eat"]) == 2
+    assert instrumented.percentile_ns("Cat.eat", 50) > 0
+
+
+def test_counts_hunts_by_prey_size_and_forced_rests(instrumented):
+    """
+    Test that hunt outcomes are counted by prey size and forced rests are tracked.
+    """
+    hunter = WildCat(name="Hunter", age=4, color="Brown", energy=50, hunger=50)
+    hunter.rng = SimpleNamespace(randint=lambda a, b: a)
+    hunter.hunt()
+    exhausted = WildCat(name="Tired", age=4, color="Brown", energy=0, hunger=100)
+    exhausted.hunt()
+
+    data = instrumented.snapshot()
+    assert data["hunts"] == {"medium": {"success": 1, "failure": 0}}
+    assert data["forced_rests"] == 1
+    assert data["can_hunt_forced_rest_rate"] == 0.5
+    assert "can_hunt forced rest() on 50% of its calls" in instrumented.report()
@@ -0,0 +1,145 @@
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from cat_manager import events
+from cat_manager.cat import WildCat
+from cat_manager.markov import HuntChain
+
+
+def enumerate_hunt(energy, hunger):
+    """
+    Returns the exact distribution of one hunt, found by feeding every possible
+    sequence of random draws to a real WildCat.
+    """
+    draws = []
+    stream = SimpleNamespace(randint=lambda low, high: draws.pop(0))
+    probe = WildCat("Probe", 1, "Gray", energy=energy, hunger=hunger)
+    prey_size = probe.determine_prey_size()
+    success = probe.calculate_success(prey_size)
+    gains = range(
+        WildCat.ENERGY_GAIN[prey_size][0], WildCat.ENERGY_GAIN[prey_size][1] + 1
+    )
+    reductions = range(
+        WildCat.HUNGER_REDUCTION[prey_size][0],
+        WildCat.HUNGER_REDUCTION[prey_size][1] + 1,
+    )
+
+    distribution = np.zeros((101, 101))
+    with events.use_sink(events.NullSink()):
+        for roll in range(1, 101):
+            outcomes = [
+                [roll, gain, reduction] for gain in gains for reduction in reductions
+            ]
+            if roll > success:
+                outcomes = [[roll]]
+            for outcome in outcomes:
+                draws[:] = outcome
+                cat = WildCat("Tom", 1, "Gray", energy=energy, hunger=hunger)
+                cat.rng = stream
+                cat.hunt()
+                distribution[cat.energy, cat.hunger] += 1 / 100 / len(outcomes)
+    return distribution
+
+
+@pytest.mark.parametrize("energy, hunger", [(40, 70), (95, 5), (10, 90), (0, 100)])
+def test_one_hunt_matches_the_cat(energy, hunger):
+    """
+    Test that one step of the chain is exactly the distribution of WildCat.hunt.
+    """
+    if (energy, hunger) == (0, 100):
+        # The exhausted cat only rests, which makes a single draw.
+        expected = np.zeros((101, 101))
+        for gain in range(WildCat.REST_GAIN[0], WildCat.REST_GAIN[1] + 1):
+            expected[gain, 100] += 1 / (WildCat.REST_GAIN[1] - WildCat.REST_GAIN[0] + 1)
+    else:
+        expected = enumerate_hunt(energy, hunger)
+
+    result = HuntChain().forward(HuntChain.start(energy, hunger))
+    assert np.allclose(result, expected)
+
+
+def test_k_step_distribution():
+    """
+    Test that distributions stay normalized and compose step by step.
+    """
+    chain = HuntChain()
+    three = chain.distribution((40, 70), 3)
+    assert three.sum() == pytest.approx(1)
+    assert np.allclose(three, chain.forward(chain.distribution((40, 70), 2)))
+
+
+def test_steady_state_of_pure_hunting():
+    """
+    Test that a cat that only hunts ends up not hungry, where it stops hunting.
+    """
+    steady = HuntChain().steady_state((40, 70))
+    assert steady.sum() == pytest.approx(1)
+    assert steady[:, 0].sum() == pytest.approx(1)
+
+
+def test_expected_hunts_until_exhaustion():
+    """
+    Test expected hunts until exhaustion, which a cat that only hunts never reaches.
+    """
+    assert HuntChain().expected_hunts_until_exhaustion((40, 70)) == math.inf
+
+    chain = HuntChain(("hunt", ("play", 10)))
+    hunts = chain.expected_hunts_until_exhaustion()
+    assert hunts[0, 100] == 0
+    assert 0 < hunts[40, 70] < math.inf
+    # One period later the expectation is one less, on average.
+    assert chain.backward(hunts)[40, 70] == pytest.approx(hunts[40, 70] - 1)
+
+
+def test_deterministic_actions_use_the_cat_methods():
+    """
+    Test that eat, play and sleep follow the cat's methods, and rejected calls
+    leave the state unchanged.
+    """
+    chain = HuntChain([("play", 10), ("sleep", 10)])
+    cat = WildCat("Tom", 3, "Gray", energy=20, hunger=50)
+    with events.use_sink(events.NullSink()):
+        cat.play(10)
+        cat.sleep(10)
+    assert chain.forward(HuntChain.start(20, 50))[cat.energy, cat.hunger] == 1
+
+    assert HuntChain([("sleep", 10)]).forward(HuntChain.start(100, 30))[100, 30] == 1
+
+
+def test_subclass_rules():
+    """
+    Test that the chain analyses a subclass with its own rules.
+    """
+
+    class ClumsyCat(WildCat):
+        __slots__ = ()
+        FAILED_HUNT_COST = 25
+
+        def calculate_success(self, prey_size):
+            return 0
+
+    result = HuntChain(cat_class=ClumsyCat).forward(HuntChain.start(50, 70))
+    assert result[25, 70] == 1
+
+
+def test_transition_matrix():
+    """
+    Test that every row of the sparse transition matrix sums to one and matches
+    one step of the chain.
+    """
+    chain = HuntChain(("hunt", ("play", 10), "rest"))
+    rows, columns, chances = chain.transition_matrix()
+    row_sums = np.bincount(rows, weights=chances, minlength=101 * 101)
+    assert np.abs(row_sums - 1).max() < 1e-12
+    assert (chances > 0).all()
+    for energy, hunger in ((40, 70), (0, 100), (100, 0), (3, 98)):
+        state = energy * 101 + hunger
+        dense = np.zeros(101 * 101)
+        dense[columns[rows == state]] = chances[rows == state]
+        expected = chain.forward(HuntChain.start(energy, hunger)).ravel()
+        assert np.allclose(dense, expected, rtol=0, atol=1e-15)
+
+    rows, columns, chances = HuntChain().transition_matrix()
+    assert chances[(rows == 50 * 101) & (columns == 50 * 101)].sum() == 1
@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+from cat_manager.cat import DomesticCat
+from cat_manager.markov import HuntChain
+from cat_manager.montecarlo import estimate, stream_estimates
+
+HUNTS = ["hunt"] * 5
+
+
+def play_until_tired(cat, step):
+    """
+    A policy that plays until the cat is too tired.
+    """
+    return ("play", 10) if cat.energy > 30 else None
+
+
+def test_estimates_match_the_exact_chain():
+    """
+    Test that the estimates cover the exact means of the Markov chain.
+    """
+    result = estimate(HUNTS, energy=40, hunger=70, precision=0.5, seed=1, workers=1)
+    exact = HuntChain().distribution((40, 70), len(HUNTS))
+    levels = np.arange(101)
+
+    assert (
+        result["energy"].low <= (exact * levels[:, None]).sum() <= result["energy"].high
+    )
+    assert result["hunger"].low <= (exact * levels).sum() <= result["hunger"].high
+    assert result["energy"].high - result["energy"].low <= 1
+
+
+def test_stops_early_and_streams():
+    """
+    Test that estimates are streamed per batch and sampling stops at the precision.
+    """
+    coarse = list(
+        stream_estimates(HUNTS, energy=40, hunger=70, precision=50, seed=1, workers=1)
+    )
+    assert len(coarse) == 1
+    assert coarse[0]["energy"].samples == 1000
+
+    capped = list(
+        stream_estimates(
+            HUNTS,
+            energy=40,
+            hunger=70,
+            precision=0,
+            batch_size=100,
+            max_samples=250,
+            seed=1,
+            workers=1,
+        )
+    )
+    assert [item["hunger"].samples for item in capped] == [100, 200, 250]
+
+
+def test_same_seed_same_estimates_on_any_workers():
+    """
+    Test that the estimates only depend on the seed, not on the number of workers.
+    """
+    options = dict(energy=40, hunger=70, precision=2, batch_size=200, seed=7)
+    assert estimate(HUNTS, workers=1, **options) == estimate(
+        HUNTS, workers=2, **options
+    )
+
+
+def test_domestic_cat_with_callable_policy():
+    """
+    Test sampling a domestic cat with a deterministic callable policy.
+    """
+    result = estimate(
+        play_until_tired, DomesticCat, energy=100, hunger=0, seed=1, workers=1
+    )
+    cat = DomesticCat("Tom", 3, "Gray")
+    while (action := play_until_tired(cat, 0)) is not None:
+        cat.play(action[1])
+
+    assert result["energy"].mean == cat.energy
+    assert result["hunger"].mean == cat.hunger
+    assert result["hunt_success"].mean == 0
+
+
+def test_rejected_actions_are_skipped():
+    """
+    Test that actions rejected with ValueError are skipped.
+    """
+    result = estimate([("sleep", 10), ("eat", 10)], DomesticCat, seed=1, workers=1)
+    assert result["energy"].mean == 100
+    assert result["hunger"].mean == 0
+
+
+def test_endless_policy_stops_at_max_steps():
+    """
+    Test that a callable policy that never returns None raises after max_steps.
+    """
+
+    def eat_forever(cat, step):
+        return ("eat", 0)
+
+    with pytest.raises(RuntimeError):
+        estimate(eat_forever, DomesticCat, max_steps=50, seed=1, workers=1)
@@ -0,0 +1,82 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cat_manager.cat import Cat
+from cat_manager.parallel import ShardedSimulation
+from cat_manager.population import HUNT_SKIPPED, CatPopulation
+
+
+def make_population(count, species):
+    rng = np.random.default_rng(0)
+    return CatPopulation(
+        [f"cat{index}" for index in range(count)],
+        [3] * count,
+        ["Gray"] * count,
+        species=species,
+        energy=rng.integers(0, 101, count),
+        hunger=rng.integers(0, 101, count),
+    )
+
+
+def test_rounds_match_population_methods():
+    """
+    Test that sharded rounds of domestic cats match calling the population methods.
+    """
+    population = make_population(1000, species=1)
+    expected = make_population(1000, species=1)
+    with ShardedSimulation(population, shards=4, seed=1, workers=1) as simulation:
+        counts = simulation.run(rounds=3, food=15, play=20, sleep=5)
+
+    for _ in range(3):
+        expected.play(20)
+        expected.eat(15)
+        expected.energy[expected.energy < 100] = np.minimum(
+            expected.energy[expected.energy < 100] + 5, 100
+        )
+    assert population.energy.tolist() == expected.energy.tolist()
+    assert population.hunger.tolist() == expected.hunger.tolist()
+    assert counts[HUNT_SKIPPED] == 3000
+
+
+def test_same_seed_is_reproducible():
+    """
+    Test that the same seed gives the same results with any shard and worker count.
+    """
+    results = []
+    for shards, workers in ((4, 1), (4, 2), (3, 1)):
+        population = make_population(5000, species=[0, 1, 2] * 1666 + [2, 2])
+        with ShardedSimulation(population, shards, seed=7, workers=workers) as sim:
+            counts = sim.run(rounds=5)
+            counts += sim.run(rounds=2)
+        results.append(
+            (population.energy.tolist(), population.hunger.tolist(), counts.tolist())
+        )
+    assert results[0] == results[1] == results[2]
+
+
+def test_invalid_amount():
+    """
+    Test that run raises ValueError for amounts outside 0 to 100.
+    """
+    with ShardedSimulation(make_population(10, 2), shards=2, workers=1) as simulation:
+        with pytest.raises(ValueError):
+            simulation.run(rounds=1, food=150)
+
+
+def test_integer_food_larger_than_hunger():
+    """
+    Test that eating more than the hunger leaves it at 0, like Cat.eat, instead of
+    wrapping the uint8 column around.
+    """
+    population = CatPopulation(
+        ["Tom", "Mimi"], [3, 2], ["Gray", "White"], [0, 1], energy=40, hunger=[5, 0]
+    )
+    with ShardedSimulation(population, shards=2, seed=1, workers=1) as simulation:
+        simulation.run(rounds=1, food=30, play=0, sleep=0)
+
+    cats = [Cat("Tom", 3, "Gray", energy=40, hunger=5), Cat("Mimi", 2, "White", 40, 0)]
+    for cat in cats:
+        cat.eat(30)
+    assert population.hunger.tolist() == [cat.hunger for cat in cats] == [0, 0]
+    assert population.energy.tolist() == [cat.energy for cat in cats] == [70, 70]
@@ -0,0 +1,234 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cat_manager.cat import Cat, DomesticCat, WildCat
+from cat_manager.population import (
+    HUNT_CAUGHT,
+    HUNT_RESTED,
+    HUNT_SKIPPED,
+    PREY_SIZES,
+    SPECIES,
+    CatPopulation,
+)
+from cat_manager.rng import CatStream
+
+
+def make_cats(count, seed=7):
+    """
+    Builds a mix of cats with random energy and hunger levels.
+    """
+    rng = random.Random(seed)
+    classes = (Cat, DomesticCat, WildCat)
+    return [
+        classes[index % 3](
+            f"cat{index}",
+            rng.randint(0, 15),
+            "Gray",
+            energy=rng.randint(0, 100),
+            hunger=rng.randint(0, 100),
+        )
+        for index in range(count)
+    ]
+
+
+def assert_same_state(population, cats):
+    assert population.energy.tolist() == [cat.energy for cat in cats]
+    assert population.hunger.tolist() == [cat.hunger for cat in cats]
+
+
+def vars_of(cat):
+    return (cat.name, cat.age, cat.color, cat.energy, cat.hunger)
+
+
+def test_from_cats_round_trip():
+    """
+    Test that converting cats to a population and back keeps every attribute.
+    """
+    cats = make_cats(30)
+    restored = CatPopulation.from_cats(cats).to_cats()
+    assert [type(cat) for cat in restored] == [type(cat) for cat in cats]
+    assert [vars_of(cat) for cat in restored] == [vars_of(cat) for cat in cats]
+
+
+def test_eat_matches_scalar():
+    """
+    Test that feeding the population gives the same result as Cat.eat.
+    """
+    cats = make_cats(200)
+    population = CatPopulation.from_cats(cats)
+    food = [index % 101 for index in range(len(cats))]
+    population.eat(food)
+    for cat, amount in zip(cats, food):
+        cat.eat(amount)
+    assert_same_state(population, cats)
+
+
+def test_play_matches_scalar(capfd):
+    """
+    Test that playing applies the 1.5x tired and 1.2x hungry multipliers like Cat.play.
+    """
+    cats = make_cats(200)
+    population = CatPopulation.from_cats(cats)
+    for time in (7, 33, 15):
+        population.play(time)
+        for cat in cats:
+            cat.play(time)
+    capfd.readouterr()
+    assert_same_state(population, cats)
+
+
+def test_sleep_matches_scalar():
+    """
+    Test that sleeping the population gives the same result as Cat.sleep.
+    """
+    cats = make_cats(200)
+    for cat in cats:
+        cat.energy = min(cat.energy, 99)
+    population = CatPopulation.from_cats(cats)
+    population.sleep(25)
+    for cat in cats:
+        cat.sleep(25)
+    assert_same_state(population, cats)
+
+
+def test_meow_bands():
+    """
+    Test that meow classifies cats using the hunger thresholds of Cat.meow.
+    """
+    population = CatPopulation(
+        ["a"] * 6, [1] * 6, ["Gray"] * 6, hunger=[0, 19, 20, 50, 79, 80]
+    )
+    assert population.meow().tolist() == [0, 0, 1, 2, 2, 3]
+
+
+def test_invalid_amount_leaves_population_untouched():
+    """
+    Test that an invalid amount raises ValueError before any cat is changed.
+    """
+    population = CatPopulation.from_cats(make_cats(10))
+    energy = population.energy.copy()
+    with pytest.raises(ValueError):
+        population.eat([10] * 9 + [150])
+    with pytest.raises(ValueError):
+        population.play(-1)
+    assert population.energy.tolist() == energy.tolist()
+
+
+def test_sleep_at_full_energy():
+    """
+    Test that cats at full energy are skipped by sleep while the others sleep.
+    """
+    cats = make_cats(30)
+    for cat in cats[::3]:
+        cat.energy = 100
+    population = CatPopulation.from_cats(cats)
+    slept = population.sleep(10)
+
+    assert slept.tolist() == [cat.energy < 100 for cat in cats]
+    for cat in cats:
+        try:
+            cat.sleep(10)
+        except ValueError:
+            pass
+    assert_same_state(population, cats)
+
+
+def test_from_cats_accepts_subclasses():
+    """
+    Test that cats of subclasses are stored as the species they derive from.
+    """
+
+    class Lion(WildCat):
+        __slots__ = ()
+
+    class Tabby(Cat):
+        __slots__ = ()
+
+    population = CatPopulation.from_cats(
+        [Lion("Leo", 4, "Gold"), Tabby("Tab", 2, "Orange")]
+    )
+    assert [SPECIES[code] for code in population.species] == [WildCat, Cat]
+
+
+def test_hunt_only_wild_cats():
+    """
+    Test that hunt skips non-wild cats and wild cats that are not hungry.
+    """
+    population = CatPopulation(
+        ["a", "b", "c"], [1] * 3, ["Gray"] * 3, species=[0, 1, 2], hunger=[50, 50, 0]
+    )
+    outcome, prey = population.hunt(rng=1)
+    assert outcome.tolist() == [HUNT_SKIPPED] * 3
+    assert prey.tolist() == [-1] * 3
+    assert population.energy.tolist() == [100, 100, 100]
+
+
+def test_hunt_exhausted_cats_rest():
+    """
+    Test that exhausted and hungry wild cats rest instead of hunting.
+    """
+    population = CatPopulation(
+        ["a"] * 500, [1] * 500, ["Brown"] * 500, species=[2] * 500, energy=0, hunger=100
+    )
+    outcome, _ = population.hunt(rng=3)
+    assert (outcome == HUNT_RESTED).all()
+    assert population.energy.min() >= 30 and population.energy.max() <= 50
+    assert (population.hunger == 100).all()
+
+
+def test_hunt_is_reproducible_with_seed():
+    """
+    Test that the same seed gives the same hunting round.
+    """
+    cats = [
+        WildCat(f"w{index}", 3, "Brown", energy=60, hunger=60) for index in range(50)
+    ]
+    first = CatPopulation.from_cats(cats)
+    second = CatPopulation.from_cats(cats)
+    first.hunt(rng=11)
+    second.hunt(rng=11)
+    assert first.energy.tolist() == second.energy.tolist()
+    assert first.hunger.tolist() == second.hunger.tolist()
+
+
+def test_hunt_matches_scalar_statistically(capfd):
+    """
+    Test that the batched hunt has the same success rate and average gains as WildCat.hunt.
+    """
+    count = 20000
+    cats = [WildCat("w", 3, "Brown", energy=90, hunger=70) for _ in range(count)]
+    for index, cat in enumerate(cats):
+        cat.rng = CatStream(index, seed=5)
+        cat.hunt()
+    capfd.readouterr()
+    population = CatPopulation(
+        ["w"] * count, [3] * count, ["Brown"] * count, [2] * count, 90, 70
+    )
+    outcome, prey = population.hunt(rng=5)
+
+    assert (prey == PREY_SIZES.index("medium")).all()
+    scalar_rate = sum(cat.energy != 80 for cat in cats) / count
+    assert abs((outcome == HUNT_CAUGHT).mean() - scalar_rate) < 0.03
+    scalar_hunger = sum(cat.hunger for cat in cats) / count
+    assert abs(population.hunger.mean() - scalar_hunger) < 1
+
+
+def test_hunt_uses_custom_species_rules():
+    """
+    Test that the batched hunt uses the hunt table of a custom wild cat class.
+    """
+
+    class Lion(WildCat):
+        __slots__ = ()
+
+        def calculate_success(self, prey_size):
+            return 100
+
+    population = CatPopulation(
+        ["a"] * 100, [1] * 100, ["Gold"] * 100, species=2, energy=50, hunger=50
+    )
+    outcome, _ = population.hunt(rng=2, cat_class=Lion)
+    assert (outcome == HUNT_CAUGHT).all()
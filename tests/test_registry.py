@@ -0,0 +1,82 @@
+import pytest
+from cat_manager import events
+from cat_manager.cat import Cat
+from cat_manager.cat import DomesticCat
+from cat_manager.cat import WildCat
+from cat_manager.registry import CatRegistry
+
+
+def test_initial_indexes():
+    """
+    Test that cats are indexed by hunger band, energy band and hunt readiness.
+    """
+    tom = Cat("Tom", 3, "Gray", energy=20, hunger=90)
+    mimi = DomesticCat("Mimi", 2, "White", energy=80, hunger=10)
+    shadow = WildCat("Shadow", 5, "Black", energy=50, hunger=50)
+    full = WildCat("Full", 5, "Black", energy=50, hunger=0)
+    registry = CatRegistry([tom, mimi, shadow, full])
+
+    assert len(registry) == 4
+    assert registry.very_hungry() == {tom}
+    assert registry.too_tired_to_play() == {tom}
+    assert registry.ready_to_hunt() == {shadow}
+    assert registry.with_hunger_band(0) == {mimi, full}
+
+
+def test_indexes_follow_mutations():
+    """
+    Test that eat, play, sleep, rest and hunt keep the indexes up to date.
+    """
+    tom = Cat("Tom", 3, "Gray", energy=50, hunger=70)
+    shadow = WildCat("Shadow", 5, "Black", energy=0, hunger=100)
+    registry = CatRegistry([tom, shadow])
+    assert registry.ready_to_hunt() == set()
+
+    with events.use_sink(events.NullSink()):
+        tom.play(30)
+        assert registry.very_hungry() == {tom, shadow}
+        assert registry.too_tired_to_play() == {tom, shadow}
+        tom.eat(60)
+        tom.sleep(10)
+        shadow.hunt()  # Exhausted, so it rests instead.
+
+    assert registry.very_hungry() == {shadow}
+    assert registry.with_hunger_band(1) == {tom}
+    assert registry.too_tired_to_play() == set()
+    assert registry.ready_to_hunt() == {shadow}
+
+
+def test_refresh_after_direct_assignment():
+    """
+    Test that refresh re-indexes a cat after energy or hunger are assigned directly.
+    """
+    tom = Cat("Tom", 3, "Gray")
+    registry = CatRegistry([tom])
+    tom.hunger = 95
+    assert registry.very_hungry() == set()
+    registry.refresh(tom)
+    assert registry.very_hungry() == {tom}
+
+
+def test_remove_stops_watching():
+    """
+    Test that a removed cat is no longer indexed or watched.
+    """
+    tom = Cat("Tom", 3, "Gray", hunger=90)
+    registry = CatRegistry([tom])
+    registry.remove(tom)
+    tom.eat(5)
+    assert tom not in registry
+    assert registry.very_hungry() == set()
+    with pytest.raises(ValueError):
+        tom.unwatch(registry._on_change)
+
+
+def test_add_twice():
+    """
+    Test that adding the same cat twice raises ValueError.
+    """
+    tom = Cat("Tom", 3, "Gray")
+    registry = CatRegistry([tom])
+    with pytest.raises(ValueError):
+        registry.add(tom)
@@ -0,0 +1,117 @@
+import io
+
+from cat_manager import events
+from cat_manager.cat import Cat
+from cat_manager.cat import WildCat
+from cat_manager.replay import Record, chunked, read_csv, read_jsonl, replay
+
+
+def test_read_jsonl():
+    """
+    Test that JSON Lines logs are streamed as records.
+    """
+    log = io.StringIO(
+        '{"cat": "Tom", "action": "eat", "amount": 20}\n'
+        "\n"
+        '{"cat": "Shadow", "action": "hunt"}\n'
+    )
+    assert list(read_jsonl(log)) == [
+        Record("Tom", "eat", 20),
+        Record("Shadow", "hunt", None),
+    ]
+
+
+def test_read_csv():
+    """
+    Test that CSV logs are streamed as records and the header is skipped.
+    """
+    log = io.StringIO("cat,action,amount\nTom,play,15\nTom,sleep,7.5\nShadow,rest,\n")
+    assert list(read_csv(log)) == [
+        Record("Tom", "play", 15),
+        Record("Tom", "sleep", 7.5),
+        Record("Shadow", "rest", None),
+    ]
+
+
+def test_chunked():
+    """
+    Test that records are grouped into chunks of the requested size.
+    """
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+def test_replay_matches_calling_methods():
+    """
+    Test that replaying a log applies each cat's records in log order.
+    """
+    tom = Cat("Tom", 3, "Gray", energy=50, hunger=50)
+    mimi = Cat("Mimi", 2, "White", energy=50, hunger=50)
+    records = [
+        Record("Tom", "play", 30),
+        Record("Mimi", "eat", 10),
+        Record("Tom", "eat", 40),
+        Record("Mimi", "sleep", 20),
+    ]
+    errors = list(replay(records, {"Tom": tom, "Mimi": mimi}, chunk_size=3))
+
+    assert errors == []
+    assert (tom.energy, tom.hunger) == (60, 40)
+    assert (mimi.energy, mimi.hunger) == (80, 40)
+
+
+def test_replay_streams_errors_and_continues():
+    """
+    Test that invalid records are yielded as errors instead of stopping the replay.
+    """
+    tom = Cat("Tom", 3, "Gray", energy=50, hunger=50)
+    shadow = WildCat("Shadow", 5, "Black", energy=0, hunger=100)
+    records = [
+        Record("Tom", "eat", 150),
+        Record("Tom", "hunt", None),
+        Record("Ghost", "eat", 10),
+        Record("Tom", "dance", 10),
+        Record("Tom", "eat", 10),
+        Record("Shadow", "hunt", None),
+    ]
+    with events.use_sink(events.NullSink()):
+        errors = list(replay(records, {"Tom": tom, "Shadow": shadow}))
+
+    # Errors follow the per-cat grouping of the chunk.
+    assert [error.record for error in errors] == [
+        records[0],
+        records[1],
+        records[3],
+        records[2],
+    ]
+    assert isinstance(errors[0].error, ValueError)
+    assert (tom.energy, tom.hunger) == (60, 40)
+    assert shadow.energy >= 30
+
+
+def test_malformed_lines_do_not_stop_the_replay():
+    """
+    Test that bad JSON lines and CSV amounts become errors and good records still apply.
+    """
+    jsonl = io.StringIO(
+        '{"cat": "Tom", "action": "eat", "amount": 10}\n'
+        "{not json\n"
+        "[1, 2]\n"
+        '{"action": "eat"}\n'
+        '{"cat": "Tom", "action": "play", "amount": 20}\n'
+    )
+    tom = Cat("Tom", 3, "Gray", energy=50, hunger=50)
+    with events.use_sink(events.NullSink()):
+        errors = list(replay(read_jsonl(jsonl), {"Tom": tom}, chunk_size=2))
+    assert [error.record.strip() for error in errors] == [
+        "{not json",
+        "[1, 2]",
+        '{"action": "eat"}',
+    ]
+    assert (tom.energy, tom.hunger) == (40, 60)
+
+    rows = io.StringIO("Tom,eat,ten\nTom,eat,10\n")
+    tom = Cat("Tom", 3, "Gray", energy=50, hunger=50)
+    errors = list(replay(read_csv(rows), {"Tom": tom}))
+    assert [error.record for error in errors] == [["Tom", "eat", "ten"]]
+    assert isinstance(errors[0].error, ValueError)
+    assert (tom.energy, tom.hunger) == (60, 40)
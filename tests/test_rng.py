@@ -0,0 +1,92 @@
+import pytest
+from cat_manager import events, rng
+from cat_manager.cat import WildCat
+from cat_manager.rng import CatStream
+
+np = pytest.importorskip("numpy")
+
+from cat_manager.population import CatPopulation, StreamBank
+
+
+def test_stream_replay():
+    """
+    Test that a stream recreated at a counter replays the same draws.
+    """
+    stream = CatStream("Shadow", seed=3)
+    draws = [stream.randint(1, 100) for _ in range(50)]
+    assert all(1 <= draw <= 100 for draw in draws)
+    assert stream.counter == 50
+    replay = CatStream("Shadow", seed=3, counter=20)
+    assert [replay.randint(1, 100) for _ in range(30)] == draws[20:]
+    assert CatStream("Tom", seed=3).random_raw() != CatStream("Shadow", 3).random_raw()
+
+
+def test_cats_draw_from_their_own_streams():
+    """
+    Test that a wild cat's hunts only depend on the global seed and the order the
+    cats were created in.
+    """
+
+    def hunt_twice(name, other_hunts):
+        cat = WildCat(name, 5, "Black", energy=60, hunger=70)
+        other = WildCat("Other", 5, "Black", energy=60, hunger=70)
+        for _ in range(other_hunts):
+            other.hunt()
+        for _ in range(2):
+            cat.hunt()
+        return cat.energy, cat.hunger, cat.rng.counter
+
+    rng.seed(11)
+    with events.use_sink(events.NullSink()):
+        first = hunt_twice("Shadow", 0)
+        rng.seed(11)
+        assert hunt_twice("Shadow", 5) == first
+    rng.seed()
+
+
+def test_cats_with_the_same_name_draw_different_numbers():
+    """
+    Test that streams are keyed by stream id, not by name.
+    """
+    rng.seed(11)
+    first, second = (WildCat("Tom", 3, "Gray") for _ in range(2))
+    assert [first.rng.randint(1, 100) for _ in range(10)] != [
+        second.rng.randint(1, 100) for _ in range(10)
+    ]
+    twin = WildCat("Felix", 3, "Gray", stream_id="Tom")
+    assert twin.rng.random_raw() == CatStream("Tom").random_raw()
+    rng.seed()
+
+
+def test_bank_matches_streams():
+    """
+    Test that bulk draws are the draws of the cats' own streams.
+    """
+    bank = StreamBank(["Tom", "Shadow", 7], seed=5)
+    first = bank.random_raw(3)
+    second = bank.select([False, True, True]).random_raw(2)
+    assert bank.counters.tolist() == [1, 2, 2]
+    for cat_id, draws in (("Tom", first[:1]), ("Shadow", [first[1], second[0]])):
+        stream = CatStream(cat_id, seed=5)
+        assert [stream.random_raw() for _ in draws] == [int(d) for d in draws]
+    with pytest.raises(ValueError):
+        bank.random_raw(2)
+
+
+def test_population_hunt_with_streams():
+    """
+    Test that hunting with a StreamBank does not depend on how cats are batched.
+    """
+    levels = dict(energy=[60, 30, 90, 10], hunger=[70, 90, 20, 50])
+    names, ages, colors = ["a", "b", "c", "d"], [1] * 4, ["Gray"] * 4
+    whole = CatPopulation(names, ages, colors, [2] * 4, **levels)
+    outcome, _ = whole.hunt(StreamBank(range(4), seed=9))
+
+    bank = StreamBank(range(4), seed=9)
+    mixed = CatPopulation(names, ages, colors, [2, 0, 2, 2], **levels)
+    mixed_outcome, _ = mixed.hunt(bank)
+    assert bank.counters.tolist() == [1, 0, 1, 1]
+    for position in (0, 2, 3):
+        assert mixed_outcome[position] == outcome[position]
+        assert mixed.energy[position] == whole.energy[position]
+        assert mixed.hunger[position] == whole.hunger[position]
@@ -0,0 +1,93 @@
+import pytest
+from cat_manager.cat import Cat
+from cat_manager.scheduler import Scheduler
+
+
+def test_timed_activity_applies_when_it_ends():
+    """
+    Test that sleep takes effect only once its duration has passed.
+    """
+    cat = Cat(name="TestCat", age=3, color="Gray", energy=50)
+    scheduler = Scheduler()
+    scheduler.schedule(cat, "sleep", 30)
+
+    assert scheduler.advance(29) == []
+    assert cat.energy == 50
+    done = scheduler.advance(1)
+    assert [activity.action for activity in done] == ["sleep"]
+    assert cat.energy == 80
+    assert scheduler.now == 30
+
+
+def test_activities_of_one_cat_run_back_to_back():
+    """
+    Test that a cat's activities queue one after another.
+    """
+    cat = Cat(name="TestCat", age=3, color="Gray", energy=50, hunger=50)
+    scheduler = Scheduler()
+    play = scheduler.schedule(cat, "play", 20)
+    eat = scheduler.schedule(cat, "eat", 10)
+    sleep = scheduler.schedule(cat, "sleep", 15)
+
+    assert (play.start, play.end) == (0, 20)
+    assert (eat.start, eat.end) == (20, 20)
+    assert (sleep.start, sleep.end) == (20, 35)
+    scheduler.run_until(1000)
+    assert cat.energy == 55
+    assert cat.hunger == 60
+    assert scheduler.now == 1000
+    assert len(scheduler) == 0
+
+
+def test_large_jump_only_touches_due_cats():
+    """
+    Test that advancing the clock applies due activities in time order and leaves
+    the others queued.
+    """
+    cats = [Cat(f"cat{index}", 3, "Gray", energy=10) for index in range(3)]
+    scheduler = Scheduler()
+    for minutes, cat in zip((40, 10, 90), cats):
+        scheduler.schedule(cat, "sleep", minutes)
+
+    done = scheduler.advance(60)
+    assert [activity.cat for activity in done] == [cats[1], cats[0]]
+    assert [cat.energy for cat in cats] == [50, 20, 10]
+    assert scheduler.next_time() == 90
+
+
+def test_errors_are_recorded():
+    """
+    Test that a ValueError from an activity is recorded instead of stopping the run.
+    """
+    cat = Cat(name="TestCat", age=3, color="Gray")
+    scheduler = Scheduler()
+    failed = scheduler.schedule(cat, "sleep", 10)
+    scheduler.schedule(cat, "play", 10)
+    scheduler.advance(100)
+
+    assert scheduler.errors == [failed]
+    assert isinstance(failed.error, ValueError)
+    assert cat.energy == 90
+
+
+def test_schedule_in_the_past():
+    """
+    Test that scheduling before the current minute raises ValueError.
+    """
+    scheduler = Scheduler(start=100)
+    with pytest.raises(ValueError):
+        scheduler.schedule(Cat("TestCat", 3, "Gray"), "eat", 10, start=50)
+
+
+@pytest.mark.parametrize("amount", [None, -5, "10"])
+def test_timed_activity_needs_a_duration(amount):
+    """
+    Test that play and sleep without a non-negative duration are rejected up front.
+    """
+    scheduler = Scheduler()
+    cat = Cat("TestCat", 3, "Gray")
+    with pytest.raises(ValueError):
+        scheduler.schedule(cat, "play", amount)
+    assert len(scheduler) == 0
+    scheduler.schedule(cat, "play", 0)
+    assert scheduler.next_time() == 0
@@ -0,0 +1,221 @@
+import asyncio
+import json
+
+import pytest
+from cat_manager import events
+from cat_manager.cat import Cat, WildCat
+from cat_manager.service import CatService
+
+
+def make_service(**options):
+    return CatService.from_cats(
+        [
+            Cat("Tom", 3, "Gray", energy=40, hunger=50),
+            Cat("Mimi", 2, "White", energy=95, hunger=10),
+            WildCat("Shadow", 5, "Black", energy=60, hunger=70),
+        ],
+        **options,
+    )
+
+
+def test_requests_are_coalesced_into_one_flush(monkeypatch):
+    """
+    Test that concurrent requests are applied in one flush, in order per cat.
+    """
+    service = make_service()
+    flushes = []
+    flush = service.flush
+    monkeypatch.setattr(service, "flush", lambda: flushes.append(1) or flush())
+
+    async def burst():
+        return await asyncio.gather(
+            service.play("Tom", 20),
+            service.sleep("Mimi", 10),
+            service.play("Tom", 10),
+            service.feed("Tom", 30),
+            service.status("Mimi"),
+        )
+
+    results = asyncio.run(burst())
+
+    tom = Cat("Tom", 3, "Gray", energy=40, hunger=50)
+    states = []
+    with events.use_sink(events.NullSink()):
+        for minutes in (20, 10):
+            tom.play(minutes)
+            states.append({"name": "Tom", "energy": tom.energy, "hunger": tom.hunger})
+        tom.eat(30)
+    assert results[0] == states[0]
+    assert results[2] == states[1]
+    assert results[3] == {"name": "Tom", "energy": tom.energy, "hunger": tom.hunger}
+    assert results[1] == results[4] == {"name": "Mimi", "energy": 100, "hunger": 10}
+    assert len(flushes) == 1
+
+
+def test_rejected_requests_do_not_affect_others():
+    """
+    Test that an invalid or too energetic request fails alone.
+    """
+    service = make_service()
+
+    async def burst():
+        return await asyncio.gather(
+            service.sleep("Mimi", 10),
+            service.sleep("Mimi", 10),
+            service.feed("Mimi", 5),
+            return_exceptions=True,
+        )
+
+    first, second, third = asyncio.run(burst())
+    assert first["energy"] == 100
+    assert isinstance(second, ValueError)
+    assert third == {"name": "Mimi", "energy": 100, "hunger": 5}
+
+    with pytest.raises(ValueError):
+        asyncio.run(service.feed("Mimi", 101))
+    with pytest.raises(ValueError):
+        asyncio.run(service.hunt("Tom"))
+    with pytest.raises(KeyError):
+        asyncio.run(service.status("Nobody"))
+
+
+def test_hunt():
+    """
+    Test that hunts report their outcome and the new state.
+    """
+    service = make_service(seed=1)
+    result = asyncio.run(service.hunt("Shadow"))
+    assert result["outcome"] in ("failed", "caught")
+    assert asyncio.run(service.status("Shadow")) == {
+        key: result[key] for key in ("name", "energy", "hunger")
+    }
+
+
+def test_hunts_do_not_depend_on_batching():
+    """
+    Test that a cat's hunts depend on its own stream, not on the other requests
+    of its batches, and follow the rules of its own class.
+    """
+
+    class Lion(WildCat):
+        __slots__ = ()
+
+        def calculate_success(self, prey_size):
+            return 100
+
+    def cats():
+        return [
+            WildCat("Shadow", 5, "Black", energy=60, hunger=70),
+            WildCat("Luna", 4, "Gray", energy=50, hunger=90),
+            Lion("Leo", 6, "Gold", energy=80, hunger=60),
+        ]
+
+    async def hunts(service, names):
+        results = []
+        for _ in range(3):
+            batch = await asyncio.gather(*(service.hunt(name) for name in names))
+            results.append(batch[0])
+        return results
+
+    alone = asyncio.run(hunts(CatService.from_cats(cats(), seed=3), ["Shadow"]))
+    together = asyncio.run(
+        hunts(CatService.from_cats(cats(), seed=3), ["Shadow", "Luna", "Leo"])
+    )
+    assert alone == together
+    lion = asyncio.run(hunts(CatService.from_cats(cats(), seed=3), ["Leo"]))
+    outcomes = [result["outcome"] for result in lion]
+    assert outcomes[0] == "caught" and "failed" not in outcomes
+
+
+def test_failed_flush_resolves_every_request(monkeypatch):
+    """
+    Test that an error while applying a batch fails all its requests and leaves
+    the cats unchanged.
+    """
+    service = make_service(seed=1)
+
+    def broken(*args):
+        raise RuntimeError("kernel failed")
+
+    monkeypatch.setattr("cat_manager.service.hunt_round", broken)
+
+    async def burst():
+        return await asyncio.gather(
+            service.feed("Tom", 10),
+            service.hunt("Shadow"),
+            return_exceptions=True,
+        )
+
+    results = asyncio.run(burst())
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert service.population.energy.tolist() == [40, 95, 60]
+    assert service.population.hunger.tolist() == [50, 10, 70]
+
+
+def test_socket_server():
+    """
+    Test JSON Lines requests over a local TCP connection.
+    """
+    service = make_service()
+
+    async def session():
+        server = await service.start_server()
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for request in (
+            {"id": 1, "op": "feed", "cat": "Tom", "amount": 10},
+            {"id": 2, "op": "status", "cat": "Tom"},
+            {"id": 3, "op": "feed", "cat": "Nobody", "amount": 10},
+            {"id": 4, "op": "bark", "cat": "Tom"},
+        ):
+            writer.write((json.dumps(request) + "\n").encode())
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(4)]
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return {response["id"]: response for response in responses}
+
+    responses = asyncio.run(session())
+    assert responses[1]["result"] == {"name": "Tom", "energy": 50, "hunger": 40}
+    assert responses[2]["result"] == responses[1]["result"]
+    assert responses[3] == {"id": 3, "ok": False, "error": "Unknown cat: Nobody."}
+    assert responses[4]["ok"] is False
+
+
+def test_malformed_requests_get_error_responses():
+    """
+    Test that requests with a bad shape are answered with an error, and the
+    connection keeps serving the requests after them.
+    """
+    service = make_service()
+
+    async def session():
+        server = await service.start_server()
+        port = server.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        for line in (
+            json.dumps({"id": 1, "op": "feed", "cat": "Tom"}),
+            "[1]",
+            '"x"',
+            "{not json",
+            json.dumps({"id": 5, "op": "play", "cat": "Tom", "amount": "ten"}),
+            json.dumps({"id": 6, "op": "status", "cat": "Tom"}),
+        ):
+            writer.write((line + "\n").encode())
+        await writer.drain()
+        responses = [json.loads(await reader.readline()) for _ in range(6)]
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return responses
+
+    responses = asyncio.run(session())
+    errors = [response for response in responses if not response["ok"]]
+    assert len(errors) == 5
+    missing = {"id": 1, "ok": False, "error": "Missing key in feed request: amount."}
+    assert missing in errors
+    assert sum(response["id"] is None for response in errors) == 3
+    assert not any("Unknown cat" in response["error"] for response in errors)
+    (status,) = [response for response in responses if response["ok"]]
+    assert status["result"] == {"name": "Tom", "energy": 40, "hunger": 50}
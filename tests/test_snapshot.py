@@ -0,0 +1,111 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from cat_manager.cat import Cat, DomesticCat, WildCat
+from cat_manager.population import CatPopulation
+from cat_manager.snapshot import COLUMNS, HEADER, load_snapshot, save_snapshot
+
+
+def make_cats():
+    return [
+        Cat("Tom", 3, "Gray", energy=80, hunger=10),
+        DomesticCat("Mimi", 1, "White", energy=25, hunger=90),
+        WildCat("Shadow", 5, "Black", energy=20, hunger=85),
+        WildCat("Zoë", 7, "Gray", energy=60, hunger=40),
+    ]
+
+
+def test_save_and_load_round_trip(tmp_path):
+    """
+    Test that a snapshot restores every attribute and class of every cat.
+    """
+    path = tmp_path / "cats.snap"
+    cats = make_cats()
+    save_snapshot(path, cats)
+    snapshot = load_snapshot(path)
+
+    assert len(snapshot) == 4
+    assert snapshot.name(3) == "Zoë"
+    for cat, loaded in zip(cats, (snapshot[index] for index in range(4))):
+        assert type(loaded) is type(cat)
+        assert (loaded.name, loaded.age, loaded.color) == (cat.name, cat.age, cat.color)
+        assert (loaded.energy, loaded.hunger) == (cat.energy, cat.hunger)
+
+
+def test_columns_are_memory_mapped(tmp_path):
+    """
+    Test that columns are read from the file without being copied.
+    """
+    path = tmp_path / "cats.snap"
+    save_snapshot(path, make_cats())
+    snapshot = load_snapshot(path)
+    assert isinstance(snapshot.energy, np.memmap)
+    assert snapshot.energy.tolist() == [80, 25, 20, 60]
+
+
+def test_columns_are_little_endian(tmp_path):
+    """
+    Test that multi-byte columns are written and read little-endian on any host.
+    """
+    path = tmp_path / "cats.snap"
+    save_snapshot(path, [Cat("Old Tom", 0x1234, "Gray")])
+    data = path.read_bytes()
+    directory = HEADER.unpack(data[: HEADER.size])[4:]
+    index = [column for column, _ in COLUMNS].index("age")
+    offset = directory[2 * index]
+    assert data[offset : offset + 2] == b"\x34\x12"
+    snapshot = load_snapshot(path)
+    assert snapshot.age.dtype == np.dtype("<u2") and snapshot.age[0] == 0x1234
+    assert snapshot.name(0) == "Old Tom"
+
+
+def test_range_queries(tmp_path):
+    """
+    Test that range queries run on the mapped columns.
+    """
+    path = tmp_path / "cats.snap"
+    save_snapshot(path, make_cats())
+    snapshot = load_snapshot(path)
+
+    assert snapshot.where(hunger=(80, 100)).tolist() == [1, 2]
+    assert snapshot.where(species=WildCat, energy=(0, 30)).tolist() == [2]
+    assert snapshot.where(color="Gray").tolist() == [0, 3]
+    assert snapshot.where(color="Purple").tolist() == []
+    with pytest.raises(ValueError):
+        snapshot.where(name=(0, 1))
+
+
+def test_to_population(tmp_path):
+    """
+    Test that a snapshot can be copied back into a CatPopulation.
+    """
+    path = tmp_path / "cats.snap"
+    population = CatPopulation.from_cats(make_cats())
+    save_snapshot(path, population)
+    restored = load_snapshot(path).to_population()
+    assert restored.names == population.names
+    assert restored.colors == population.colors
+    assert restored.species.tolist() == population.species.tolist()
+    assert restored.hunger.tolist() == population.hunger.tolist()
+
+
+def test_empty_population(tmp_path):
+    """
+    Test that an empty population can be saved and loaded.
+    """
+    path = tmp_path / "empty.snap"
+    save_snapshot(path, [])
+    snapshot = load_snapshot(path)
+    assert len(snapshot) == 0
+    assert len(snapshot.to_population()) == 0
+
+
+def test_not_a_snapshot(tmp_path):
+    """
+    Test that loading a file that is not a snapshot raises ValueError.
+    """
+    path = tmp_path / "cats.pickle"
+    path.write_bytes(b"not a snapshot")
+    with pytest.raises(ValueError):
+        load_snapshot(path)
@@ -0,0 +1,101 @@
+from types import SimpleNamespace
+
+import pytest
+from cat_manager import events
+from cat_manager.cat import Cat, WildCat
+from cat_manager.registry import CatRegistry
+from cat_manager.stats import PopulationStats
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    with events.use_sink(events.NullSink()):
+        yield
+
+
+def brute_force(cats, metric, percent):
+    levels = sorted(getattr(cat, metric) for cat in cats)
+    rank = max(1, -(-percent * len(levels) // 100))
+    return levels[rank - 1]
+
+
+def test_aggregates_follow_changes():
+    """
+    Test that means, histograms and percentiles match the cats after updates.
+    """
+    cats = [
+        Cat(f"Cat{index}", 3, "Gray", energy=index * 9, hunger=index * 7)
+        for index in range(12)
+    ]
+    stats = PopulationStats(CatRegistry(cats))
+    for index, cat in enumerate(cats):
+        cat.play(index * 3)
+        if index % 3:
+            cat.eat(index * 5)
+    cats[5].fast_forward([("play", 10), ("eat", 5)], 7)
+
+    for metric in ("energy", "hunger"):
+        levels = [getattr(cat, metric) for cat in cats]
+        assert stats.mean(metric) == sum(levels) / len(levels)
+        assert stats.histogram(metric) == [levels.count(level) for level in range(101)]
+        for percent in (0, 10, 50, 90, 99, 100):
+            assert stats.percentile(metric, percent) == brute_force(
+                cats, metric, percent
+            )
+
+
+def test_add_remove_and_refresh():
+    """
+    Test that removed cats stop counting and refreshed cats are re-read.
+    """
+    tom = Cat("Tom", 3, "Gray", energy=40, hunger=50)
+    mimi = Cat("Mimi", 2, "White", energy=80, hunger=10)
+    stats = PopulationStats([tom, mimi])
+    with pytest.raises(ValueError):
+        stats.add(tom)
+    tom.energy = 60
+    stats.refresh(tom)
+    assert stats.mean("energy") == 70
+    stats.remove(mimi)
+    mimi.eat(10)
+    assert len(stats) == 1 and stats.mean("hunger") == 50
+    stats.remove(tom)
+    with pytest.raises(ValueError):
+        stats.percentile("energy", 50)
+
+
+def test_hunt_counters():
+    """
+    Test that hunts are counted by prey size, and forced rests are counted.
+    """
+    hunter = WildCat("Hunter", 4, "Brown", energy=50, hunger=50)
+    tired = WildCat("Tired", 4, "Brown", energy=0, hunger=100)
+    stats = PopulationStats([hunter, tired])
+    hunter.rng = SimpleNamespace(randint=lambda low, high: low)
+    hunter.hunt()
+    hunter.rng = SimpleNamespace(randint=lambda low, high: high)
+    hunter.hunt()
+    tired.rng = SimpleNamespace(randint=lambda low, high: low)
+    tired.hunt()
+
+    assert stats.hunts("medium") == (2, 1)
+    assert stats.success_rate("medium") == 0.5
+    assert stats.success_rate("large") is None
+
+    class Tiger(WildCat):
+        __slots__ = ()
+
+        def determine_prey_size(self):
+            return "huge"
+
+        def calculate_success(self, prey_size):
+            return 0
+
+    tiger = Tiger("Tiger", 6, "Orange", energy=80, hunger=90)
+    stats.add(tiger)
+    tiger.hunt()
+    assert stats.hunts("huge") == (1, 0)
+    assert stats.hunts("tiny") == (0, 0)
+    assert stats.success_rate("tiny") is None
+    assert stats.rests == 1
+    assert stats.histogram("energy")[tired.energy] == 1
@@ -0,0 +1,136 @@
+import sqlite3
+
+import pytest
+from cat_manager import events
+from cat_manager.cat import Cat, DomesticCat, WildCat
+from cat_manager.store import CatStore
+
+
+@pytest.fixture(autouse=True)
+def quiet():
+    with events.use_sink(events.NullSink()):
+        yield
+
+
+def test_round_trip(tmp_path):
+    """
+    Test that cats keep their class and state across store sessions.
+    """
+    path = tmp_path / "cats.db"
+    with CatStore(path) as store:
+        store.add(Cat("Tom", 3, "Gray", energy=40, hunger=50))
+        store.add(DomesticCat("Mimi", 2, "White"))
+        store.add(WildCat("Shadow", 5, "Black", energy=60, hunger=70))
+        store.get("Tom").eat(30)
+        with pytest.raises(ValueError):
+            store.add(Cat("Tom", 4, "Black"))
+
+    with CatStore(path) as store:
+        assert len(store) == 3 and "Mimi" in store and "Felix" not in store
+        tom = store.get("Tom")
+        assert (type(tom), tom.age, tom.color, tom.energy, tom.hunger) == (
+            Cat,
+            3,
+            "Gray",
+            70,
+            20,
+        )
+        assert type(store.get("Shadow")) is WildCat
+        store.remove("Mimi")
+        with pytest.raises(KeyError):
+            store.get("Mimi")
+
+
+def test_wild_cats_continue_their_streams(tmp_path):
+    """
+    Test that a reloaded wild cat continues its random stream instead of repeating it.
+    """
+    path = tmp_path / "cats.db"
+    shadow = WildCat("Shadow", 5, "Black", energy=60, hunger=70)
+    with CatStore(path) as store:
+        store.add(shadow)
+        for _ in range(3):
+            shadow.hunt()
+
+    with CatStore(path) as store:
+        reloaded = store.get("Shadow")
+        assert reloaded.rng.counter == shadow.rng.counter >= 3
+        assert reloaded.rng.random_raw() == shadow.rng.random_raw()
+
+
+def test_databases_without_stream_columns_are_migrated(tmp_path):
+    """
+    Test that a database created before streams were saved opens and keeps working.
+    """
+    path = tmp_path / "cats.db"
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE cats (name TEXT PRIMARY KEY, species TEXT NOT NULL, "
+        "age INTEGER NOT NULL, color TEXT NOT NULL, energy INTEGER NOT NULL, "
+        "hunger INTEGER NOT NULL)"
+    )
+    connection.execute(
+        "INSERT INTO cats VALUES ('Shadow', 'WildCat', 5, 'Black', 60, 70)"
+    )
+    connection.commit()
+    connection.close()
+
+    with CatStore(path) as store:
+        shadow = store.get("Shadow")
+        assert (shadow.energy, shadow.hunger) == (60, 70)
+        shadow.hunt()
+    with CatStore(path) as store:
+        assert store.get("Shadow").rng.counter == shadow.rng.counter
+
+
+def test_only_dirty_cats_are_written():
+    """
+    Test that flushes write back only the cats changed since the last flush.
+    """
+    store = CatStore()
+    for index in range(10):
+        store.add(Cat(f"Cat{index}", 3, "Gray", energy=50, hunger=50))
+    written = store.stats()["rows_written"]
+
+    store.get("Cat1").play(10)
+    store.get("Cat2").eat(10)
+    store.get("Cat1").sleep(10)
+    store.get("Cat3")
+    store.flush()
+    assert store.stats()["rows_written"] == written + 2
+    store.flush()
+    assert store.stats()["rows_written"] == written + 2
+
+
+def test_lru_eviction_writes_back_dirty_cats():
+    """
+    Test that the cache stays bounded and evicted cats keep their changes.
+    """
+    store = CatStore(capacity=2)
+    store.add(Cat("Tom", 3, "Gray", energy=40, hunger=50))
+    store.add(Cat("Mimi", 2, "White", energy=40, hunger=50))
+    store.get("Tom").eat(10)
+    store.get("Mimi")
+    store.add(Cat("Felix", 4, "Black"))
+
+    stats = store.stats()
+    assert (stats["cached"], stats["evictions"], stats["dirty"]) == (2, 1, 0)
+    tom = store.get("Tom")
+    assert (tom.energy, tom.hunger) == (50, 40)
+    stats = store.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 1, 2)
+    assert "Mimi" in store
+
+
+def test_write_batch_triggers_flush():
+    """
+    Test that reaching write_batch dirty cats writes them back in one go.
+    """
+    store = CatStore(write_batch=3)
+    for index in range(3):
+        store.add(Cat(f"Cat{index}", 3, "Gray", energy=50, hunger=50))
+    for index in range(2):
+        store.get(f"Cat{index}").play(10)
+    assert store.stats()["dirty"] == 2
+    store.get("Cat2").play(10)
+    assert store.stats()["dirty"] == 0
@@ -0,0 +1,49 @@
+import json
+
+from benchmarks.suite import compare, main
+
+
+def result(ops_per_sec, alloc_bytes):
+    return {"ops_per_sec": ops_per_sec, "alloc_bytes": alloc_bytes, "alloc_blocks": 0}
+
+
+def test_compare_flags_slower_and_larger_scenarios():
+    """
+    Test that only scenarios slower or allocating more than the tolerance allows
+    are reported.
+    """
+    baseline = {
+        "fast": result(1000, 10_000),
+        "slow": result(1000, 10_000),
+        "heavy": result(1000, 10_000),
+        "removed": result(1000, 10_000),
+    }
+    results = {
+        "fast": result(800, 14_000),
+        "slow": result(700, 10_000),
+        "heavy": result(1000, 20_000),
+        "new": result(1, 1_000_000),
+    }
+    regressions = compare(results, baseline, 0.25)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("slow: 700 ops/sec")
+    assert regressions[1].startswith("heavy: allocates 20,000 bytes")
+    assert compare(results, baseline, 1) == []
+
+
+def test_save_and_compare_exit_status(tmp_path, capsys):
+    """
+    Test that a saved baseline compares clean, and a regression exits with status 1.
+    """
+    options = ["--only", "Cat.eat", "--scales", "", "--repeat", "1"]
+    saved = tmp_path / "baseline.json"
+    assert main(options + ["--save", str(saved)]) == 0
+    scenarios = json.loads(saved.read_text())["scenarios"]
+    assert list(scenarios) == ["Cat.eat"]
+    assert main(options + ["--compare", str(saved), "--tolerance", "10"]) == 0
+
+    scenarios["Cat.eat"]["ops_per_sec"] *= 1000
+    faster = tmp_path / "faster.json"
+    faster.write_text(json.dumps({"scenarios": scenarios}))
+    assert main(options + ["--compare", str(faster)]) == 1
+    assert "REGRESSION Cat.eat" in capsys.readouterr().err
@@ -0,0 +1,73 @@
+import sys
+import threading
+
+import pytest
+from cat_manager import events
+from cat_manager.cat import Cat, WildCat
+from cat_manager.threadsafe import ConcurrentRegistry
+
+
+@pytest.fixture
+def frequent_switches():
+    """
+    Makes threads switch as often as possible, to expose races.
+    """
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_concurrent_updates_are_not_lost(frequent_switches):
+    """
+    Test that eat calls from many threads on the same cats all take effect.
+    """
+    cats = [Cat(f"Cat{index}", 3, "Gray", energy=0, hunger=100) for index in range(4)]
+    registry = ConcurrentRegistry(cats, stripes=2)
+
+    def feed():
+        for _ in range(25):
+            for cat in cats:
+                registry.eat(cat.name, 1)
+
+    threads = [threading.Thread(target=feed) for _ in range(4)]
+    with events.use_sink(events.NullSink()):
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert registry.snapshot() == {cat.name: (100, 0, 100) for cat in cats}
+
+
+def test_sequence_numbers():
+    """
+    Test that successful updates are numbered and rejected ones are not.
+    """
+    registry = ConcurrentRegistry([WildCat("Shadow", 5, "Black", energy=100)])
+    with events.use_sink(events.NullSink()):
+        registry.play("Shadow", 10)
+        with pytest.raises(ValueError):
+            registry.eat("Shadow", 101)
+        with registry.locked("Shadow") as shadow:
+            shadow.eat(5)
+            shadow.sleep(5)
+        registry.rest("Shadow")
+
+    assert registry.sequence("Shadow") == 3
+    assert registry.get("Shadow").energy == 100
+
+
+def test_add_and_remove():
+    """
+    Test adding, looking up and removing cats by name.
+    """
+    tom = Cat("Tom", 3, "Gray")
+    registry = ConcurrentRegistry([tom])
+    with pytest.raises(ValueError):
+        registry.add(Cat("Tom", 4, "Black"))
+    assert "Tom" in registry and len(registry) == 1
+    assert registry.remove("Tom") is tom
+    assert list(registry) == []
+    with pytest.raises(KeyError):
+        registry.eat("Tom", 10)